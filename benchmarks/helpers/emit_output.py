@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import sys
+
+"""
+    Writes a fixed amount of synthetic output to stdout for subprocess benchmarks.
+
+    Usage:
+        emit_output.py <mode> <total bytes>
+
+    Modes:
+        lines: short (16 byte) lines.
+        large: long (1 KiB) lines.
+        binary: 7-bit binary-ish data with a newline every 64 KiB.
+"""
+
+_LINE_LENGTHS = {"lines": 16, "large": 1024, "binary": 64 * 1024}
+
+
+def run():
+    mode, total_bytes = sys.argv[1], int(sys.argv[2])
+    line_length = _LINE_LENGTHS[mode]
+
+    if mode == "binary":
+        line = bytes(byte % 128 for byte in range(line_length - 1))
+        line = line.replace(b"\n", b"\0").replace(b"\r", b"\0")
+    else:
+        line = b"x" * (line_length - 1)
+    line += b"\n"
+
+    chunk = line * max(1, (64 * 1024) // len(line))
+    out = sys.stdout.buffer
+
+    written = 0
+    while written < total_bytes:
+        to_write = chunk[: total_bytes - written]
+        out.write(to_write)
+        written += len(to_write)
+
+    out.flush()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.patterns.lazy import lazy_reference
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures startup time when many heavy clients are declared but only a few are used, and the per-call
+    overhead of lazy proxies once their target exists.
+
+    Usage:
+        benchmarks/lazy.py --clients 10,100 --used 3 --output logs/lazy.json
+"""
+
+
+class _HeavyClient:
+    """A stand-in for a client that's expensive to construct."""
+
+    def __init__(self, size: int = 20_000):
+        self.table = {index: str(index) for index in range(size)}
+
+    def query(self, key: int) -> str:
+        return self.table[key]
+
+
+_LazyHeavyClient = lazy_reference(_HeavyClient)
+
+
+def _add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--clients",
+        help="comma-separated numbers of clients to declare",
+        required=False,
+        dest="clients",
+        default="10,100",
+    )
+    parser.add_argument(
+        "--used",
+        help="the number of declared clients to use",
+        required=False,
+        dest="used",
+        type=int,
+        default=3,
+    )
+
+
+def _startup(cls: type, num_clients: int, num_used: int):
+    """Declares clients and uses a few of them, as a service would on startup."""
+    clients = [cls() for _ in range(num_clients)]
+    for client in clients[:num_used]:
+        client.query(0)
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = []
+
+    for num_clients in (int(count) for count in args.clients.split(",")):
+        for kind, cls in (("eager", _HeavyClient), ("lazy", _LazyHeavyClient)):
+            results.append(
+                measure(
+                    name="startup",
+                    method=lambda: _startup(cls, num_clients, args.used),
+                    iterations=max(1, args.iterations // 10),
+                    warmup=1,
+                    params={"clients": num_clients, "used": args.used, "kind": kind},
+                )
+            )
+
+    # Once constructed, calls cost the same as any other @reference proxy.
+    for kind, client in (("direct", _HeavyClient()), ("lazy", _LazyHeavyClient())):
+        results.append(
+            measure(
+                name="query",
+                method=lambda: client.query(0),
+                iterations=args.iterations,
+                number=1000,
+                params={"kind": kind},
+            )
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Startup time and call overhead of lazy proxies.",
+        collect=_collect,
+        add_arguments=_add_arguments,
+    )
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.patterns.read_write_lock import ReadWriteLock
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures a read-mostly workload (95% reads) against a shared table guarded by an exclusive lock
+    vs. a ReadWriteLock, as the number of threads grows.
+
+    Each operation holds the lock either briefly (a dictionary lookup, "cpu") or while waiting on
+    something that releases the GIL ("io"), i.e. a lookup backed by a socket or file.
+
+    Usage:
+        benchmarks/read_write_lock.py --output logs/read_write_lock.json
+"""
+
+_THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+_WRITE_EVERY = 20  # 95% reads.
+_OPS_PER_THREAD = {"cpu": 2_000, "io": 100}
+_IO_SECS = 0.0001
+
+
+class _Table:
+    """A stand-in for a read-mostly Singleton, i.e. a config or lookup table."""
+
+    def __init__(self, lock_type: type, work: str):
+        self._lock = lock_type()
+        self._values = {index: index for index in range(100)}
+        self._read = self._lock.read if isinstance(self._lock, ReadWriteLock) else None
+        self._wait = work == "io"
+
+    def get(self, key: int) -> int:
+        with self._read() if self._read else self._lock:
+            if self._wait:
+                time.sleep(_IO_SECS)
+            return self._values[key]
+
+    def set(self, key: int, value: int):
+        with self._lock:
+            if self._wait:
+                time.sleep(_IO_SECS)
+            self._values[key] = value
+
+
+def _per_op(result: BenchmarkResult, ops: int) -> BenchmarkResult:
+    """Scales a result measured over many operations down to a single operation."""
+    return result._replace(
+        mean_ns=result.mean_ns / ops,
+        median_ns=result.median_ns / ops,
+        min_ns=result.min_ns / ops,
+        max_ns=result.max_ns / ops,
+        stdev_ns=result.stdev_ns / ops,
+    )
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = []
+
+    for work, ops_per_thread in _OPS_PER_THREAD.items():
+        for num_threads in _THREAD_COUNTS:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                for kind, lock_type in (
+                    ("lock", threading.Lock),
+                    ("read_write_lock", ReadWriteLock),
+                ):
+                    table = _Table(lock_type, work)
+
+                    def run_ops():
+                        for op in range(ops_per_thread):
+                            if op % _WRITE_EVERY:
+                                table.get(op % 100)
+                            else:
+                                table.set(op % 100, op)
+
+                    result = measure(
+                        name="read_mostly",
+                        method=lambda: wait(
+                            [executor.submit(run_ops) for _ in range(num_threads)]
+                        ),
+                        iterations=max(1, args.iterations // 10),
+                        warmup=1,
+                        params={"work": work, "lock": kind, "threads": num_threads},
+                    )
+                    results.append(_per_op(result, num_threads * ops_per_thread))
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Exclusive vs. reader-writer locks on a read-mostly workload.",
+        collect=_collect,
+    )
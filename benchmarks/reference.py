@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+
+from pathlib import Path
+from typing import Type
+
+sys.path.append(str(Path(__file__).parents[1]))
+import hephaestus.decorators.reference as reference_
+from hephaestus.decorators.reference import reference, reference_getter
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures the overhead of classes decorated with @reference: forwarded calls and attribute lookups
+    vs. direct access, and the cost of decorating and instantiating classes as they grow.
+
+    Usage:
+        benchmarks/reference.py --output logs/reference.json
+"""
+
+_CLASS_SIZES = [10, 100, 1000]
+_ARG_COUNTS = [0, 3, 10]
+
+
+class _Target:
+    """A stand-in for the object stored by reference."""
+
+    def __init__(self):
+        self.value = 0
+
+    def method(self):
+        return self.value
+
+    def method_0(self):
+        return None
+
+    def method_3(self, a0, a1, a2):
+        return None
+
+    def method_10(self, a0, a1, a2, a3, a4, a5, a6, a7, a8, a9):
+        return None
+
+
+_TARGET = _Target()
+
+
+def _make_class(num_methods: int, decorate: bool, cache_methods: bool = False) -> Type:
+    """Creates a class with the requested number of methods.
+
+    Args:
+        num_methods: the number of (non-getter) methods to define.
+        decorate: whether to decorate the class with @reference.
+        cache_methods: whether the decorated class should cache bound methods. Defaults to False.
+
+    Returns:
+        The class definition.
+    """
+    name = f"Class{num_methods}{'Reference' if decorate else 'Plain'}{'Cached' if cache_methods else ''}"
+    namespace = {f"method_{index}": lambda self: None for index in range(num_methods)}
+
+    def get(self):
+        return _TARGET
+
+    namespace["get"] = reference_getter(get) if decorate else get
+
+    cls = type(name, (), namespace)
+    return reference(cls, cache_methods=cache_methods) if decorate else cls
+
+
+def _collect_getattr(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Measures attribute access forwarded through `__getattr__`."""
+    results = []
+
+    proxies = {
+        "direct": _TARGET,
+        "reference": _make_class(0, decorate=True)(),
+        "reference_cached": _make_class(0, decorate=True, cache_methods=True)(),
+    }
+    for kind, obj in proxies.items():
+        for attribute in ("value", "method"):
+            results.append(
+                measure(
+                    name="getattr",
+                    method=lambda: getattr(obj, attribute),
+                    iterations=args.iterations,
+                    number=1000,
+                    track_memory=True,
+                    params={"proxy": kind, "attribute": attribute},
+                )
+            )
+
+    return results
+
+
+def _collect_forward(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Measures calls forwarded through generated proxy methods vs. the generic wrapper."""
+    results = []
+
+    @reference
+    class Proxy(_Target):
+        @reference_getter
+        def get(self):
+            return _TARGET
+
+    proxy = Proxy()
+    method_wrapper = getattr(reference_, "__method_wrapper")
+
+    for num_args in _ARG_COUNTS:
+        method_name = f"method_{num_args}"
+        call_args = tuple(range(num_args))
+        wrapper = method_wrapper(
+            getter=Proxy.get, if_none=lambda: None, method_name=method_name
+        )
+
+        methods = {
+            "direct": getattr(_TARGET, method_name),
+            "wrapper": wrapper.__get__(proxy),
+            "generated": getattr(proxy, method_name),
+        }
+        for kind, method in methods.items():
+            results.append(
+                measure(
+                    name="forward",
+                    method=lambda: method(*call_args),
+                    iterations=args.iterations,
+                    number=1000,
+                    track_memory=True,
+                    params={"proxy": kind, "args": num_args},
+                )
+            )
+
+    return results
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = _collect_getattr(args) + _collect_forward(args)
+
+    for num_methods in _CLASS_SIZES:
+
+        # One-time cost of generating proxy methods.
+        results.append(
+            measure(
+                name="decorate",
+                method=lambda: _make_class(num_methods, decorate=True),
+                iterations=max(1, args.iterations // 10),
+                params={"methods": num_methods},
+            )
+        )
+
+        for decorate in (False, True):
+            cls = _make_class(num_methods, decorate)
+            results.append(
+                measure(
+                    name="instantiate",
+                    method=cls,
+                    iterations=args.iterations,
+                    number=100,
+                    track_memory=True,
+                    params={
+                        "methods": num_methods,
+                        "class": "reference" if decorate else "plain",
+                    },
+                )
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Overhead of @reference proxies.",
+        collect=_collect,
+    )
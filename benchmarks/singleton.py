@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.patterns.singleton import Singleton, SingletonScope, singleton_scope
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures the cost of looking up an existing Singleton instance, alone and while many threads
+    look it up at once, vs. reading a module-level global. Thread- and context-scoped lookups are
+    measured alongside process-wide ones.
+
+    Usage:
+        benchmarks/singleton.py --output logs/singleton.json
+"""
+
+_THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+_CALLS_PER_THREAD = 10_000
+
+
+class _Shared(metaclass=Singleton):
+    """A stand-in for a shared service."""
+
+    pass
+
+
+class _PerThread(metaclass=Singleton):
+    """A stand-in for a per-thread resource."""
+
+    _scope = SingletonScope.THREAD
+
+
+class _PerRequest(metaclass=Singleton):
+    """A stand-in for a per-request resource."""
+
+    _scope = SingletonScope.CONTEXT
+
+
+_GLOBAL = _Shared()
+
+
+def _get_global() -> _Shared:
+    return _GLOBAL
+
+
+def _per_call(result: BenchmarkResult, calls: int) -> BenchmarkResult:
+    """Scales a result measured over many calls down to a single call."""
+    return result._replace(
+        mean_ns=result.mean_ns / calls,
+        median_ns=result.median_ns / calls,
+        min_ns=result.min_ns / calls,
+        max_ns=result.max_ns / calls,
+        stdev_ns=result.stdev_ns / calls,
+    )
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = []
+
+    for num_threads in _THREAD_COUNTS:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for kind, get in (
+                ("global", _get_global),
+                ("singleton", _Shared),
+                ("thread", _PerThread),
+                ("context", _PerRequest),
+            ):
+
+                def get_many():
+                    with singleton_scope():
+                        for _ in range(_CALLS_PER_THREAD):
+                            get()
+
+                result = measure(
+                    name="lookup",
+                    method=lambda: wait(
+                        [executor.submit(get_many) for _ in range(num_threads)]
+                    ),
+                    iterations=max(1, args.iterations // 10),
+                    params={"kind": kind, "threads": num_threads},
+                )
+                results.append(_per_call(result, num_threads * _CALLS_PER_THREAD))
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Cost of looking up existing Singleton instances across threads.",
+        collect=_collect,
+    )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import sys
+
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.io.logging import get_logger
+from hephaestus.io.subprocess import (
+    LaunchBackend,
+    OutputBatchOptions,
+    command_successful,
+    get_command_output,
+    get_launch_backend,
+    run_command,
+    set_launch_backend,
+)
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures the cost of launching commands and capturing their output.
+
+    Every scenario runs offline against local helper programs. Usage:
+        benchmarks/subprocess_capture.py --output logs/capture.json --baseline logs/capture.baseline.json
+"""
+
+_logger = get_logger(__name__)
+
+_EMIT_OUTPUT = Path(Path(__file__).parent, "helpers", "emit_output.py")
+
+# Output mode and size, in bytes, of each throughput scenario.
+_THROUGHPUT_SCENARIOS = {
+    "small": ("lines", 16),
+    "large": ("large", 8 * 1024**2),
+    "line_heavy": ("lines", 8 * 1024**2),
+    "binary": ("binary", 8 * 1024**2),
+}
+
+
+def _emit_cmd(mode: str, size: int) -> list:
+    return [sys.executable, _EMIT_OUTPUT, mode, size]
+
+
+def _add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--scale",
+        help="a multiplier applied to the size of each bulk output scenario",
+        required=False,
+        dest="scale",
+        type=float,
+        default=1.0,
+    )
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = []
+    original_backend = get_launch_backend()
+
+    # Launch latency.
+    for backend in (LaunchBackend.POPEN, LaunchBackend.POSIX_SPAWN):
+        if set_launch_backend(backend):
+            results.append(
+                measure(
+                    name="launch",
+                    method=lambda: command_successful(["true"], close_fds=False),
+                    iterations=args.iterations,
+                    params={"backend": backend},
+                )
+            )
+    set_launch_backend(original_backend)
+
+    # Throughput and memory high-water mark of capturing output.
+    iterations = max(1, args.iterations // 10)
+    for scenario, (mode, size) in _THROUGHPUT_SCENARIOS.items():
+        if scenario != "small":
+            size = max(1, int(size * args.scale))
+        cmd = _emit_cmd(mode, size)
+        result = measure(
+            name="capture",
+            method=lambda: get_command_output(cmd, err="Helper failed."),
+            iterations=iterations,
+            warmup=1,
+            params={"scenario": scenario, "bytes": size},
+            track_memory=True,
+        )
+        results.append(result)
+        _logger.info(
+            f"capture[{scenario}]: {size / (result.median_ns / 1e9) / 1024**2:,.1f} MiB/s"
+        )
+
+    # Logging overhead. Output is logged at DEBUG, which the console handler filters out,
+    # so this measures the cost of creating and dispatching records rather than terminal I/O.
+    size = max(1, int(_THROUGHPUT_SCENARIOS["line_heavy"][1] * args.scale))
+    cmd = _emit_cmd("lines", size)
+    for logging_mode, kwargs in (
+        ("disabled", {"enable_output": False}),
+        ("per_line", {"enable_output": True}),
+        ("batched", {"enable_output": True, "batch_output": OutputBatchOptions()}),
+    ):
+        results.append(
+            measure(
+                name="logging",
+                method=lambda: run_command(
+                    cmd, err="Helper failed.", log_level=logging.DEBUG, **kwargs
+                ),
+                iterations=iterations,
+                warmup=1,
+                params={"output": logging_mode, "bytes": size},
+            )
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Command launch latency, output capture throughput, memory, and logging overhead.",
+        collect=_collect,
+        add_arguments=_add_arguments,
+    )
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.io.logging import get_logger
+from hephaestus.io.subprocess import (
+    LaunchBackend,
+    command_successful,
+    get_launch_backend,
+    set_launch_backend,
+)
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures command launch latency for each launch backend as the parent process grows.
+
+    Forking gets more expensive the more memory the parent has mapped; posix_spawn shouldn't care.
+    Usage:
+        benchmarks/subprocess_launch.py --rss 50M,512M,4G --output logs/launch.json
+"""
+
+_logger = get_logger(__name__)
+
+_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+_PAGE_SIZE = 4096
+
+
+def _parse_size(size: str) -> int:
+    """Converts a human-readable size (i.e. 50M, 4G) to bytes."""
+    size = size.strip().upper()
+    if size[-1] in _UNITS:
+        return int(float(size[:-1]) * _UNITS[size[-1]])
+    return int(size)
+
+
+def _grow_ballast(ballast: list[bytearray], target_bytes: int) -> int:
+    """Allocates and touches memory until the ballast reaches the target size.
+
+    Args:
+        ballast: the memory allocated so far.
+        target_bytes: the total size the ballast should reach.
+
+    Returns:
+        The size of the ballast in bytes.
+    """
+    chunk_size = 64 * _UNITS["M"]
+    current = sum(len(chunk) for chunk in ballast)
+
+    while current < target_bytes:
+        chunk = bytearray(min(chunk_size, target_bytes - current))
+
+        # Write to every page so the memory is actually resident.
+        chunk[::_PAGE_SIZE] = b"\x01" * len(range(0, len(chunk), _PAGE_SIZE))
+        ballast.append(chunk)
+        current += len(chunk)
+
+    return current
+
+
+def _add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--rss",
+        help="comma-separated amounts of memory to add to the parent process",
+        required=False,
+        dest="rss",
+        default="50M,256M,1G,4G",
+    )
+    parser.add_argument(
+        "--cmd",
+        help="the command to launch",
+        required=False,
+        dest="cmd",
+        default="true",
+    )
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    backends = [LaunchBackend.POPEN, LaunchBackend.POSIX_SPAWN]
+    original_backend = get_launch_backend()
+
+    results = []
+    ballast = []
+    for size in sorted(_parse_size(size) for size in args.rss.split(",")):
+        try:
+            ballast_bytes = _grow_ballast(ballast, size)
+        except MemoryError:
+            _logger.warning(f"Could not allocate {size} bytes. Stopping early.")
+            break
+
+        for backend in backends:
+            if not set_launch_backend(backend):
+                continue
+
+            results.append(
+                measure(
+                    name="launch",
+                    method=lambda: command_successful([args.cmd], close_fds=False),
+                    iterations=args.iterations,
+                    params={
+                        "backend": backend,
+                        "ballast_mb": ballast_bytes // _UNITS["M"],
+                    },
+                )
+            )
+
+    set_launch_backend(original_backend)
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Command launch latency vs. parent process memory.",
+        collect=_collect,
+        add_arguments=_add_arguments,
+    )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+from hephaestus.decorators.track import (
+    CapturePolicy,
+    MethodTrace,
+    TraceQueue,
+    TraceStats,
+    track,
+)
+from hephaestus.io.trace import SummaryPolicy, TraceExporter
+from hephaestus.testing.benchmark import BenchmarkResult, measure, run_benchmark
+
+"""
+    Measures the per-call overhead of methods decorated with @track vs. undecorated methods.
+
+    Traces are kept until each scenario finishes, as they would be in a test, so retained blocks
+    show what every call leaves behind. The bounded scenarios cap the trace queue instead.
+
+    The threaded scenarios compare storing traces with `Queue.put` (a shared lock and condition per trace)
+    against per-thread buffers (`TraceQueue.record`) as the number of threads recording at once grows.
+
+    The capture scenarios pass a large buffer to a tracked method under each capture policy.
+
+    The export scenarios measure the background writer's cost of encoding and writing each trace.
+
+    Usage:
+        benchmarks/track.py --output logs/track.json
+"""
+
+_ARG_COUNTS = [0, 3, 10]
+_BOUNDED_CAPACITY = 1000
+_THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+_CALLS_PER_THREAD = 1000
+_PAYLOAD_BYTES = 1024 * 1024
+
+
+def _method_0():
+    return None
+
+
+def _method_3(a0, a1, a2):
+    return None
+
+
+def _method_10(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9):
+    return None
+
+
+def _per_call(result: BenchmarkResult, calls: int) -> BenchmarkResult:
+    """Scales a result measured over many calls down to a single call."""
+    return result._replace(
+        mean_ns=result.mean_ns / calls,
+        median_ns=result.median_ns / calls,
+        min_ns=result.min_ns / calls,
+        max_ns=result.max_ns / calls,
+        stdev_ns=result.stdev_ns / calls,
+    )
+
+
+def _collect_threads(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Measures the cost of storing a trace while many threads store them at once."""
+    results = []
+
+    trace = MethodTrace(name="method", args=(), kwargs={}, retval=None)
+    queue = TraceQueue()
+    queue.set_capacity(_BOUNDED_CAPACITY)
+
+    for num_threads in _THREAD_COUNTS:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for kind, store in (("put", queue.put), ("record", queue.record)):
+
+                def store_many():
+                    for _ in range(_CALLS_PER_THREAD):
+                        store(trace)
+
+                def run_threads():
+                    wait([executor.submit(store_many) for _ in range(num_threads)])
+                    queue.clear()
+
+                result = measure(
+                    name="store",
+                    method=run_threads,
+                    iterations=max(1, args.iterations // 10),
+                    params={"method": kind, "threads": num_threads},
+                )
+                results.append(_per_call(result, num_threads * _CALLS_PER_THREAD))
+
+    queue.set_capacity(None)
+    return results
+
+
+def _collect_capture(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Measures tracked calls passed a large payload under each capture policy."""
+    results = []
+
+    payload = bytearray(_PAYLOAD_BYTES)
+    TraceQueue().set_capacity(_BOUNDED_CAPACITY)
+
+    for capture in (
+        CapturePolicy.FULL,
+        CapturePolicy.NONE,
+        CapturePolicy.TYPES,
+        CapturePolicy.REPR,
+        CapturePolicy.WEAKREF,
+    ):
+        method = track(_method_3, capture=capture)
+        results.append(
+            measure(
+                name="capture",
+                method=lambda: method(payload, payload, payload),
+                iterations=args.iterations,
+                number=100,
+                track_memory=True,
+                params={"capture": capture, "payload_bytes": _PAYLOAD_BYTES},
+            )
+        )
+        TraceQueue().clear()
+
+    TraceQueue().set_capacity(None)
+    return results
+
+
+def _collect_export(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Measures the cost of encoding and writing traces, per trace, for each summary policy."""
+    results = []
+
+    traces = [
+        MethodTrace(
+            name="method",
+            args=(index, "value", [1, 2, 3]),
+            kwargs={"flag": True},
+            retval=index,
+            start_ns=index,
+            duration_ns=1000,
+            thread_id=1,
+        )
+        for index in range(_BOUNDED_CAPACITY)
+    ]
+
+    with tempfile.TemporaryDirectory() as folder:
+        for policy in (SummaryPolicy.NONE, SummaryPolicy.TYPES, SummaryPolicy.REPR):
+            exporter = TraceExporter(f"{folder}/{policy}.bin", summary=policy)
+            with exporter:
+                result = measure(
+                    name="export",
+                    method=lambda: exporter._write_batch(traces),
+                    iterations=max(1, args.iterations // 10),
+                    params={"summary": policy},
+                )
+            results.append(_per_call(result, len(traces)))
+
+    return results
+
+
+def _collect(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results = []
+
+    methods = {0: _method_0, 3: _method_3, 10: _method_10}
+    for num_args in _ARG_COUNTS:
+        call_args = tuple(range(num_args))
+
+        for kind, method, capacity in (
+            ("direct", methods[num_args], None),
+            ("track", track(methods[num_args]), None),
+            ("track_bounded", track(methods[num_args]), _BOUNDED_CAPACITY),
+            (
+                "track_aggregate",
+                track(methods[num_args], aggregate=True, keep_traces=False),
+                None,
+            ),
+        ):
+            TraceQueue().set_capacity(capacity)
+            results.append(
+                measure(
+                    name="call",
+                    method=lambda: method(*call_args),
+                    iterations=args.iterations,
+                    number=1000,
+                    track_memory=True,
+                    params={"decorator": kind, "args": num_args},
+                )
+            )
+            TraceQueue().clear()
+            TraceStats().clear()
+
+    return (
+        results
+        + _collect_capture(args)
+        + _collect_threads(args)
+        + _collect_export(args)
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        description="Overhead of @track.",
+        collect=_collect,
+        add_arguments=None,
+    )
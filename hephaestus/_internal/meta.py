@@ -18,5 +18,6 @@ class Paths:
     LIB = Path(ROOT, "hephaestus")
     CONFIG = Path(ROOT, "config")
     DOCS = Path(ROOT, "docs")
+    BENCHMARKS = Path(ROOT, "benchmarks")
 
     SPHINX = Path(CONFIG, "sphinx")
@@ -1,4 +1,6 @@
+import functools
 import inspect
+import keyword
 
 from logging import getLogger
 from typing import Any, Callable, Type
@@ -7,10 +9,10 @@ from hephaestus.common.exceptions import LoggedException
 
 _logger = getLogger(__name__)
 
-# Internal "cache" of defined getters and ignores for each parent.
-__cls_maps: dict[str, "__ReferenceMap"] = {}
 __getter_id = "__hephaestus_getter_method"
 __ignore_id = "__hephaestus_ignore_method"
+__map_id = "__hephaestus_reference_map"
+__cache_id = "_hephaestus_reference_cache"
 
 # Used to check if a modifier has already been set on a method. External
 # users should only assign one modifier per method.
@@ -24,11 +26,56 @@ __errors = {
 # Private
 ##
 class __ReferenceMap:
-    def __init__(self, getter: Callable = None, ignores: list[Callable] = []):
+    """The "getter" and "ignore" methods defined for a class.
+
+    Each decorated class stores its own map so nothing outlives the class itself.
+    """
+
+    def __init__(self, getter: str = None, ignores: frozenset[str] = frozenset()):
         self.getter = getter
         self.ignores = ignores
 
 
+def __build_reference_map(cls: Type) -> __ReferenceMap:
+    """Collects the methods marked with reference modifiers for a class and its parents.
+
+    Args:
+        cls: the class object.
+
+    Returns:
+        The name of the "getter" method, if any, and the names of all ignored methods.
+
+    Note:
+        Methods are looked up in reverse MRO order so a subclass's definition of a method,
+        marked or not, takes precedence over its parents'.
+    """
+    getter = None
+    ignores = set()
+
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+
+            # Only plain, static, and class methods can be marked.
+            method = (
+                attr.__func__ if isinstance(attr, (staticmethod, classmethod)) else attr
+            )
+            if not inspect.isfunction(method):
+                continue
+
+            # Markers stacked over @staticmethod or @classmethod land on the descriptor instead.
+            if getattr(method, __ignore_id, False) or getattr(attr, __ignore_id, False):
+                ignores.add(name)
+            else:
+                ignores.discard(name)
+
+            if getattr(method, __getter_id, False) or getattr(attr, __getter_id, False):
+                getter = name
+            elif name == getter:
+                getter = None
+
+    return __ReferenceMap(getter=getter, ignores=frozenset(ignores))
+
+
 def __return_none() -> None:
     """Empty method used to always get None on call.
 
@@ -38,13 +85,50 @@ def __return_none() -> None:
     return None
 
 
-def __method_wrapper(getter: Callable, if_none: Callable, method_name: str) -> Callable:
+class __MethodKind:
+    """The kinds of methods proxies are generated for."""
+
+    FUNCTION = "function"
+    COROUTINE = "coroutine"
+    ASYNC_GENERATOR = "async_generator"
+
+
+def __method_kind(cls: Type, method_name: str) -> str:
+    """Determines whether a method is a plain function, a coroutine function, or an async generator.
+
+    Args:
+        cls: the class object.
+        method_name: the name of the method.
+
+    Returns:
+        The kind of method, as a __MethodKind.
+    """
+    method = inspect.getattr_static(cls, method_name)
+    if isinstance(method, (staticmethod, classmethod)):
+        method = method.__func__
+
+    if inspect.iscoroutinefunction(method):
+        return __MethodKind.COROUTINE
+    if inspect.isasyncgenfunction(method):
+        return __MethodKind.ASYNC_GENERATOR
+    return __MethodKind.FUNCTION
+
+
+def __method_wrapper(
+    getter: Callable,
+    if_none: Callable,
+    method_name: str,
+    kind: str = __MethodKind.FUNCTION,
+    async_getter: bool = False,
+) -> Callable:
     """Wraps methods, ensuring calls go to object stored by reference.
 
     Args:
         getter: the method to use a "getter" for the stored object.
         if_none: the method to use should the stored object be Null.
         method_name: the name of method to wrap.
+        kind: the kind of method to wrap, as a __MethodKind. Defaults to a plain function.
+        async_getter: whether the "getter" is a coroutine function. Defaults to False.
 
     Returns:
         A callable method that acts as a proxy for the method to wrap.
@@ -61,9 +145,428 @@ def __method_wrapper(getter: Callable, if_none: Callable, method_name: str) -> C
             return if_none()
         return getattr(obj, method_name)(*args, **kwargs)
 
+    async def _async_wrapper(self, *args, **kwargs) -> Any:
+        obj = (await getter(self)) if async_getter else getter(self)
+        if not obj:
+            _logger.debug("Referenced object is null.")
+            return if_none()
+
+        result = getattr(obj, method_name)(*args, **kwargs)
+        return (await result) if kind == __MethodKind.COROUTINE else result
+
+    async def _async_generator_wrapper(self, *args, **kwargs) -> Any:
+        obj = (await getter(self)) if async_getter else getter(self)
+        if not obj:
+            _logger.debug("Referenced object is null.")
+            if_none()
+            return
+
+        async for item in getattr(obj, method_name)(*args, **kwargs):
+            yield item
+
+    if kind == __MethodKind.ASYNC_GENERATOR:
+        return _async_generator_wrapper
+    if async_getter or (kind == __MethodKind.COROUTINE):
+        return _async_wrapper
     return _wrapper
 
 
+# Names used by generated proxy methods. Methods with parameters using the prefix get a generic proxy.
+__generated_prefix = "_hephaestus_"
+__generated_self = f"{__generated_prefix}self"
+__generated_obj = f"{__generated_prefix}obj"
+__generated_getter = f"{__generated_prefix}getter"
+__generated_if_none = f"{__generated_prefix}if_none"
+__generated_omitted = f"{__generated_prefix}omitted"
+__generated_kwargs = f"{__generated_prefix}kwargs"
+
+
+def __proxy_signature(
+    cls: Type, method_name: str
+) -> tuple[inspect.Signature, Callable]:
+    """Determines the signature a proxy method should have, including the leading instance.
+
+    Args:
+        cls: the class object.
+        method_name: the name of the method to proxy.
+
+    Returns:
+        The signature of the proxy method and the underlying method if the signature can be
+        determined; None otherwise.
+    """
+    attr = inspect.getattr_static(cls, method_name)
+
+    try:
+        # Static and class methods don't take the instance, but the proxy method does.
+        if isinstance(attr, (staticmethod, classmethod)):
+            signature = inspect.signature(attr.__func__)
+            params = list(signature.parameters.values())
+            if isinstance(attr, classmethod):
+                params = params[1:]
+
+            self_param = inspect.Parameter(
+                __generated_self, inspect.Parameter.POSITIONAL_ONLY
+            )
+            return signature.replace(parameters=[self_param, *params]), attr.__func__
+
+        # Plain methods, including those implemented in C (i.e. `str.upper`).
+        if inspect.isfunction(attr) or inspect.ismethoddescriptor(attr):
+            signature = inspect.signature(attr)
+            params = list(signature.parameters.values())
+            if params and params[0].kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                return signature, attr
+
+    # Plenty of builtins don't expose their signature.
+    except (TypeError, ValueError):
+        pass
+
+    return None
+
+
+def __method_forwarder(
+    getter: Callable,
+    if_none: Callable,
+    cls: Type,
+    method_name: str,
+    kind: str = __MethodKind.FUNCTION,
+    async_getter: bool = False,
+) -> Callable:
+    """Generates a proxy method with the exact signature of the method it replaces.
+
+    Args:
+        getter: the method to use a "getter" for the stored object.
+        if_none: the method to use should the stored object be Null.
+        cls: the class object.
+        method_name: the name of method to wrap.
+        kind: the kind of method to wrap, as a __MethodKind. Defaults to a plain function.
+        async_getter: whether the "getter" is a coroutine function. Defaults to False.
+
+    Returns:
+        A callable method that acts as a proxy for the method to wrap. None if one
+        can't be generated.
+
+    Note:
+        Unlike `__method_wrapper`, arguments are passed along as declared rather than packed into
+        `*args` and `**kwargs`. Arguments the caller omits are left out, so the stored object's own
+        defaults apply rather than the ones declared by the class.
+
+        The proxy's name, docstring, and annotations are copied from the wrapped method. Plain methods
+        are also available via `__wrapped__`.
+
+        Coroutine functions, and every method of a class with an async "getter", get `async def`
+        proxies; should the stored object be Null, awaiting the proxy gives the null result. Async
+        generators get async generator proxies that yield nothing should the stored object be Null.
+    """
+    proxy_signature = __proxy_signature(cls, method_name)
+    if (
+        (not proxy_signature)
+        or keyword.iskeyword(method_name)
+        or method_name.startswith(__generated_prefix)
+    ):
+        return None
+
+    signature, method = proxy_signature
+    params = list(signature.parameters.values())
+    if any(param.name.startswith(__generated_prefix) for param in params[1:]):
+        return None
+
+    def on_none() -> Any:
+        _logger.debug("Referenced object is null.")
+        return if_none()
+
+    # Every default is a sentinel, so omitted arguments can be left out of the forwarded call.
+    namespace = {
+        __generated_getter: getter,
+        __generated_if_none: on_none,
+        __generated_omitted: object(),
+    }
+
+    declared = []
+    positional, defaulted, keywords, optional = [], [], [], []
+    var_positional = None
+    for index, param in enumerate(params):
+        previous = params[index - 1].kind if index else None
+
+        # Separators for positional-only and keyword-only parameters.
+        if (previous is inspect.Parameter.POSITIONAL_ONLY) and (
+            param.kind is not inspect.Parameter.POSITIONAL_ONLY
+        ):
+            declared.append("/")
+        if (param.kind is inspect.Parameter.KEYWORD_ONLY) and (
+            previous
+            not in (inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_POSITIONAL)
+        ):
+            declared.append("*")
+
+        has_default = param.default is not inspect.Parameter.empty
+        declared.append(
+            f"{param.name}={__generated_omitted}" if has_default else param.name
+        )
+
+        # The instance is never forwarded.
+        if not index:
+            continue
+
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            declared[-1] = f"*{param.name}"
+            var_positional = param.name
+        elif param.kind is inspect.Parameter.VAR_KEYWORD:
+            declared[-1] = f"**{param.name}"
+            keywords.append(f"**{param.name}")
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            if has_default:
+                optional.append(param.name)
+            else:
+                keywords.append(f"{param.name}={param.name}")
+        elif has_default:
+            defaulted.append(param)
+        else:
+            positional.append(param.name)
+
+    if params[-1].kind is inspect.Parameter.POSITIONAL_ONLY:
+        declared.append("/")
+
+    def forward(arguments: list[str], optional: list[str], indent: str) -> list[str]:
+        """Generates the lines that call the stored object's method and return its result."""
+        if len(optional) > 1:
+            lines = [f"{indent}{__generated_kwargs} = {{}}"] + [
+                f"{indent}if {name} is not {__generated_omitted}: {__generated_kwargs}['{name}'] = {name}"
+                for name in optional
+            ]
+            return lines + forward(arguments + [f"**{__generated_kwargs}"], [], indent)
+
+        # A single optional argument is cheaper to branch on than to pack.
+        if optional:
+            name = optional[0]
+            return [
+                f"{indent}if {name} is {__generated_omitted}:",
+                *forward(arguments, [], f"{indent}    "),
+                *forward(arguments + [f"{name}={name}"], [], indent),
+            ]
+
+        obj_call = f"{__generated_obj}.{method_name}({', '.join(arguments)})"
+        if kind == __MethodKind.ASYNC_GENERATOR:
+            return [
+                f"{indent}async for {__generated_prefix}item in {obj_call}:",
+                f"{indent}    yield {__generated_prefix}item",
+                f"{indent}return",
+            ]
+        return [
+            f"{indent}return {'await ' if kind == __MethodKind.COROUTINE else ''}{obj_call}"
+        ]
+
+    is_async = async_getter or (kind != __MethodKind.FUNCTION)
+    lines = [
+        f"{'async ' if is_async else ''}def {method_name}({', '.join(declared)}):",
+        f"    {__generated_obj} = {'await ' if async_getter else ''}{__generated_getter}({params[0].name})",
+        f"    if not {__generated_obj}:",
+        (
+            f"        {__generated_if_none}()\n        return"
+            if kind == __MethodKind.ASYNC_GENERATOR
+            else f"        return {__generated_if_none}()"
+        ),
+    ]
+
+    # Positional arguments are forwarded up to the first one omitted. Later ones can only have been
+    # passed by keyword, and variadic ones not at all.
+    for index, param in enumerate(defaulted):
+        later = [
+            later_param.name
+            for later_param in defaulted[index + 1 :]
+            if later_param.kind is not inspect.Parameter.POSITIONAL_ONLY
+        ]
+        lines.append(f"    if {param.name} is {__generated_omitted}:")
+        lines += forward(
+            positional
+            + [later_param.name for later_param in defaulted[:index]]
+            + keywords,
+            later + optional,
+            "        ",
+        )
+
+    lines += forward(
+        positional
+        + [param.name for param in defaulted]
+        + ([f"*{var_positional}"] if var_positional else [])
+        + keywords,
+        optional,
+        "    ",
+    )
+    source = "\n".join(lines)
+
+    try:
+        exec(source, namespace)
+    except SyntaxError:
+        return None
+
+    forwarder = functools.update_wrapper(namespace[method_name], method)
+
+    # `inspect` would report the signature of the static or class method, which doesn't take the
+    # instance, so report the declared one; the generated method's own defaults are sentinels.
+    if params[0].name == __generated_self:
+        del forwarder.__wrapped__
+        forwarder.__signature__ = signature
+
+    return forwarder
+
+
+def __generate_proxies(cls: Type) -> Callable:
+    """Wraps the methods of a class, ensuring calls go to the object stored by reference.
+
+    Args:
+        cls: the class object.
+
+    Raises:
+        ReferenceError: if a "getter" is not defined for the class.
+
+    Returns:
+        The class's "getter" method.
+
+    Note:
+        Only needs to run once per class.
+    """
+
+    # Collect the "getter" and "ignore" methods for the class. The map is stored on the class itself
+    # so it's freed along with the class.
+    cls_map = __build_reference_map(cls)
+    setattr(cls, __map_id, cls_map)
+
+    # At minimum, the class should have a method decorated with "@reference_getter" otherwise,
+    # most of the logic won't work.
+    if not cls_map.getter:
+        raise ReferenceError("Could not find getter for class.")
+
+    # Get the "getter" method to pass to the wrapper methods.
+    getter_ = getattr(cls, cls_map.getter)
+    if_none_method_ = __return_none  # TODO: make configurable as a param?
+
+    # Stored objects resolved asynchronously (i.e. from a connection pool) make every proxy method async.
+    async_getter = inspect.iscoroutinefunction(getter_)
+
+    # Wrap all methods not marked with @reference_ignore. Also ignore dunder methods.
+    for item_str in dir(cls):
+        if (item_str.startswith("__")) or (item_str in cls_map.ignores):
+            continue
+
+        item = getattr(cls, item_str)
+        if callable(item):
+            # Prefer a proxy matching the method's signature; fall back to one that accepts anything.
+            proxy_args = {
+                "getter": getter_,
+                "if_none": if_none_method_,
+                "method_name": item_str,
+                "kind": __method_kind(cls, item_str),
+                "async_getter": async_getter,
+            }
+            proxy = __method_forwarder(cls=cls, **proxy_args) or __method_wrapper(
+                **proxy_args
+            )
+            setattr(cls, item_str, proxy)
+
+    _logger.debug(f"Generated proxy methods for {cls.__qualname__}.")
+    return getter_
+
+
+def __attribute_forwarder(getter: Callable, cache_methods: bool) -> Callable:
+    """Creates the `__getattr__` method for a class, forwarding attribute lookups to the object stored by reference.
+
+    Args:
+        getter: the method to use a "getter" for the stored object.
+        cache_methods: whether to cache bound methods of the stored object per instance.
+            Only honored for classes whose instances have a `__dict__`.
+
+    Returns:
+        The `__getattr__` method for the class.
+
+    Note:
+        Attribute lookups are synchronous, so they can't be forwarded when the "getter" is a
+        coroutine function. Every lookup not satisfied by the class raises an AttributeError instead.
+    """
+
+    def __getattr_async_getter(self, name: str) -> Any:
+        raise AttributeError(
+            f"'{self.__class__}' object has no attribute '{name}'. Attributes of the stored object "
+            'cannot be forwarded when the "getter" is async; await the "getter" and use the stored '
+            "object directly."
+        )
+
+    def __lookup(self, instance: Any, name: str) -> Any:
+        # Look the attribute up on the stored object exactly once.
+        try:
+            return getattr(instance, name)
+        except AttributeError:
+            raise AttributeError(
+                f"'{self.__class__}' object has no attribute '{name}'"
+            ) from None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Args:
+            name: the name of the attribute.
+
+        Raises:
+            AttributeError: if the attribute isn't defined for the stored object.
+
+        Returns:
+            The value of the attribute.
+
+        Note:
+            This method is only called when the attribute cannot be found in the instance.
+            It's very useful for ensuring the attributes defined during object instantiation are
+            still accessible.
+        """
+        instance = getter(self)
+
+        # Handle case where stored object can't be checked. We don't want to crash and burn here, nor
+        # nor impose any weird implementation-specific mandates about reference checking.
+        if not instance:
+            return None
+
+        return __lookup(self, instance, name)
+
+    def __getattr_with_cache(self, name: str) -> Any:
+        """
+        Args:
+            name: the name of the attribute.
+
+        Raises:
+            AttributeError: if the attribute isn't defined for the stored object.
+
+        Returns:
+            The value of the attribute.
+
+        Note:
+            Bound methods of the stored object are cached per instance for as long as the "getter"
+            keeps returning the same object. The cache holds a strong reference to that object.
+        """
+        instance = getter(self)
+
+        if not instance:
+            return None
+
+        attrs = self.__dict__
+        cache = attrs.get(__cache_id, None)
+        if (cache is None) or (cache[0] is not instance):
+            cache = attrs[__cache_id] = (instance, {})
+
+        value = cache[1].get(name, None)
+        if value is None:
+            value = __lookup(self, instance, name)
+
+            # Only methods bound to the stored object are safe to reuse. Anything else may change at any time.
+            if getattr(value, "__self__", None) is instance:
+                cache[1][name] = value
+
+        return value
+
+    if inspect.iscoroutinefunction(getter):
+        return __getattr_async_getter
+    return __getattr_with_cache if cache_methods else __getattr__
+
+
 ##
 # Public
 ##
@@ -90,17 +593,8 @@ def reference_ignore(method: Callable) -> Callable:
         if hasattr(method, id_):
             raise ReferenceError(__errors[id_])
 
-    # Get fully-qualified name of parent. This is the key
-    # used to store the class's reference map.
-    parent, method_name = method.__qualname__.rsplit(".", 1)
-    cls_map = __cls_maps.get(parent, __ReferenceMap())
-
-    # Set modifier indicator and add to reference map.
+    # Set modifier indicator. The class's reference map is built from these when it's decorated.
     setattr(method, __ignore_id, True)
-    cls_map.ignores.append(method_name)
-
-    # Update reference map cache.
-    __cls_maps[parent] = cls_map
 
     return method
 
@@ -124,132 +618,73 @@ def reference_getter(method: Callable) -> Callable:
         if hasattr(method, id_):
             raise ReferenceError(__errors[id_])
 
-    # Get fully-qualified name of parent. This is the key
-    # used to store the class's reference map.
-    parent, method_name = method.__qualname__.rsplit(".", 1)
-    cls_map = __cls_maps.get(parent, __ReferenceMap())
-
     # Set modifier indicators for this method. Here, we want this method to have
     # both the getter and ignore indicator so that our reference logic will skip wrapping the
-    # method without adding an extra conditional check.
+    # method without adding an extra conditional check. The class's reference map is built
+    # from these when it's decorated.
     setattr(method, __getter_id, True)
-    cls_map.getter = method_name
     setattr(method, __ignore_id, True)
-    cls_map.ignores.append(method_name)
 
-    # Update reference map cache.
-    __cls_maps[parent] = cls_map
     return method
 
 
-def reference(cls: Type) -> Type:
+def reference(cls: Type = None, *, cache_methods: bool = False) -> Type:
     """Specifies the class holds a stored object.
 
     Args:
         cls: the class definition to wrap.
+        cache_methods: whether to cache the stored object's bound methods per instance. The cache is
+            invalidated whenever the "getter" returns a different object. Defaults to False.
 
     Raises:
-        ReferenceError: should the passed object not be a class definition.
+        ReferenceError: should the passed object not be a class definition or
+        a "getter" not be defined for the class.
 
     Returns:
-        The class definition with some minor tweaks to instantiation and object creation
-        logic.
+        The class definition with its methods proxied to the stored object.
 
     Note:
         Generally, any method defined for the class other than the "getter" should
         be annotated with @reference_ignore.
-    """
 
-    # All the logic is dependent on the object being a class. Ensure it is so.
-    if not inspect.isclass(cls):
-        raise ReferenceError(f"{str(cls.__name__)} object is not a class.")
+        Methods that are coroutine functions or async generators get async proxies. Should the
+        "getter" be a coroutine function, every proxy is async and attributes of the stored object
+        can't be accessed through the class.
 
-    # Save unmodified methods for later use.
-    __unmodified_new = cls.__new__
-
-    # TODO: better docstring.
-    def __new__(cls: Type, *args, **kwargs):
-        """
-        Args:
-            cls: the class object.
+        Proxy methods are generated once, when the class is decorated. Subclasses
+        share the proxies of the decorated class; decorate the subclass as well to proxy any
+        methods it adds.
 
-        Raises:
-            ReferenceError: if a "getter" is not defined for the class.
-        """
+        Can be used with or without arguments:
 
-        # Use the fully qualified name of the class to lookup the "getter" and "ignore" methods
-        # for the class.
-        cls_map = __cls_maps.get(cls.__qualname__, None)
+        @reference
+        class MyReference:
+            ...
 
-        # At minimum, the class should have a method decorated with "@reference_getter" otherwise,
-        # most of the logic won't work.
-        if (not cls_map) or (not cls_map.getter) or (not hasattr(cls, cls_map.getter)):
-            raise ReferenceError("Could not find getter for class.")
+        @reference(cache_methods=True)
+        class MyCachedReference:
+            ...
+    """
 
-        # Get the "getter" method to pass to the wrapper methods.
-        getter_ = getattr(cls, cls_map.getter)
-        if_none_method_ = __return_none  # TODO: make configurable as a param?
+    # Allow use as a decorator with arguments.
+    if cls is None:
+        return lambda cls: reference(cls, cache_methods=cache_methods)
 
-        # Save getter method for any other lookups.
-        setattr(cls, __getter_id, getter_)
+    # All the logic is dependent on the object being a class. Ensure it is so.
+    if not inspect.isclass(cls):
+        raise ReferenceError(f"{str(cls.__name__)} object is not a class.")
 
-        # Wrap all methods not marked with @reference_ignore. Also ignore dunder methods.
-        for item_str in dir(cls):
-            if (item_str.startswith("__")) or (item_str in cls_map.ignores):
-                continue
+    # Wrap methods once, up front, so instantiation costs the same as it would for an undecorated class.
+    getter_ = __generate_proxies(cls)
 
-            item = getattr(cls, item_str)
-            if callable(item):
-                setattr(
-                    cls,
-                    item_str,
-                    __method_wrapper(
-                        getter=getter_, if_none=if_none_method_, method_name=item_str
-                    ),
-                )
-
-        # Pass along any extra arguments supplied unless the `__new__` method doesn't take any additional arguments.
-        return (
-            __unmodified_new(cls)
-            if __unmodified_new is object.__new__
-            else __unmodified_new(cls, *args, **kwargs)
+    # Objects without a `__dict__` (i.e. those using `__slots__`) can't hold a cache.
+    if cache_methods and (not cls.__dictoffset__):
+        _logger.warning(
+            f"Instances of {cls.__qualname__} have no __dict__. Methods will not be cached."
         )
-
-    def __getattr__(self, name: str) -> Any:
-        """
-        Args:
-            name: the name of the attribute.
-
-        Raises:
-            AttributeError: if the attribute isn't defined for the stored object.
-
-        Returns:
-            The value of the attribute.
-
-        Note:
-            This method is only called when the attribute cannot be found in the instance.
-            It's very useful for ensuring the attributes defined during object instantiation are
-            still accessible.
-        """
-
-        # Get defined "getter" method. We don't need to pass `self` to the method because the method
-        # is bound to the object referred to by self.
-        getter_ = getattr(self, __getter_id)
-        instance = getter_()
-
-        # Handle case where stored object can't be checked. We don't want to crash and burn here, nor
-        # nor impose any weird implementation-specific mandates about reference checking.
-        if not instance:
-            return None
-
-        # Check stored object for attribute.
-        if not hasattr(instance, name):
-            raise AttributeError(f"'{self.__class__}' object has no attribute '{name}'")
-
-        return getattr(instance, name)
+        cache_methods = False
 
     # Update methods for class
-    cls.__new__ = __new__
-    cls.__getattr__ = __getattr__
+    cls.__getattr__ = __attribute_forwarder(getter=getter_, cache_methods=cache_methods)
 
     return cls
@@ -1,20 +1,411 @@
-from collections import namedtuple
+import functools
+import heapq
+import inspect
+import itertools
+import math
+import reprlib
+import threading
+import time
+import weakref
+
+from collections import deque, namedtuple
 from queue import Queue
-from typing import Callable
+from typing import Any, Callable, Optional, Type, Union
 
+from hephaestus.common.exceptions import LoggedException
 from hephaestus.io.logging import get_logger
 from hephaestus.patterns.singleton import Singleton
 
 _logger = get_logger(__name__)
 
+
+##
+# Private
+##
+class _FunctionStats:
+    """Running statistics for the calls to a single function.
+
+    Durations are counted in a log-linear histogram: 16 buckets per power of two, so percentiles are
+    estimated within ~3% of the true value while memory stays bound by the range of durations seen,
+    not the number of calls.
+    """
+
+    __slots__ = ["count", "errors", "total_ns", "min_ns", "max_ns", "buckets"]
+
+    # Durations below 2^_EXACT_BITS ns get a bucket of their own.
+    _EXACT_BITS = 5
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+        self.buckets: dict[int, int] = {}
+
+    def add(self, duration_ns: int, failed: bool):
+        """Records a single call.
+
+        Args:
+            duration_ns: how long the call took.
+            failed: whether the call raised an exception.
+        """
+        self.count += 1
+        self.errors += failed
+        self.total_ns += duration_ns
+        if (self.min_ns is None) or (duration_ns < self.min_ns):
+            self.min_ns = duration_ns
+        if (self.max_ns is None) or (duration_ns > self.max_ns):
+            self.max_ns = duration_ns
+
+        # The bucket is the position of the highest bit followed by the next 4 bits.
+        shift = max(0, duration_ns.bit_length() - self._EXACT_BITS)
+        bucket = (shift << self._EXACT_BITS) | (duration_ns >> shift)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Estimates a percentile of the recorded durations.
+
+        Args:
+            quantile: the percentile to estimate, between 0 and 1 (i.e. 0.95 for p95).
+
+        Returns:
+            The estimated duration in nanoseconds, or None if no calls were recorded.
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                break
+
+        # Use the middle of the bucket, never straying outside what was actually seen.
+        shift = bucket >> self._EXACT_BITS
+        low = (bucket & ((1 << self._EXACT_BITS) - 1)) << shift
+        high = low + (1 << shift) - 1
+        return min(max((low + high) / 2, self.min_ns), self.max_ns)
+
+
+class _ThreadBuffer:
+    """The traces recorded by a single thread that haven't been collected yet."""
+
+    __slots__ = ["thread", "traces", "dropped"]
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.traces: deque[tuple[int, "MethodTrace"]] = deque()
+        self.dropped = 0
+
+
+def _shared(cls: Type) -> Any:
+    """Returns the instance of a Singleton, only going through `Singleton.__call__` (and its locks) to create it.
+
+    Args:
+        cls: the Singleton class.
+
+    Returns:
+        The class's shared instance.
+    """
+    return getattr(cls, Singleton.INSTANCE_ATTR_KEY, None) or cls()
+
+
+class _TruncatedRepr(reprlib.Repr):
+    """Limits the size of built-in containers, strings, and buffers before they're formatted, not after.
+
+    Note:
+        Any other object is formatted in full, then truncated.
+    """
+
+    def repr_bytes(self, value: bytes, level: int) -> str:
+        return self.repr_str(value[: self.maxstring], level)
+
+    def repr_bytearray(self, value: bytearray, level: int) -> str:
+        return f"bytearray({self.repr_bytes(bytes(value[: self.maxstring]), level)})"
+
+
+def _capture_type(value: Any) -> "CapturedValue":
+    return CapturedValue(type(value))
+
+
+def _capture_weakref(value: Any) -> "CapturedValue":
+    try:
+        return CapturedValue(type(value), weakref.ref(value))
+    except TypeError:
+        return CapturedValue(type(value))
+
+
+def _capturer(
+    capture: Union[str, Callable[[Any], Any]], max_repr_len: int
+) -> Optional[Callable[[Any], Any]]:
+    """Creates the method used to capture each argument and return value under a capture policy.
+
+    Args:
+        capture: the CapturePolicy or a method that returns what to store for a value.
+        max_repr_len: the maximum length of each repr under CapturePolicy.REPR.
+
+    Raises:
+        TrackError: if the capture policy is unknown.
+
+    Returns:
+        The capture method, or None if values are stored as-is or not at all.
+    """
+    if capture in (CapturePolicy.FULL, CapturePolicy.NONE):
+        return None
+
+    if capture == CapturePolicy.TYPES:
+        return _capture_type
+
+    if capture == CapturePolicy.WEAKREF:
+        return _capture_weakref
+
+    if capture == CapturePolicy.REPR:
+        repr_ = _TruncatedRepr()
+        repr_.maxstring = repr_.maxother = max_repr_len
+
+        def capture_repr(value: Any) -> str:
+            summary = repr_.repr(value)
+            return (
+                summary
+                if len(summary) <= max_repr_len
+                else f"{summary[:max_repr_len - 3]}..."
+            )
+
+        return capture_repr
+
+    if callable(capture):
+        return capture
+
+    raise TrackError(f"Unknown capture policy: {capture}.")
+
+
 ##
 # Public
 ##
-MethodTrace = namedtuple("MethodTrace", ["name", "args", "kwargs", "retval"])
+class TrackError(LoggedException):
+    """Indicates a method can't be tracked as requested."""
+
+    pass
+
+
+class CapturePolicy:
+    """What a tracked method stores of its arguments and return value."""
+
+    FULL = "full"  # Strong references to the values themselves.
+    NONE = "none"  # Nothing.
+    TYPES = "types"  # Only the type of each value.
+    REPR = "repr"  # A truncated repr of each value.
+    WEAKREF = "weakref"  # Weak references, falling back to the type for values that don't support them.
+
+
+class CapturedValue:
+    """Stands in for an argument or return value captured by type or weak reference.
+
+    Args:
+        type_: the type of the value.
+        ref: a weak reference to the value, if captured. Defaults to None.
+
+    Note:
+        Nothing is formatted until the value is printed.
+    """
+
+    __slots__ = ["type", "ref"]
+
+    def __init__(self, type_: Type, ref: Optional[weakref.ref] = None):
+        self.type = type_
+        self.ref = ref
+
+    def get(self) -> Any:
+        """Returns the captured value, if it's still alive.
+
+        Returns:
+            The value if it was captured by weak reference and hasn't been collected; None otherwise.
+        """
+        return self.ref() if self.ref is not None else None
+
+    def __repr__(self) -> str:
+        if self.ref is None:
+            return f"<{self.type.__qualname__}>"
+
+        value = self.ref()
+        if value is None:
+            return f"<{self.type.__qualname__} (collected)>"
+        return f"<{self.type.__qualname__} at {hex(id(value))}>"
+
+
+MethodTrace = namedtuple(
+    "MethodTrace",
+    [
+        "name",
+        "args",
+        "kwargs",
+        "retval",
+        "start_ns",
+        "duration_ns",
+        "thread_id",
+        "exception",
+        "yielded",
+        "capture",
+    ],
+    defaults=[None, None, None, None, None, None],
+)
+
+CallStats = namedtuple(
+    "CallStats",
+    [
+        "name",
+        "count",
+        "errors",
+        "total_ns",
+        "min_ns",
+        "max_ns",
+        "p50_ns",
+        "p95_ns",
+        "p99_ns",
+    ],
+)
+
+
+class DropPolicy:
+    """What a bounded TraceQueue does with new traces once it's full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
 
 
 class TraceQueue(Queue, metaclass=Singleton):
-    """An object capable of storing"""
+    """An object capable of storing method traces.
+
+    The queue is unbounded by default. Use `set_capacity` to keep long-running processes from
+    holding on to every traced call (and its arguments) forever.
+
+    Tracked methods `record` traces to a buffer owned by the calling thread, so they never contend
+    for a lock. The buffers are collected, in the order the traces were recorded, whenever the
+    queue is read.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._capacity = None
+        self._drop_policy = DropPolicy.DROP_OLDEST
+        self._dropped = 0
+
+        # Orders traces across threads. Cheaper than reading a clock, and never ties.
+        self._sequence = itertools.count()
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+
+    def _add_buffer(self) -> _ThreadBuffer:
+        """Creates the calling thread's buffer.
+
+        Returns:
+            The new buffer.
+        """
+        buffer = _ThreadBuffer(threading.current_thread())
+        with self._buffers_lock:
+            self._buffers.append(buffer)
+        self._local.buffer = buffer
+
+        return buffer
+
+    def _collect(self):
+        """Moves every thread's recorded traces to the queue, merged in the order they were recorded.
+
+        Note:
+            Must be called while holding the queue's mutex.
+        """
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+
+        # Take only what's there now. Owning threads may keep appending while this runs, and drop
+        # their oldest traces when full, so the buffer may run out early.
+        batches = []
+        for buffer in buffers:
+            traces = buffer.traces
+            batch = []
+            try:
+                for _ in range(len(traces)):
+                    batch.append(traces.popleft())
+            except IndexError:
+                pass
+            if batch:
+                batches.append(batch)
+
+        # Sequence numbers never tie, so traces themselves are never compared.
+        for _, trace in heapq.merge(*batches):
+            self._put(trace)
+
+        # Forget threads that have finished and have nothing left to collect.
+        with self._buffers_lock:
+            active = []
+            for buffer in self._buffers:
+                if buffer.thread.is_alive() or buffer.traces:
+                    active.append(buffer)
+                else:
+                    self._dropped += buffer.dropped
+            self._buffers = active
+
+    def _qsize(self) -> int:
+        """Returns the number of traces held, after collecting every thread's recorded traces.
+
+        Returns:
+            The number of traces held.
+
+        Note:
+            Called by `Queue` (i.e. `empty`, `qsize`, and `get`) while holding the queue's mutex.
+        """
+        self._collect()
+        return len(self.queue)
+
+    def _put(self, item: MethodTrace):
+        """Adds a trace, making room according to the drop policy if the queue is full.
+
+        Args:
+            item: the trace to add.
+
+        Note:
+            Called by `Queue.put` while holding the queue's mutex.
+        """
+        if (self._capacity is not None) and (len(self.queue) >= self._capacity):
+            self._dropped += 1
+            if self._drop_policy == DropPolicy.DROP_NEWEST:
+                return
+            self.queue.popleft()
+
+        self.queue.append(item)
+
+    def record(self, trace: MethodTrace):
+        """Adds a trace to the calling thread's buffer without taking any locks.
+
+        Args:
+            trace: the trace to add.
+
+        Note:
+            Each thread's buffer is bounded by the queue's capacity and drop policy too, so
+            up to `capacity` traces per thread may be held until the queue is next read.
+        """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._add_buffer()
+
+        traces = buffer.traces
+        capacity = self._capacity
+        if (capacity is not None) and (len(traces) >= capacity):
+            buffer.dropped += 1
+            if self._drop_policy == DropPolicy.DROP_NEWEST:
+                return
+
+            # A reader may have emptied the buffer in the meantime.
+            try:
+                traces.popleft()
+            except IndexError:
+                pass
+
+        traces.append((next(self._sequence), trace))
 
     def get(self) -> MethodTrace:
         """Returns the last trace.
@@ -27,18 +418,205 @@ class TraceQueue(Queue, metaclass=Singleton):
 
         return retval
 
+    def drain(self) -> deque[MethodTrace]:
+        """Removes and returns every trace at once.
+
+        Returns:
+            The traces, oldest first.
+
+        Note:
+            The queue's storage is swapped out rather than copied, so this takes the same time
+            regardless of how many traces are held (beyond collecting those still in thread buffers).
+        """
+        with self.mutex:
+            self._collect()
+            traces, self.queue = self.queue, deque()
+            self.unfinished_tasks = 0
+
+        return traces
+
+    def snapshot(self) -> tuple[MethodTrace, ...]:
+        """Returns every trace without removing them.
+
+        Returns:
+            The traces, oldest first.
+
+        Note:
+            The traces are copied in a single step while holding the queue's mutex.
+        """
+        with self.mutex:
+            self._collect()
+            return tuple(self.queue)
+
     def clear(self):
         """Removes all MethodTraces from memory."""
         _logger.debug("Clearing trace queue.")
-        while not self.empty():
-            _ = self.get()
+        self.drain()
+
+    def get_capacity(self) -> Optional[int]:
+        """Returns the maximum number of traces held at once.
+
+        Returns:
+            The capacity of the queue, or None if it's unbounded.
+        """
+        return self._capacity
+
+    def get_drop_policy(self) -> str:
+        """Returns what the queue does with new traces once it's full.
+
+        Returns:
+            The current DropPolicy.
+        """
+        return self._drop_policy
+
+    def get_dropped_count(self) -> int:
+        """Returns the number of traces dropped because the queue was full.
+
+        Returns:
+            The number of dropped traces since the queue was created.
+        """
+        with self._buffers_lock:
+            return self._dropped + sum(buffer.dropped for buffer in self._buffers)
+
+    def set_capacity(
+        self, capacity: Optional[int], drop_policy: str = DropPolicy.DROP_OLDEST
+    ) -> bool:
+        """Bounds the number of traces held at once.
+
+        Args:
+            capacity: the maximum number of traces to hold. None removes the bound.
+            drop_policy: what to do with new traces once the queue is full. Defaults to dropping
+                the oldest trace.
+
+        Returns:
+            True if the capacity and drop policy were set; False otherwise.
+
+        Note:
+            Should the queue already hold more traces than the new capacity, traces are dropped
+            according to the new drop policy.
+        """
+        if (capacity is not None) and (
+            (not isinstance(capacity, int)) or (capacity < 1)
+        ):
+            _logger.warning(
+                f"Capacity {capacity} is not a positive integer. Keeping current capacity: {self._capacity}"
+            )
+            return False
+
+        if drop_policy not in (DropPolicy.DROP_OLDEST, DropPolicy.DROP_NEWEST):
+            _logger.warning(
+                f"Unknown drop policy {drop_policy}. Keeping current drop policy: {self._drop_policy}"
+            )
+            return False
+
+        with self.mutex:
+            self._collect()
+            self._capacity = capacity
+            self._drop_policy = drop_policy
+
+            while (capacity is not None) and (len(self.queue) > capacity):
+                if drop_policy == DropPolicy.DROP_NEWEST:
+                    self.queue.pop()
+                else:
+                    self.queue.popleft()
+                self._dropped += 1
+
+        return True
+
 
+class TraceStats(metaclass=Singleton):
+    """Aggregates the duration of calls to tracked methods without storing each trace.
 
-def track(to_track: Callable) -> Callable:
+    Methods are tracked by their qualified name. Only methods tracked with `aggregate=True`
+    are counted.
+    """
+
+    def __init__(self):
+        self._functions: dict[str, _FunctionStats] = {}
+
+    def add(self, name: str, duration_ns: int, failed: bool = False):
+        """Records a single call.
+
+        Args:
+            name: the name of the called method.
+            duration_ns: how long the call took.
+            failed: whether the call raised an exception. Defaults to False.
+        """
+        with self._lock:
+            stats = self._functions.get(name, None)
+            if stats is None:
+                stats = self._functions[name] = _FunctionStats()
+            stats.add(duration_ns, failed)
+
+    def get(self, name: str) -> Optional[CallStats]:
+        """Returns the statistics for a single method.
+
+        Args:
+            name: the qualified name of the method.
+
+        Returns:
+            The method's call count, error count, and timing statistics in nanoseconds. None
+            if the method hasn't been called.
+        """
+        with self._lock:
+            stats = self._functions.get(name, None)
+            if stats is None:
+                return None
+
+            return CallStats(
+                name=name,
+                count=stats.count,
+                errors=stats.errors,
+                total_ns=stats.total_ns,
+                min_ns=stats.min_ns,
+                max_ns=stats.max_ns,
+                p50_ns=stats.percentile(0.50),
+                p95_ns=stats.percentile(0.95),
+                p99_ns=stats.percentile(0.99),
+            )
+
+    def summary(self) -> dict[str, CallStats]:
+        """Returns the statistics for every method called so far.
+
+        Returns:
+            The statistics for each method, by qualified name.
+        """
+        with self._lock:
+            names = list(self._functions)
+
+        return {name: self.get(name) for name in names}
+
+    def clear(self):
+        """Discards all statistics."""
+        _logger.debug("Clearing trace statistics.")
+        with self._lock:
+            self._functions = {}
+
+
+def track(
+    to_track: Callable = None,
+    *,
+    timed: bool = False,
+    aggregate: bool = False,
+    keep_traces: bool = True,
+    capture: Union[str, Callable[[Any], Any]] = CapturePolicy.FULL,
+    max_repr_len: int = 80,
+) -> Callable:
     """Records method call for later examination.
 
     Args:
         to_track : the method to track.
+        timed: whether to record when each call started, how long it took, and the calling thread.
+            Defaults to False.
+        aggregate: whether to add the duration of each call to the TraceStats. Implies `timed`.
+            Defaults to False.
+        keep_traces: whether to store each call in the TraceQueue. Defaults to True.
+        capture: what to store of each argument and the return value: a CapturePolicy or a method that
+            returns what to store for a value. Defaults to CapturePolicy.FULL.
+        max_repr_len: the maximum length of each repr under CapturePolicy.REPR. Defaults to 80.
+
+    Raises:
+        TrackError: if the capture policy is unknown.
 
     Returns:
         The passed method with minor modification pre and post-call
@@ -51,25 +629,214 @@ def track(to_track: Callable) -> Callable:
         def print_copy(*args):
             ...
 
+        @track(aggregate=True, keep_traces=False)
+        def handle_request(request):
+            ...
+
         Or like a regular method:
 
         print_copy = track(to_track=print_copy)
 
+        Calls that raise are recorded too, with the exception, before it's re-raised. The exception
+        holds on to its traceback, so consider bounding the TraceQueue when tracking calls that fail often.
+        Calls that never finish are recorded the same way, so they count as failures in the TraceStats:
+        cancelled coroutines (asyncio.CancelledError), interrupted calls (i.e. KeyboardInterrupt), and
+        generators closed before they're exhausted (GeneratorExit).
+
+        By default, traces hold strong references to every argument and return value. Use another capture
+        policy for methods passed large objects. Each trace notes the policy (or method) it was captured
+        under in `capture`. Debug messages are only formatted should they be emitted.
+
+        Coroutine functions, generators, and async generators are traced from when they start running until
+        they finish, are exhausted, or are closed. Their traces hold the final result (a generator's return
+        value) and every item yielded, under the capture policy.
     """
 
-    def wrapper(*args, **kwargs):
-        """Forward all method parameters to wrapped method."""
+    # Allow use as a decorator with arguments.
+    if to_track is None:
+        return lambda to_track: track(
+            to_track,
+            timed=timed,
+            aggregate=aggregate,
+            keep_traces=keep_traces,
+            capture=capture,
+            max_repr_len=max_repr_len,
+        )
+
+    timed = timed or aggregate
+    name = to_track.__name__
+    stats_name = to_track.__qualname__
+    capture_value = _capturer(capture, max_repr_len)
+    capture_nothing = capture == CapturePolicy.NONE
+
+    def capture_args(args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+        """Captures the arguments of a call according to the capture policy and logs them."""
+        if capture_nothing:
+            captured_args, captured_kwargs = (), {}
+        elif capture_value:
+            captured_args = tuple(map(capture_value, args))
+            captured_kwargs = {
+                key: capture_value(value) for key, value in kwargs.items()
+            }
+        else:
+            captured_args, captured_kwargs = args, kwargs
+
         _logger.debug(
-            f"Traced method: {to_track.__name__}, Args: {args}, Keyword Args: {kwargs}"
+            "Traced method: %s, Args: %s, Keyword Args: %s",
+            name,
+            captured_args,
+            captured_kwargs,
         )
+        return captured_args, captured_kwargs
+
+    def capture_result(value: Any) -> Any:
+        """Captures a return value or yielded item according to the capture policy."""
+        if capture_nothing:
+            return None
+        return capture_value(value) if capture_value else value
+
+    def finish(
+        captured_args: tuple,
+        captured_kwargs: dict,
+        start_ns: Optional[int],
+        retval: Any,
+        exception: Optional[BaseException],
+        yielded: Optional[list] = None,
+    ):
+        """Records a finished call."""
+        duration_ns = (time.perf_counter_ns() - start_ns) if timed else None
+
+        if aggregate:
+            _shared(TraceStats).add(
+                stats_name, duration_ns, failed=exception is not None
+            )
+
+        captured_retval = capture_result(retval) if exception is None else None
+        if keep_traces:
+            _shared(TraceQueue).record(
+                MethodTrace(
+                    name=name,
+                    args=captured_args,
+                    kwargs=captured_kwargs,
+                    retval=captured_retval,
+                    start_ns=start_ns,
+                    duration_ns=duration_ns,
+                    thread_id=threading.get_ident() if timed else None,
+                    exception=exception,
+                    yielded=None if yielded is None else tuple(yielded),
+                    capture=capture,
+                )
+            )
+
+        _logger.debug("Method returned. Return value: %s", captured_retval)
+
+    @functools.wraps(to_track)
+    def wrapper(*args, **kwargs):
+        """Forward all method parameters to wrapped method."""
+        captured = capture_args(args, kwargs)
+        retval = None
+        exception = None
+        start_ns = time.perf_counter_ns() if timed else None
 
         # Call method and store in queue.
-        retval = to_track(*args, **kwargs)
-        TraceQueue().put(
-            MethodTrace(name=to_track.__name__, args=args, kwargs=kwargs, retval=retval)
-        )
+        try:
+            retval = to_track(*args, **kwargs)
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            finish(*captured, start_ns, retval, exception)
+
+        return retval
+
+    @functools.wraps(to_track)
+    async def coroutine_wrapper(*args, **kwargs):
+        """Forward all method parameters to wrapped coroutine, tracing it until it finishes."""
+        captured = capture_args(args, kwargs)
+        retval = None
+        exception = None
+        start_ns = time.perf_counter_ns() if timed else None
+
+        try:
+            retval = await to_track(*args, **kwargs)
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            finish(*captured, start_ns, retval, exception)
 
-        _logger.debug(f"Method returned. Return value: {retval}")
         return retval
 
+    @functools.wraps(to_track)
+    def generator_wrapper(*args, **kwargs):
+        """Forward all method parameters to wrapped generator, tracing it until it's exhausted or closed."""
+        captured = capture_args(args, kwargs)
+        retval = None
+        exception = None
+        yielded = []
+        start_ns = time.perf_counter_ns() if timed else None
+
+        # Pass along values sent to and exceptions thrown into this generator, like `yield from` would.
+        generator = to_track(*args, **kwargs)
+        try:
+            item = generator.send(None)
+            while True:
+                if not capture_nothing:
+                    yielded.append(capture_result(item))
+                try:
+                    sent = yield item
+                except GeneratorExit:
+                    generator.close()
+                    raise
+                except BaseException as e:
+                    item = generator.throw(e)
+                else:
+                    item = generator.send(sent)
+        except StopIteration as stop:
+            retval = stop.value
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            finish(*captured, start_ns, retval, exception, yielded)
+
+        return retval
+
+    @functools.wraps(to_track)
+    async def async_generator_wrapper(*args, **kwargs):
+        """Forward all method parameters to wrapped async generator, tracing it until it's exhausted or closed."""
+        captured = capture_args(args, kwargs)
+        exception = None
+        yielded = []
+        start_ns = time.perf_counter_ns() if timed else None
+
+        generator = to_track(*args, **kwargs)
+        try:
+            item = await generator.asend(None)
+            while True:
+                if not capture_nothing:
+                    yielded.append(capture_result(item))
+                try:
+                    sent = yield item
+                except GeneratorExit:
+                    await generator.aclose()
+                    raise
+                except BaseException as e:
+                    item = await generator.athrow(e)
+                else:
+                    item = await generator.asend(sent)
+        except StopAsyncIteration:
+            pass
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            finish(*captured, start_ns, None, exception, yielded)
+
+    if inspect.iscoroutinefunction(to_track):
+        return coroutine_wrapper
+    if inspect.isasyncgenfunction(to_track):
+        return async_generator_wrapper
+    if inspect.isgeneratorfunction(to_track):
+        return generator_wrapper
     return wrapper
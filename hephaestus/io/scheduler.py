@@ -0,0 +1,340 @@
+import logging
+import os
+import time
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from hephaestus.common.exceptions import LoggedException
+from hephaestus.io.logging import get_logger
+from hephaestus.io.subprocess import OutputBatchOptions, run_command
+
+_logger = get_logger(__name__)
+
+
+##
+# Private
+##
+_Node = namedtuple(
+    "_Node", ["name", "cmd", "depends_on", "err", "cleanup", "log_level", "kwargs"]
+)
+
+
+def _run_node(
+    node: _Node, batch_output: Optional[OutputBatchOptions]
+) -> tuple[float, float, Optional[Exception]]:
+    """Runs a single node's command.
+
+    Args:
+        node: the node to run.
+        batch_output: the options for logging output in blocks.
+
+    Returns:
+        The times the command started and finished running, according to time.perf_counter, and
+        the exception raised by the command, if any.
+    """
+    start = time.perf_counter()
+    try:
+        run_command(
+            node.cmd,
+            err=node.err,
+            cleanup=node.cleanup,
+            log_level=node.log_level,
+            batch_output=batch_output,
+            **node.kwargs,
+        )
+    except Exception as e:
+        return start, time.perf_counter(), e
+
+    return start, time.perf_counter(), None
+
+
+##
+# Public
+##
+class SchedulerError(LoggedException):
+    """Indicates a command graph is not valid."""
+
+    pass
+
+
+class NodeStatus:
+    """The states a node in a command graph can end up in."""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+NodeResult = namedtuple(
+    "NodeResult", ["name", "status", "start_secs", "duration_secs", "error"]
+)
+
+
+class GraphReport:
+    """The outcome of running a command graph.
+
+    Each NodeResult's `start_secs` is relative to the start of the graph. Cancelled nodes
+    never start; their start and duration are both 0.
+
+    Args:
+        results: the result of each node, by name.
+        dependencies: the names of the nodes each node depends on, by name.
+        duration_secs: the wall-clock time it took to run the whole graph.
+    """
+
+    def __init__(
+        self,
+        results: dict[str, NodeResult],
+        dependencies: dict[str, list[str]],
+        duration_secs: float,
+    ):
+        self.results = results
+        self.duration_secs = duration_secs
+        self.critical_path = self._find_critical_path(dependencies)
+
+    @property
+    def successful(self) -> bool:
+        """Whether every node succeeded."""
+        return all(
+            result.status == NodeStatus.SUCCEEDED for result in self.results.values()
+        )
+
+    @property
+    def critical_path_secs(self) -> float:
+        """The combined duration of every node on the critical path."""
+        return sum(self.results[name].duration_secs for name in self.critical_path)
+
+    def _find_critical_path(self, dependencies: dict[str, list[str]]) -> list[str]:
+        """Finds the chain of dependent nodes with the longest combined duration.
+
+        Args:
+            dependencies: the names of the nodes each node depends on, by name.
+
+        Returns:
+            The names of the nodes on the critical path, in execution order.
+        """
+        longest: dict[str, tuple[float, Optional[str]]] = {}
+
+        def visit(name: str) -> float:
+            if name not in longest:
+                # Recursion depth is bound by the depth of the graph.
+                previous = max(dependencies[name], key=visit, default=None)
+                longest[name] = (
+                    self.results[name].duration_secs
+                    + (longest[previous][0] if previous is not None else 0.0),
+                    previous,
+                )
+            return longest[name][0]
+
+        end = max(self.results, key=visit, default=None)
+
+        path = []
+        while end is not None:
+            path.append(end)
+            end = longest[end][1]
+
+        return path[::-1]
+
+    def log_summary(self, log_level: int = logging.INFO):
+        """Logs the timing breakdown of each node and the critical path.
+
+        Args:
+            log_level: the level to log the summary at. Defaults to INFO.
+        """
+        _logger.log(
+            level=log_level, msg=f"Graph finished in {self.duration_secs:.3f}s."
+        )
+        for result in sorted(self.results.values(), key=lambda r: r.start_secs):
+            _logger.log(
+                level=log_level,
+                msg=f"\t{result.name}: {result.status}, started at {result.start_secs:.3f}s, took {result.duration_secs:.3f}s",
+            )
+        _logger.log(
+            level=log_level,
+            msg=f"Critical path ({self.critical_path_secs:.3f}s): {' -> '.join(self.critical_path)}",
+        )
+
+
+class CommandGraph:
+    """Runs commands in parallel while respecting the dependencies between them.
+
+    A node only runs once all of its dependencies have succeeded. Should a node fail,
+    every node that depends on it, directly or not, is cancelled.
+
+    Example:
+        graph = CommandGraph()
+        graph.add("configure", ["cmake", "-B", "build"])
+        graph.add("lib", ["cmake", "--build", "build", "-t", "lib"], depends_on=["configure"])
+        graph.add("docs", ["scripts/generate_documentation"])
+        report = graph.run()
+    """
+
+    def __init__(self):
+        self._nodes: dict[str, _Node] = {}
+
+    def add(
+        self,
+        name: str,
+        cmd: list[Any],
+        depends_on: Optional[list[str]] = None,
+        err: Optional[str] = None,
+        cleanup: Callable = None,
+        log_level: int = logging.DEBUG,
+        **kwargs,
+    ):
+        """Adds a command to the graph.
+
+        Args:
+            name: the unique name of the node.
+            cmd: the command to run.
+            depends_on: the names of the nodes that must succeed before this one runs. Defaults to None.
+            err: the error to display if the command fails. Defaults to None (a generic message).
+            cleanup: the method to run in the event of a failure. Defaults to None.
+            log_level: the level to log cmd output at. Defaults to DEBUG.
+
+        Raises:
+            SchedulerError: if a node with the same name was already added.
+
+        Note:
+            Any other keyword arguments are passed along to `run_command`.
+        """
+        if name in self._nodes:
+            raise SchedulerError(f"Node '{name}' has already been added.")
+
+        self._nodes[name] = _Node(
+            name=name,
+            cmd=cmd,
+            # Repeats would be counted more than once when validating the graph.
+            depends_on=list(dict.fromkeys(depends_on)) if depends_on else [],
+            err=err if err else f"Node '{name}' failed.",
+            cleanup=cleanup,
+            log_level=log_level,
+            kwargs=kwargs,
+        )
+
+    def _validate(self):
+        """Ensures every dependency exists and the graph has no cycles.
+
+        Raises:
+            SchedulerError: if the graph is not valid.
+        """
+        for node in self._nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self._nodes:
+                    raise SchedulerError(
+                        f"Node '{node.name}' depends on unknown node '{dependency}'."
+                    )
+
+        # Kahn's algorithm: anything left unvisited is part of a cycle.
+        remaining = {name: len(node.depends_on) for name, node in self._nodes.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        while ready:
+            name = ready.pop()
+            del remaining[name]
+            for node in self._nodes.values():
+                if name in node.depends_on:
+                    remaining[node.name] -= 1
+                    if remaining[node.name] == 0:
+                        ready.append(node.name)
+
+        if remaining:
+            raise SchedulerError(
+                f"Graph contains a dependency cycle involving: {', '.join(sorted(remaining))}."
+            )
+
+    def run(
+        self,
+        max_workers: Optional[int] = None,
+        batch_output: Optional[OutputBatchOptions] = OutputBatchOptions(),
+    ) -> GraphReport:
+        """Runs every node in the graph.
+
+        Args:
+            max_workers: the maximum number of commands to run at once. Defaults to None (the number of CPUs).
+            batch_output: the options for logging output in blocks. Batching keeps the output of concurrently
+                running commands from interleaving. Defaults to the default OutputBatchOptions.
+
+        Raises:
+            SchedulerError: if the graph is not valid.
+
+        Returns:
+            The result of each node, the critical path, and timing information.
+        """
+        self._validate()
+
+        if not max_workers:
+            max_workers = os.cpu_count() or 1
+
+        dependents: dict[str, list[str]] = {name: [] for name in self._nodes}
+        for node in self._nodes.values():
+            for dependency in node.depends_on:
+                dependents[dependency].append(node.name)
+
+        waiting_on = {name: set(node.depends_on) for name, node in self._nodes.items()}
+        results: dict[str, NodeResult] = {}
+
+        def cancel_dependents(name: str):
+            for dependent in dependents[name]:
+                if dependent not in results:
+                    _logger.warning(
+                        f"Cancelling node '{dependent}': dependency '{name}' did not succeed."
+                    )
+                    results[dependent] = NodeResult(
+                        name=dependent,
+                        status=NodeStatus.CANCELLED,
+                        start_secs=0.0,
+                        duration_secs=0.0,
+                        error=None,
+                    )
+                    cancel_dependents(dependent)
+
+        _logger.debug(
+            f"Running {len(self._nodes)} nodes with up to {max_workers} workers."
+        )
+        graph_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running: dict[Future, str] = {}
+
+            def submit_ready():
+                for name, pending in waiting_on.items():
+                    if (
+                        (not pending)
+                        and (name not in results)
+                        and (name not in running.values())
+                    ):
+                        running[
+                            executor.submit(_run_node, self._nodes[name], batch_output)
+                        ] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    start, end, error = future.result()
+                    results[name] = NodeResult(
+                        name=name,
+                        status=NodeStatus.FAILED if error else NodeStatus.SUCCEEDED,
+                        start_secs=start - graph_start,
+                        duration_secs=end - start,
+                        error=error,
+                    )
+
+                    if error:
+                        cancel_dependents(name)
+                    else:
+                        for dependent in dependents[name]:
+                            waiting_on[dependent].discard(name)
+
+                submit_ready()
+
+        report = GraphReport(
+            results=results,
+            dependencies={name: node.depends_on for name, node in self._nodes.items()},
+            duration_secs=time.perf_counter() - graph_start,
+        )
+        report.log_summary(log_level=logging.DEBUG)
+
+        return report
@@ -1,7 +1,11 @@
 import logging
+import os
+import shutil
+import signal
 import subprocess
+import threading
 
-from typing import Any, Callable
+from typing import Any, Callable, Optional, TextIO
 
 from hephaestus.common.exceptions import LoggedException, _InternalError
 from hephaestus.io.logging import get_logger
@@ -9,15 +13,328 @@ from hephaestus.io.logging import get_logger
 _logger = get_logger(__name__)
 
 
+class LaunchBackend:
+    """Methods available for launching subprocesses."""
+
+    POPEN = "popen"
+    POSIX_SPAWN = "posix_spawn"
+
+
+# Arguments that `_exec` always overwrites, so they never influence which backend is used.
+_OVERWRITTEN_KWARGS = {"stdout", "stderr", "bufsize", "universal_newlines"}
+
+# Arguments the posix_spawn backend can honor. Anything else falls back to Popen.
+_SPAWN_COMPATIBLE_KWARGS = {"env", "close_fds"}
+
+# Signals Python ignores that Popen (via `restore_signals`) resets to their defaults in the child.
+_RESTORED_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ")
+    if hasattr(signal, name)
+)
+
+_posix_spawn_available = hasattr(os, "posix_spawn")
+_launch_backend = (
+    LaunchBackend.POSIX_SPAWN if _posix_spawn_available else LaunchBackend.POPEN
+)
+
+
+class OutputBatchOptions:
+    """Options for logging captured command output in blocks rather than line-by-line.
+
+    A block is logged as a single, multi-line record once any limit is reached or the command exits.
+
+    Args:
+        max_lines: the maximum number of lines to hold before logging them.
+        max_delay_ms: the maximum time, in milliseconds, to hold a line before logging it.
+    """
+
+    DEFAULT_MAX_LINES = 100
+    DEFAULT_MAX_DELAY_MS = 250
+
+    def __init__(
+        self,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_delay_ms: int = DEFAULT_MAX_DELAY_MS,
+    ):
+        self.max_lines = max_lines
+        self.max_delay_ms = max_delay_ms
+
+
 class _SubprocessError(Exception):
     pass
 
 
+class _PipelineError(_SubprocessError):
+    """Indicates at least one stage of a pipeline failed, or that there were no stages to run.
+
+    Args:
+        failures: the index, command, and return code of each failed stage. Empty if there were no stages.
+    """
+
+    def __init__(self, failures: list[tuple[int, str, int]]):
+        self.failures = failures
+        super().__init__(failures)
+
+
+class _OutputBatcher:
+    """Coalesces lines of command output into blocks before logging them.
+
+    Each block is logged as one record tagged with the command so output from
+    concurrently running commands stays readable.
+
+    Note:
+        Can be used as a context manager. Any held lines are logged on exit.
+    """
+
+    def __init__(self, cmd: str, log_level: int, options: OutputBatchOptions):
+        """
+        Args:
+            cmd: the command that produces the output.
+            log_level: the level to log blocks at.
+            options: the limits that trigger logging a block.
+        """
+        self._cmd = cmd
+        self._log_level = log_level
+        self._max_lines = max(options.max_lines, 1)
+        self._max_delay_secs = options.max_delay_ms / 1000
+        self._lock = threading.Lock()
+        self._lines: list[str] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, line: str):
+        """Holds a line of output, logging the current block if it's full.
+
+        Args:
+            line: the line to hold.
+        """
+        with self._lock:
+            self._lines.append(line)
+
+            if len(self._lines) >= self._max_lines:
+                self._flush()
+
+            # Make sure the first line of every block isn't held forever.
+            elif self._timer is None:
+                self._timer = threading.Timer(
+                    interval=self._max_delay_secs, function=self.flush
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Logs any held lines as a single record."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """Logs any held lines as a single record. The caller must hold the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._lines:
+            return
+
+        block = "\n".join(self._lines)
+        self._lines = []
+        _logger.log(
+            level=self._log_level,
+            msg=f"Cmd Output (`{self._cmd}`):\n{block}",
+            extra={"cmd": self._cmd},
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.flush()
+
+
+class _ExecutableCache:
+    """Caches the resolved location of executables for the current search path.
+
+    The entire cache is invalidated whenever the search path (i.e. `PATH`) changes.
+    Only successful lookups are cached so newly installed programs are always found.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._search_path = None
+        self._entries: dict[str, str] = {}
+
+    def resolve(self, name: str, env: Optional[dict] = None) -> Optional[str]:
+        """Locates an executable the same way Popen would.
+
+        Args:
+            name: the name of, or path to, the executable.
+            env: the environment the executable will run in. Defaults to None (os.environ).
+
+        Returns:
+            The path to the executable if found; None otherwise.
+        """
+
+        # Names containing a directory aren't looked up in `PATH`.
+        if os.path.dirname(name):
+            return name
+
+        search_path = os.pathsep.join(os.get_exec_path(env))
+        with self._lock:
+            if search_path != self._search_path:
+                self._entries.clear()
+                self._search_path = search_path
+            executable = self._entries.get(name, None)
+
+        if executable:
+            return executable
+
+        executable = shutil.which(name, path=search_path)
+        if executable:
+            with self._lock:
+                if search_path == self._search_path:
+                    self._entries[name] = executable
+
+        return executable
+
+    def discard(self, name: str):
+        """Removes a single executable from the cache.
+
+        Args:
+            name: the name of the executable.
+        """
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def clear(self):
+        """Removes all cached executable locations."""
+        with self._lock:
+            self._entries.clear()
+            self._search_path = None
+
+
+_executable_cache = _ExecutableCache()
+
+
+def _can_spawn(args: tuple, kwargs: dict) -> bool:
+    """Checks whether a command can be launched via posix_spawn.
+
+    Args:
+        args: the positional arguments meant for Popen.
+        kwargs: the keyword arguments meant for Popen.
+
+    Returns:
+        True if the posix_spawn backend is selected, `close_fds=False` was passed, and every other
+        argument can be honored; False otherwise.
+    """
+    if (_launch_backend != LaunchBackend.POSIX_SPAWN) or args:
+        return False
+
+    # posix_spawn can't sweep inheritable descriptors, which Popen does by default. Only honor an
+    # explicit request to leave them open, like CPython's own posix_spawn fast path.
+    if kwargs.get("close_fds", True):
+        return False
+
+    return all(
+        (key in _OVERWRITTEN_KWARGS) or (key in _SPAWN_COMPATIBLE_KWARGS)
+        for key in kwargs
+    )
+
+
+def _spawn(cmd: list[str], env: Optional[dict] = None) -> Optional[tuple[int, TextIO]]:
+    """Launches a command via posix_spawn with stdout and stderr piped back to the caller.
+
+    Args:
+        cmd: the command to run.
+        env: the environment to run the command in. Defaults to None (os.environ).
+
+    Returns:
+        The id of the spawned process and a text stream of its combined output. None if the executable
+        could not be resolved and the caller should fall back to Popen.
+    """
+    executable = _executable_cache.resolve(cmd[0], env)
+    if not executable:
+        return None
+
+    # Both ends of the pipe are non-inheritable; dup2 clears that flag on the child's copies only.
+    read_fd, write_fd = os.pipe()
+    file_actions = [
+        (os.POSIX_SPAWN_DUP2, write_fd, 1),
+        (os.POSIX_SPAWN_DUP2, write_fd, 2),
+    ]
+
+    try:
+        pid = os.posix_spawn(
+            executable,
+            cmd,
+            os.environ if env is None else env,
+            file_actions=file_actions,
+            setsigdef=_RESTORED_SIGNALS,
+        )
+
+    # The cached location may have gone stale. Let Popen have the final say.
+    except FileNotFoundError:
+        _executable_cache.discard(cmd[0])
+        os.close(read_fd)
+        return None
+
+    except Exception:
+        os.close(read_fd)
+        raise
+
+    finally:
+        os.close(write_fd)
+
+    # Make line endings OS-agnostic, just like `universal_newlines`.
+    return pid, open(read_fd, mode="r", newline=None)
+
+
+def _capture(
+    stream: TextIO,
+    enable_output: bool,
+    log_level: int,
+    cmd: str,
+    batch_output: Optional[OutputBatchOptions] = None,
+) -> list[str]:
+    """Reads a command's output line-by-line, logging it as specified.
+
+    Args:
+        stream: the text stream containing the command's output.
+        enable_output: whether to log captured output.
+        log_level: the level to log cmd output at. Ignored if enable_output set to False.
+        cmd: the command that produces the output, as it should be logged.
+        batch_output: the options for logging output in blocks. Defaults to None (log line-by-line).
+
+    Returns:
+        The output of the cmd as captured line-by-line.
+    """
+    cmd_output = []
+
+    # The performance might matter enough here to repeat myself :(.
+    if enable_output and batch_output:
+        with _OutputBatcher(cmd, log_level, batch_output) as batcher:
+            for line in stream:
+                line = line.strip()
+                cmd_output.append(line)
+                batcher.add(line)
+    elif enable_output:
+        _logger.log(level=log_level, msg="Cmd Output:")
+        for line in stream:
+            line = line.strip()
+            cmd_output.append(line)
+            _logger.log(level=log_level, msg=line)
+    else:
+        for line in stream:
+            cmd_output.append(line.strip())
+
+    return cmd_output
+
+
 def _exec(
     cmd: list[Any],
     enable_output: bool = False,
     log_level: int = logging.DEBUG,
     *args,
+    batch_output: Optional[OutputBatchOptions] = None,
     **kwargs,
 ) -> list[str]:
     """Executes a command, logging results as specified.
@@ -26,6 +343,8 @@ def _exec(
         cmd: the command to run.
         enable_output: whether to log captured output.
         log_level: the level to log cmd output at. Ignored if enable_output set to False. Defaults to DEBUG.
+        batch_output: the options for logging output in blocks. Ignored if enable_output set to False.
+            Defaults to None (log line-by-line).
 
     Raises:
         _Subprocess_Error if the command fails after running.
@@ -39,11 +358,16 @@ def _exec(
         `stdout`, `stderr`, and `universal_newlines`.
 
         Users should only expect `enable_output` to change the behavior of what's actually output.
+
+        When the posix_spawn backend is selected and `close_fds=False` is passed, the command is
+        launched via `os.posix_spawn` unless an argument it can't honor is passed. See
+        `set_launch_backend` for details.
     """
 
     # Avoid any non-string shenanigans when printing/executing command.
     cmd = [str(arg) for arg in cmd]
-    _logger.debug(f"Running cmd: `{' '.join(cmd)}`")
+    cmd_str = " ".join(cmd)
+    _logger.debug(f"Running cmd: `{cmd_str}`")
 
     # Capture all output.
     kwargs["stdout"] = subprocess.PIPE
@@ -58,20 +382,28 @@ def _exec(
     try:
         cmd_output = []
         retcode = None
-        with subprocess.Popen(cmd, *args, **kwargs) as process:
-
-            # The performance might matter enough here to repeat myself :(.
-            if enable_output:
-                _logger.log(level=log_level, msg="Cmd Output:")
-                for line in process.stdout:
-                    line = line.strip()
-                    cmd_output.append(line)
-                    _logger.log(level=log_level, msg=line)
-            else:
-                for line in process.stdout:
-                    cmd_output.append(line.strip())
+        spawned = (
+            _spawn(cmd, env=kwargs.get("env", None))
+            if _can_spawn(args, kwargs)
+            else None
+        )
 
-            retcode = process.wait()
+        if spawned:
+            pid, stream = spawned
+            try:
+                with stream:
+                    cmd_output = _capture(
+                        stream, enable_output, log_level, cmd_str, batch_output
+                    )
+            finally:
+                # Always reap the child, even if capturing its output blew up.
+                retcode = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        else:
+            with subprocess.Popen(cmd, *args, **kwargs) as process:
+                cmd_output = _capture(
+                    process.stdout, enable_output, log_level, cmd_str, batch_output
+                )
+                retcode = process.wait()
 
     # Seriously bad juju here: the code is FUBAR, not the command. Log it.
     except Exception as e:
@@ -83,6 +415,104 @@ def _exec(
     return cmd_output
 
 
+def _exec_pipeline(
+    cmds: list[list[Any]],
+    enable_output: bool = False,
+    log_level: int = logging.DEBUG,
+    batch_output: Optional[OutputBatchOptions] = None,
+    **kwargs,
+) -> list[str]:
+    """Executes commands with the output of each feeding into the input of the next.
+
+    Args:
+        cmds: the commands to run, in order.
+        enable_output: whether to log captured output.
+        log_level: the level to log output at. Ignored if enable_output set to False. Defaults to DEBUG.
+        batch_output: the options for logging output in blocks. Ignored if enable_output set to False.
+            Defaults to None (log line-by-line).
+
+    Raises:
+        _PipelineError if no commands are passed or any stage fails after running.
+        Any other exception thrown means there was an issue in the Python runtime logic.
+
+    Returns:
+        The output of the final stage as captured line-by-line.
+
+    Notes:
+        Stages are connected by OS pipes; data passed between stages never enters the Python process.
+        Only the final stage's stdout is captured, along with the stderr of every stage.
+
+        Any keyword arguments are passed to every stage. `stdin` is only passed to the first stage.
+    """
+
+    if not cmds:
+        raise _PipelineError([])
+
+    # Avoid any non-string shenanigans when printing/executing commands.
+    cmds = [[str(arg) for arg in cmd] for cmd in cmds]
+    cmd_strs = [" ".join(cmd) for cmd in cmds]
+    pipeline_str = " | ".join(cmd_strs)
+    _logger.debug(f"Running pipeline: `{pipeline_str}`")
+
+    # Each stage's I/O is wired up below. Ignore anything passed for it.
+    for key in _OVERWRITTEN_KWARGS:
+        kwargs.pop(key, None)
+    stdin = kwargs.pop("stdin", None)
+
+    processes: list[subprocess.Popen] = []
+    try:
+        cmd_output = []
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, mode="r", newline=None) as stream:
+            try:
+                for index, cmd in enumerate(cmds):
+                    is_last = index == (len(cmds) - 1)
+                    process = subprocess.Popen(
+                        cmd,
+                        stdin=stdin,
+                        stdout=write_fd if is_last else subprocess.PIPE,
+                        stderr=write_fd,
+                        **kwargs,
+                    )
+                    processes.append(process)
+
+                    # The next stage holds its own copy of this stage's output now. Dropping ours
+                    # lets the stage see a broken pipe should the next stage exit early.
+                    if index > 0:
+                        stdin.close()
+                    stdin = process.stdout
+
+            # Only the children should hold the write end. Otherwise, we'll never see EOF.
+            finally:
+                os.close(write_fd)
+
+            cmd_output = _capture(
+                stream, enable_output, log_level, pipeline_str, batch_output
+            )
+
+        retcodes = [process.wait() for process in processes]
+
+    # Seriously bad juju here: the code is FUBAR, not the commands. Log it.
+    except Exception as e:
+        # Don't leave stages that already started running, or their output pipes open.
+        for process in processes:
+            if process.stdout:
+                process.stdout.close()
+            process.kill()
+            process.wait()
+        raise _InternalError(e)
+
+    failures = [
+        (index, cmd_strs[index], retcode)
+        for index, retcode in enumerate(retcodes)
+        if retcode != 0
+    ]
+    if failures:
+        raise _PipelineError(failures)
+
+    return cmd_output
+
+
 ##
 # Public
 ##
@@ -92,12 +522,30 @@ class SubprocessError(LoggedException):
     pass
 
 
-def command_successful(cmd: list[Any], cleanup: Callable = None):
+class PipelineError(SubprocessError):
+    """Indicates at least one stage of a pipeline failed.
+
+    The index, command, and return code of each failed stage is available via `failures`.
+    """
+
+    def __init__(self, msg: Any, failures: list[tuple[int, str, int]]):
+        """
+        Args:
+            msg: the error message to log.
+            failures: the index, command, and return code of each failed stage.
+        """
+        self.failures = failures
+        super().__init__(msg, stack_level=3)
+
+
+def command_successful(cmd: list[Any], cleanup: Callable = None, *args, **kwargs):
     """Checks if command returned 'Success' status.
 
     Args:
         cmd: the command to run.
         cleanup: the method to run in the event of a failure. Defaults to None.
+        *args: positional arguments passed through to the underlying launcher.
+        **kwargs: keyword arguments passed through to the underlying launcher (e.g. `close_fds=False`).
 
     Note:
         This method doesn't capture or return any command output.
@@ -107,7 +555,7 @@ def command_successful(cmd: list[Any], cleanup: Callable = None):
     success = True
 
     try:
-        _exec(cmd, enable_output=False) is not None
+        _exec(cmd, enable_output=False, *args, **kwargs) is not None
 
     # Execute cleanup on most exceptions, if available.
     except Exception as e:
@@ -130,6 +578,7 @@ def run_command(
     enable_output: bool = True,
     log_level: int = logging.DEBUG,
     *args,
+    batch_output: Optional[OutputBatchOptions] = None,
     **kwargs,
 ):
     """Runs command and logs output as specified.
@@ -140,6 +589,8 @@ def run_command(
         cleanup: the method to run in the event of a failure. Defaults to None.
         enable_output: whether to log captured output. Defaults to True.
         log_level: the level to log cmd output at. Ignored if enable_output set to False. Defaults to DEBUG.
+        batch_output: the options for logging output in blocks, one record per block. Ignored if
+            enable_output set to False. Defaults to None (one record per line).
 
     Raises:
         SubprocessError if the command fails to return a "success" status.
@@ -152,7 +603,12 @@ def run_command(
     """
     try:
         _ = _exec(
-            cmd, enable_output=enable_output, log_level=log_level, *args, **kwargs
+            cmd,
+            enable_output=enable_output,
+            log_level=log_level,
+            *args,
+            batch_output=batch_output,
+            **kwargs,
         )
 
     # Execute cleanup on most exceptions, if available.
@@ -205,3 +661,172 @@ def get_command_output(
         raise
 
     return output
+
+
+def _raise_pipeline_error(err: str, e: _PipelineError):
+    """Converts an internal pipeline failure into a public one, listing each failed stage.
+
+    Args:
+        err: the user provided error message.
+        e: the internal error.
+
+    Raises:
+        PipelineError always.
+    """
+    stages = "\n".join(
+        f"\tStage {index} (`{cmd}`) returned {retcode}."
+        for index, cmd, retcode in e.failures
+    )
+    if not e.failures:
+        stages = "\tThe pipeline has no stages."
+    raise PipelineError(f"{err}\n{stages}", failures=e.failures)
+
+
+def run_pipeline(
+    cmds: list[list[Any]],
+    err: str,
+    cleanup: Callable = None,
+    enable_output: bool = True,
+    log_level: int = logging.DEBUG,
+    batch_output: Optional[OutputBatchOptions] = None,
+    **kwargs,
+):
+    """Runs commands as a pipeline (i.e. `cmd1 | cmd2 | cmd3`) and logs the final output as specified.
+
+    Args:
+        cmds: the commands to run, in order.
+        err: the error to display if any command fails.
+        cleanup: the method to run in the event of a failure. Defaults to None.
+        enable_output: whether to log captured output. Defaults to True.
+        log_level: the level to log output at. Ignored if enable_output set to False. Defaults to DEBUG.
+        batch_output: the options for logging output in blocks, one record per block. Ignored if
+            enable_output set to False. Defaults to None (one record per line).
+
+    Raises:
+        PipelineError if no commands are passed or any stage fails to return a "success" status.
+
+    Notes:
+        Each stage's stdout is connected directly to the next stage's stdin by the OS. Only the
+        final stage's stdout (and every stage's stderr) is read by Python.
+
+        Like `set -o pipefail`, the pipeline fails if any stage fails. A stage killed by a broken pipe
+        because a later stage exited early reports a return code of -SIGPIPE.
+    """
+    try:
+        _ = _exec_pipeline(
+            cmds,
+            enable_output=enable_output,
+            log_level=log_level,
+            batch_output=batch_output,
+            **kwargs,
+        )
+
+    # Execute cleanup on most exceptions, if available.
+    except Exception as e:
+        if cleanup:
+            cleanup()
+
+        # Commands failed after running. Log user provided error message.
+        if isinstance(e, _PipelineError):
+            _raise_pipeline_error(err, e)
+
+        # Panic
+        raise
+
+
+def get_pipeline_output(
+    cmds: list[list[Any]],
+    err: str,
+    cleanup: Callable = None,
+    **kwargs,
+) -> list[str]:
+    """Runs commands as a pipeline (i.e. `cmd1 | cmd2 | cmd3`) and returns the final output.
+
+    Args:
+        cmds: the commands to run, in order.
+        err: the error to display if any command fails.
+        cleanup: the method to run in the event of a failure. Defaults to None.
+
+    Raises:
+        PipelineError if no commands are passed or any stage fails to return a "success" status.
+
+    Returns:
+        The output of the final stage as captured line-by-line.
+
+    Notes:
+        Output via logging is completely disabled here. It's up to the user to
+        log the pipeline's output.
+    """
+    try:
+        output = _exec_pipeline(cmds, enable_output=False, **kwargs)
+
+    # Execute cleanup on most exceptions, if available.
+    except Exception as e:
+        if cleanup:
+            cleanup()
+
+        # Commands failed after running. Log user provided error message.
+        if isinstance(e, _PipelineError):
+            _raise_pipeline_error(err, e)
+
+        # Panic
+        raise
+
+    return output
+
+
+def get_launch_backend() -> str:
+    """Returns the backend currently used to launch commands.
+
+    Returns:
+        One of the values defined in LaunchBackend.
+    """
+    return _launch_backend
+
+
+def set_launch_backend(backend: str) -> bool:
+    """Sets the backend used to launch commands.
+
+    Args:
+        backend: one of the values defined in LaunchBackend.
+
+    Returns:
+        True if the passed backend was set; False otherwise.
+
+    Note:
+        The posix_spawn backend avoids forking the (possibly very large) Python process and
+        the `close_fds` sweep that comes with Popen. It can't close inheritable file descriptors in the
+        child, so it's only used for commands that opt out of that sweep with `close_fds=False`, and
+        whose other arguments allow it: no positional Popen arguments and no keyword arguments besides
+        `env`. Everything else silently falls back to Popen.
+
+        Python creates descriptors as non-inheritable by default, so passing `close_fds=False` only
+        matters for descriptors explicitly marked inheritable.
+    """
+    global _launch_backend
+
+    if backend not in (LaunchBackend.POPEN, LaunchBackend.POSIX_SPAWN):
+        _logger.warning(
+            f"Unknown launch backend {str(backend)}. Keeping current launch backend: {_launch_backend}"
+        )
+        return False
+
+    if (backend == LaunchBackend.POSIX_SPAWN) and (not _posix_spawn_available):
+        _logger.warning(
+            f"posix_spawn is not available on this platform. Keeping current launch backend: {_launch_backend}"
+        )
+        return False
+
+    _launch_backend = backend
+    return True
+
+
+def clear_executable_cache():
+    """Forgets the location of every executable found by the posix_spawn backend.
+
+    Note:
+        The cache is already invalidated whenever `PATH` changes. This is only
+        necessary when programs are moved around within the same search path.
+    """
+    _logger.debug("Clearing executable cache.")
+    _executable_cache.clear()
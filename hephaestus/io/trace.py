@@ -0,0 +1,413 @@
+import csv
+import json
+import struct
+import threading
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+from hephaestus.common.exceptions import LoggedException
+from hephaestus.common.types import PathLike
+from hephaestus.decorators.track import (
+    CapturedValue,
+    MethodTrace,
+    TraceQueue,
+    TrackError,
+)
+from hephaestus.io.logging import get_logger
+
+_logger = get_logger(__name__)
+
+"""
+    Streams traces recorded by @track to disk and reads them back.
+
+    Trace files start with a short header, followed by one record per trace. Each record is its length
+    as a little-endian, unsigned 32-bit integer followed by:
+        - the start time, duration, and thread id as 64-bit integers (-1, -1, and 0 when not recorded).
+        - the length of each summary (name, args, kwargs, return value, exception) as 32-bit integers.
+        - each summary, UTF-8 encoded.
+"""
+
+##
+# Private
+##
+_MAGIC = b"HTRC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_LENGTH = struct.Struct("<I")
+_FIXED = struct.Struct("<qqQIIIII")
+
+_NO_TIME = -1
+_NO_THREAD = 0
+
+
+def _summarize(
+    value: Any, policy: Union[str, Callable[[Any], str]], max_len: int
+) -> str:
+    """Summarizes a value according to a summary policy.
+
+    Args:
+        value: the value to summarize.
+        policy: the SummaryPolicy or a method that returns the summary of a value.
+        max_len: the maximum length of a repr summary.
+
+    Returns:
+        The summary of the value.
+
+    Note:
+        Values already reduced by @track's capture policy (see `CapturedValue`) are summarized
+        by what was captured.
+    """
+    if callable(policy):
+        return policy(value)
+
+    if policy == SummaryPolicy.TYPES:
+        return (
+            value.type.__qualname__
+            if isinstance(value, CapturedValue)
+            else type(value).__qualname__
+        )
+
+    if policy == SummaryPolicy.REPR:
+        try:
+            summary = repr(value)
+        except Exception:
+            summary = f"<unrepresentable {type(value).__qualname__}>"
+        return summary if len(summary) <= max_len else f"{summary[:max_len - 3]}..."
+
+    return ""
+
+
+def _encode(
+    trace: MethodTrace, policy: Union[str, Callable[[Any], str]], max_len: int
+) -> bytes:
+    """Encodes a trace as a length-prefixed record.
+
+    Args:
+        trace: the trace to encode.
+        policy: how to summarize the arguments and return value.
+        max_len: the maximum length of a repr summary.
+
+    Returns:
+        The encoded record.
+    """
+    if policy == SummaryPolicy.NONE:
+        args = kwargs = retval = ""
+    else:
+        args = ", ".join(_summarize(arg, policy, max_len) for arg in trace.args)
+        kwargs = ", ".join(
+            f"{key}={_summarize(value, policy, max_len)}"
+            for key, value in trace.kwargs.items()
+        )
+        retval = _summarize(trace.retval, policy, max_len)
+
+    exception = (
+        f"{type(trace.exception).__qualname__}: {trace.exception}"
+        if trace.exception is not None
+        else ""
+    )
+
+    strings = [
+        string.encode("utf-8", errors="replace")
+        for string in (trace.name, args, kwargs, retval, exception)
+    ]
+    fixed = _FIXED.pack(
+        _NO_TIME if trace.start_ns is None else trace.start_ns,
+        _NO_TIME if trace.duration_ns is None else trace.duration_ns,
+        _NO_THREAD if trace.thread_id is None else trace.thread_id,
+        *(len(string) for string in strings),
+    )
+
+    payload_len = len(fixed) + sum(len(string) for string in strings)
+    return b"".join([_LENGTH.pack(payload_len), fixed, *strings])
+
+
+def _decode(payload: bytes) -> "ExportedTrace":
+    """Decodes the payload of a single record.
+
+    Args:
+        payload: the record, less its length prefix.
+
+    Returns:
+        The trace stored in the record.
+    """
+    start_ns, duration_ns, thread_id, *lengths = _FIXED.unpack_from(payload)
+
+    strings = []
+    offset = _FIXED.size
+    for length in lengths:
+        strings.append(payload[offset : offset + length].decode("utf-8"))
+        offset += length
+
+    name, args, kwargs, retval, exception = strings
+    return ExportedTrace(
+        name=name,
+        args=args,
+        kwargs=kwargs,
+        retval=retval,
+        start_ns=None if start_ns == _NO_TIME else start_ns,
+        duration_ns=None if duration_ns == _NO_TIME else duration_ns,
+        thread_id=None if thread_id == _NO_THREAD else thread_id,
+        exception=exception if exception else None,
+    )
+
+
+##
+# Public
+##
+class TraceFileError(LoggedException):
+    """Indicates a trace file could not be read."""
+
+    pass
+
+
+class TraceExportError(LoggedException):
+    """Indicates a TraceExporter stopped writing traces early."""
+
+    pass
+
+
+class SummaryPolicy:
+    """How the arguments and return value of a trace are summarized when exported."""
+
+    NONE = "none"
+    TYPES = "types"
+    REPR = "repr"
+
+
+ExportedTrace = namedtuple(
+    "ExportedTrace",
+    [
+        "name",
+        "args",
+        "kwargs",
+        "retval",
+        "start_ns",
+        "duration_ns",
+        "thread_id",
+        "exception",
+    ],
+)
+
+
+class TraceExporter:
+    """Streams traces from the TraceQueue to a file in the background.
+
+    Every `flush_interval_secs`, the writer thread drains the TraceQueue, encodes the traces, and
+    writes them in a single call. Tracked methods only pay their usual cost of recording a trace.
+
+    Args:
+        path: the file to write to. Parent folders are created as necessary; an existing file is replaced.
+        summary: how to summarize arguments and return values: a SummaryPolicy or a method that returns
+            the summary of a value. Defaults to SummaryPolicy.TYPES.
+        max_repr_len: the maximum length of each summary under SummaryPolicy.REPR. Defaults to 80.
+        flush_interval_secs: how often to write traces to disk. Defaults to 1.0.
+
+    Raises:
+        TrackError: if the summary policy is unknown.
+
+    Note:
+        The exporter drains the TraceQueue, so traces aren't available to other readers while it runs.
+        Bound the TraceQueue (see `TraceQueue.set_capacity`) to cap memory should the exporter fall behind.
+
+        Traces that can't be encoded (i.e. a custom summary method raised) are skipped with a warning
+        and counted in `skipped`. Should writing fail, the exporter stops and `stop` raises a
+        TraceExportError.
+
+        Use as a context manager to ensure every trace is written:
+
+        with TraceExporter("logs/traces.bin"):
+            ...
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        summary: Union[str, Callable[[Any], str]] = SummaryPolicy.TYPES,
+        max_repr_len: int = 80,
+        flush_interval_secs: float = 1.0,
+    ):
+        if not (
+            callable(summary)
+            or summary in (SummaryPolicy.NONE, SummaryPolicy.TYPES, SummaryPolicy.REPR)
+        ):
+            raise TrackError(f"Unknown summary policy: {summary}.")
+
+        self.path = Path(path).resolve()
+        self.written = 0
+        self.skipped = 0
+        self._summary = summary
+        self._max_repr_len = max_repr_len
+        self._flush_interval_secs = flush_interval_secs
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._error: Optional[Exception] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _write_batch(self, traces: list[MethodTrace]):
+        """Encodes traces and writes them with a single call.
+
+        Args:
+            traces: the traces to write.
+        """
+        records = []
+        error = None
+        for trace in traces:
+            try:
+                records.append(_encode(trace, self._summary, self._max_repr_len))
+            except Exception as e:
+                error = e
+
+        if error is not None:
+            skipped = len(traces) - len(records)
+            self.skipped += skipped
+            _logger.warning(
+                f"Skipped {skipped} traces that can't be encoded: {error!r}"
+            )
+
+        if not records:
+            return
+
+        self._file.write(b"".join(records))
+        self._file.flush()
+        self.written += len(records)
+
+    def _run(self):
+        """Writes traces until the exporter is stopped, then writes whatever's left.
+
+        Note:
+            Should writing fail, the error is kept for `stop` to raise.
+        """
+        try:
+            while not self._stop.wait(self._flush_interval_secs):
+                self._write_batch(TraceQueue().drain())
+            self._write_batch(TraceQueue().drain())
+        except Exception as e:
+            self._error = e
+            _logger.error(f"Stopped exporting traces to {str(self.path)}: {e!r}")
+
+    def start(self):
+        """Opens the file and starts writing traces in the background."""
+        if self._thread:
+            _logger.warning(f"Already exporting traces to {str(self.path)}.")
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, mode="wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        _logger.debug(f"Exporting traces to {str(self.path)}.")
+
+    def stop(self):
+        """Writes any remaining traces and closes the file.
+
+        Raises:
+            TraceExportError: if the exporter stopped early because writing failed.
+        """
+        if not self._thread:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        error, self._error = self._error, None
+        try:
+            self._file.close()
+        except Exception as e:
+            error = error or e
+        self._file = None
+
+        if error is not None:
+            raise TraceExportError(
+                f"Failed to export traces to {str(self.path)}: {error!r}"
+            ) from error
+        _logger.debug(f"Exported {self.written} traces to {str(self.path)}.")
+
+
+def read_traces(path: PathLike) -> Iterator[ExportedTrace]:
+    """Lazily reads the traces stored in a file created by a TraceExporter.
+
+    Args:
+        path: the file to read.
+
+    Raises:
+        TraceFileError: if the file is not a trace file or uses an unsupported version.
+
+    Yields:
+        Each trace, in the order it was written.
+
+    Note:
+        Should the file end with an incomplete record (i.e. the process exited mid-write),
+        reading stops there with a warning.
+    """
+    with open(path, mode="rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise TraceFileError(f"{str(path)} is not a trace file.")
+
+        magic, version = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise TraceFileError(f"{str(path)} is not a trace file.")
+        if version != _VERSION:
+            raise TraceFileError(f"Unsupported trace file version: {version}.")
+
+        while prefix := file.read(_LENGTH.size):
+            payload_len = 0 if len(prefix) < _LENGTH.size else _LENGTH.unpack(prefix)[0]
+            payload = file.read(payload_len)
+            if (not payload_len) or (len(payload) < payload_len):
+                _logger.warning(f"{str(path)} ends with an incomplete trace.")
+                return
+
+            yield _decode(payload)
+
+
+def traces_to_csv(path: PathLike, output: PathLike) -> int:
+    """Converts a trace file to CSV, one row per trace.
+
+    Args:
+        path: the trace file to read.
+        output: the CSV file to write.
+
+    Returns:
+        The number of traces converted.
+    """
+    count = 0
+    with open(output, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(ExportedTrace._fields)
+        for trace in read_traces(path):
+            writer.writerow(trace)
+            count += 1
+
+    return count
+
+
+def traces_to_json(path: PathLike, output: PathLike) -> int:
+    """Converts a trace file to JSON Lines, one object per trace.
+
+    Args:
+        path: the trace file to read.
+        output: the JSON Lines file to write.
+
+    Returns:
+        The number of traces converted.
+    """
+    count = 0
+    with open(output, mode="w") as file:
+        for trace in read_traces(path):
+            file.write(json.dumps(trace._asdict()) + "\n")
+            count += 1
+
+    return count
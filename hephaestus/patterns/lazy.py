@@ -0,0 +1,190 @@
+import inspect
+import threading
+import time
+import weakref
+
+from typing import Any, Callable, Optional, Type
+
+from hephaestus.decorators.reference import (
+    ReferenceError,
+    reference,
+    reference_getter,
+    reference_ignore,
+)
+from hephaestus.io.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+##
+# Private
+##
+_LAZY_MARKER = "_hephaestus_lazy_release"
+
+
+def _release_when_idle(proxy_ref: weakref.ref, delay_secs: float):
+    """Schedules a check for whether a lazy proxy's target has gone unused long enough to be released.
+
+    Args:
+        proxy_ref: a weak reference to the proxy. The pending check shouldn't keep the proxy alive.
+        delay_secs: the number of seconds to wait before checking.
+    """
+
+    def check():
+        proxy = proxy_ref()
+        if proxy is not None:
+            proxy._hephaestus_lazy_release(idle_only=True)
+
+    timer = threading.Timer(delay_secs, check)
+    timer.daemon = True
+    timer.start()
+
+
+##
+# Public
+##
+def lazy_reference(
+    cls: Type,
+    idle_timeout_secs: Optional[float] = None,
+    on_release: Optional[Callable[[Any], None]] = None,
+) -> Type:
+    """Creates a proxy class that only constructs an instance of the passed class when it's first used.
+
+    Args:
+        cls: the class to construct lazily.
+        idle_timeout_secs: the number of seconds the constructed instance may go unused before it's
+            released. Defaults to None (never released).
+        on_release: the method to call with the constructed instance when it's released, i.e. to close
+            connections. Defaults to None.
+
+    Raises:
+        ReferenceError: if the passed object is not a class definition.
+
+    Returns:
+        The proxy class. It's a subclass of the passed class and takes the same arguments; they're held
+        until the instance is constructed.
+
+    Note:
+        The proxy is a @reference class, so its methods forward to the constructed instance with the same
+        signatures and the same overhead as any other @reference class. Instance attributes are looked up
+        through `__getattr__`. Dunder methods (i.e. `__len__`) aren't proxied.
+
+        Construction is thread-safe: concurrent first uses construct the instance exactly once. Once
+        released, the next use constructs a new instance. Callers already using the released instance
+        may keep doing so; it's simply no longer held by the proxy.
+
+        Should the constructed instance be falsy, the proxy treats it like any other null reference.
+
+        Create the proxy class once and reuse it:
+
+        LazyClient = lazy_reference(HeavyClient, idle_timeout_secs=300, on_release=HeavyClient.close)
+        client = LazyClient(host="localhost")  # HeavyClient isn't constructed yet.
+        client.query(...)  # Now it is.
+    """
+
+    if not inspect.isclass(cls):
+        raise ReferenceError(f"{str(cls.__name__)} object is not a class.")
+
+    def __init__(self, *args, **kwargs):
+        self._hephaestus_lazy_args = (args, kwargs)
+        self._hephaestus_lazy_target = None
+        self._hephaestus_lazy_lock = threading.Lock()
+        self._hephaestus_lazy_last_use = 0.0
+
+    @reference_ignore
+    def _hephaestus_lazy_build(self) -> Any:
+        with self._hephaestus_lazy_lock:
+            if self._hephaestus_lazy_target is None:
+                args, kwargs = self._hephaestus_lazy_args
+                self._hephaestus_lazy_target = cls(*args, **kwargs)
+                _logger.debug(f"Constructed lazy instance of {cls.__qualname__}.")
+
+                if idle_timeout_secs:
+                    self._hephaestus_lazy_last_use = time.monotonic()
+                    _release_when_idle(weakref.ref(self), idle_timeout_secs)
+
+            return self._hephaestus_lazy_target
+
+    @reference_ignore
+    def _hephaestus_lazy_release(self, idle_only: bool = False) -> bool:
+        with self._hephaestus_lazy_lock:
+            target = self._hephaestus_lazy_target
+            if target is None:
+                return False
+
+            # Used since the check was scheduled. Check again once it could have gone idle.
+            if idle_only:
+                idle_secs = time.monotonic() - self._hephaestus_lazy_last_use
+                if idle_secs < idle_timeout_secs:
+                    _release_when_idle(weakref.ref(self), idle_timeout_secs - idle_secs)
+                    return False
+
+            self._hephaestus_lazy_target = None
+
+        _logger.debug(f"Released lazy instance of {cls.__qualname__}.")
+        if on_release:
+            on_release(target)
+        return True
+
+    # Keep the per-call cost down to an attribute lookup when the target never needs releasing.
+    if idle_timeout_secs:
+
+        def _hephaestus_lazy_get(self) -> Any:
+            target = self._hephaestus_lazy_target
+            if target is None:
+                target = self._hephaestus_lazy_build()
+            self._hephaestus_lazy_last_use = time.monotonic()
+            return target
+
+    else:
+
+        def _hephaestus_lazy_get(self) -> Any:
+            target = self._hephaestus_lazy_target
+            if target is None:
+                target = self._hephaestus_lazy_build()
+            return target
+
+    namespace = {
+        "__init__": __init__,
+        "__doc__": f"Lazily constructed {cls.__qualname__}.",
+        "_hephaestus_lazy_build": _hephaestus_lazy_build,
+        _LAZY_MARKER: _hephaestus_lazy_release,
+        "_hephaestus_lazy_get": reference_getter(_hephaestus_lazy_get),
+    }
+    return reference(type(f"Lazy{cls.__name__}", (cls,), namespace))
+
+
+def is_initialized(proxy: Any) -> bool:
+    """Checks whether a lazy proxy has constructed its instance.
+
+    Args:
+        proxy: the lazy proxy.
+
+    Raises:
+        ReferenceError: if the object is not a lazy proxy.
+
+    Returns:
+        True if the instance has been constructed and not released; False otherwise.
+    """
+    if not hasattr(type(proxy), _LAZY_MARKER):
+        raise ReferenceError(f"{type(proxy).__qualname__} object is not a lazy proxy.")
+
+    return proxy._hephaestus_lazy_target is not None
+
+
+def release(proxy: Any) -> bool:
+    """Releases a lazy proxy's instance, regardless of how recently it was used.
+
+    Args:
+        proxy: the lazy proxy.
+
+    Raises:
+        ReferenceError: if the object is not a lazy proxy.
+
+    Returns:
+        True if an instance was released; False if there was nothing to release.
+    """
+    if not hasattr(type(proxy), _LAZY_MARKER):
+        raise ReferenceError(f"{type(proxy).__qualname__} object is not a lazy proxy.")
+
+    return proxy._hephaestus_lazy_release()
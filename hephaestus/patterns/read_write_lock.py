@@ -0,0 +1,224 @@
+import threading
+
+from typing import Callable
+
+from hephaestus.common.exceptions import LoggedException
+from hephaestus.io.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+##
+# Private
+##
+def _wait_timeout(blocking: bool, timeout: float):
+    """Converts Lock-style acquire arguments to a Condition wait timeout."""
+    if not blocking:
+        return 0
+    return None if timeout < 0 else timeout
+
+
+class _Guard:
+    """Acquires and releases one side of a ReadWriteLock as a context manager."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire: Callable, release: Callable):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+        return self
+
+    def __exit__(self, *args):
+        self._release()
+
+
+##
+# Public
+##
+class ReadWriteLockError(LoggedException):
+    """Indicates a ReadWriteLock was used in a way that would deadlock or corrupt it."""
+
+    pass
+
+
+class ReadWriteLock:
+    """A lock that lets any number of threads read at once, but only one thread write.
+
+    Used directly (i.e. `with lock:` or `lock.acquire()`), it behaves like an exclusive lock: the write
+    side. That makes it a drop-in lock type for Singleton classes (see `set_lock_type`), whose own
+    bookkeeping only ever writes. Read-mostly instances then guard their reads with `lock.read()`:
+
+    class Config(metaclass=Singleton):
+        _lock_type = ReadWriteLock
+
+        def get(self, key: str) -> str:
+            with self._lock.read():
+                return self._values[key]
+
+        def set(self, key: str, value: str):
+            with self._lock.write():
+                self._values[key] = value
+
+    Writers are preferred: once a writer is waiting, threads not already reading wait until it's done,
+    so a steady stream of readers can't starve writers.
+
+    Re-entrancy rules:
+        - A thread holding the write lock may acquire it again; it's released once every acquisition is.
+        - A thread holding the write lock may acquire the read lock. Releasing the write lock first
+          leaves the thread reading (a downgrade).
+        - A thread holding the read lock may acquire it again, even while a writer waits.
+        - A thread holding only the read lock may not acquire the write lock (an upgrade); two readers
+          trying at once would deadlock, so it raises a ReadWriteLockError instead.
+        - Only the thread that acquired a side may release it.
+
+    Note:
+        Acquiring either side costs about a microsecond more than a `threading.Lock`. It pays off when
+        readers hold the lock while releasing the GIL (i.e. I/O or C extensions); for a quick dictionary
+        lookup, an exclusive lock is faster. See `benchmarks/read_write_lock.py`.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers = {}
+        self._writer = None
+        self._write_count = 0
+        self._writers_waiting = 0
+        self._read_guard = _Guard(self.acquire_read, self.release_read)
+        self._write_guard = _Guard(self.acquire_write, self.release_write)
+
+    def __enter__(self):
+        self.acquire_write()
+        return self
+
+    def __exit__(self, *args):
+        self.release_write()
+
+    def acquire_read(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires the read lock.
+
+        Args:
+            blocking: whether to wait for the lock. Defaults to True.
+            timeout: the maximum number of seconds to wait. Defaults to -1 (wait indefinitely).
+
+        Returns:
+            True if the lock was acquired; False otherwise.
+        """
+        me = threading.get_ident()
+        with self._mutex:
+
+            # Re-entrant reads (and reads while writing) never wait, or waiting writers would deadlock.
+            count = self._readers.get(me)
+            if count is not None or self._writer == me:
+                self._readers[me] = (count or 0) + 1
+                return True
+
+            if not (self._writer is None and not self._writers_waiting) and not (
+                self._condition.wait_for(
+                    lambda: self._writer is None and not self._writers_waiting,
+                    timeout=_wait_timeout(blocking, timeout),
+                )
+            ):
+                return False
+
+            self._readers[me] = 1
+            return True
+
+    def release_read(self):
+        """Releases the read lock.
+
+        Raises:
+            ReadWriteLockError: if the calling thread doesn't hold the read lock.
+        """
+        me = threading.get_ident()
+        with self._mutex:
+            count = self._readers.get(me)
+            if count is None:
+                raise ReadWriteLockError("Cannot release a read lock that isn't held.")
+
+            if count > 1:
+                self._readers[me] = count - 1
+                return
+
+            # Only writers wait for the last reader.
+            del self._readers[me]
+            if not self._readers and self._writers_waiting:
+                self._condition.notify_all()
+
+    def acquire_write(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires the write lock.
+
+        Args:
+            blocking: whether to wait for the lock. Defaults to True.
+            timeout: the maximum number of seconds to wait. Defaults to -1 (wait indefinitely).
+
+        Raises:
+            ReadWriteLockError: if the calling thread holds only the read lock.
+
+        Returns:
+            True if the lock was acquired; False otherwise.
+        """
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._write_count += 1
+                return True
+
+            if me in self._readers:
+                raise ReadWriteLockError(
+                    "Cannot upgrade a read lock to a write lock. Release the read lock first."
+                )
+
+            if self._writer is None and not self._readers:
+                self._writer = me
+                self._write_count = 1
+                return True
+
+            self._writers_waiting += 1
+            try:
+                acquired = self._condition.wait_for(
+                    lambda: self._writer is None and not self._readers,
+                    timeout=_wait_timeout(blocking, timeout),
+                )
+            finally:
+                self._writers_waiting -= 1
+
+            if not acquired:
+
+                # Readers held back for this writer may go ahead.
+                self._condition.notify_all()
+                return False
+
+            self._writer = me
+            self._write_count = 1
+            return True
+
+    def release_write(self):
+        """Releases the write lock.
+
+        Raises:
+            ReadWriteLockError: if the calling thread doesn't hold the write lock.
+        """
+        with self._mutex:
+            if self._writer != threading.get_ident():
+                raise ReadWriteLockError("Cannot release a write lock that isn't held.")
+
+            self._write_count -= 1
+            if not self._write_count:
+                self._writer = None
+                self._condition.notify_all()
+
+    # Lock interface; the write side.
+    acquire = acquire_write
+    release = release_write
+
+    def read(self) -> _Guard:
+        """Returns a context manager that holds the read lock."""
+        return self._read_guard
+
+    def write(self) -> _Guard:
+        """Returns a context manager that holds the write lock."""
+        return self._write_guard
@@ -1,10 +1,77 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import os
 import threading
+import weakref
 
-from typing import Any, Type
+from typing import Any, Iterator, Optional, Type
 
+from hephaestus.common.exceptions import LoggedException
 from hephaestus.io.logging import get_logger
 
 _logger = get_logger(__name__)
+_fork_handlers_registered = False
+
+
+class SingletonError(LoggedException):
+    """Indicates a Singleton instance could not be created or accessed."""
+
+    pass
+
+
+class ForkPolicy:
+    """What happens to a Singleton instance in a child process after `fork()`, when fork safety is enabled.
+
+    KEEP: the child keeps the parent's instance.
+    RESET: the instance is discarded; the next instantiation in the child creates a new one.
+    REBUILD: the instance is discarded; the next instantiation in the child creates a new one with the
+        arguments the parent's instance was created with, regardless of the arguments passed.
+    """
+
+    KEEP = "keep"
+    RESET = "reset"
+    REBUILD = "rebuild"
+
+
+class SingletonScope:
+    """How widely a Singleton instance is shared.
+
+    PROCESS: one instance for the whole process.
+    THREAD: one instance per thread, torn down when the thread exits.
+    CONTEXT: one instance per `singleton_scope()` block (i.e. per request), shared with the tasks
+        started within it and torn down when the block exits.
+    """
+
+    PROCESS = "process"
+    THREAD = "thread"
+    CONTEXT = "context"
+
+
+class _ScopedInstances:
+    """The instances created within a single thread or context scope."""
+
+    def __init__(self):
+        self.instances = {}
+
+
+def _teardown(instances: dict):
+    """Calls the teardown hook of each instance, most recently created first.
+
+    Args:
+        instances: the instances to tear down, by class.
+    """
+    for cls, instance in reversed(list(instances.items())):
+        teardown = getattr(instance, Singleton.TEARDOWN_ATTR_KEY, None)
+        if teardown is None:
+            continue
+
+        try:
+            teardown()
+        except Exception as e:
+            _logger.warning(f"Failed to tear down instance of {cls.__name__}: {e!r}")
+    instances.clear()
 
 
 class Singleton(type):
@@ -15,10 +82,20 @@ class Singleton(type):
             ...
 
     Each Singleton object will have access to a standard library thread mutex via `self._lock` for basic thread safety.
-    The type of mutex can be changed by calling the set_lock_type method.
+    The type of mutex can be changed by calling the set_lock_type method, for all classes or for a single
+    class before it's first instantiated (equivalently, by setting `_lock_type` in the class). Read-mostly
+    classes may use a ReadWriteLock (see `hephaestus.patterns.read_write_lock`) to let readers share it.
 
     It is the responsibility of the subclass implementation to ensure ALL operations are atomic.
 
+    Classes may share a single instance per thread or per `singleton_scope()` block rather than per
+    process by setting `_scope` to a SingletonScope (or calling set_scope). Scoped lookups don't lock.
+    Scoped instances' `_teardown` method (if defined) is called when their scope ends.
+
+    Classes may choose what happens to their instance after `fork()` by setting `_fork_policy`
+    to a ForkPolicy (or calling set_fork_policy). It only takes effect once fork safety is enabled
+    by calling set_fork_safety.
+
     Note:
         - Do not directly modify `__shared_instances` nor `__singleton_lock`.
     """
@@ -28,12 +105,20 @@ class Singleton(type):
     ##
     __DEFAULT_LOCK_TYPE: Type = threading.Lock
     __LOCK_ATTR_KEY: str = "_lock"
+    __LOCK_TYPE_ATTR_KEY: str = "_lock_type"
     __INSTANCE_ATTR_KEY: str = "_instance"
+    __FORK_POLICY_ATTR_KEY: str = "_fork_policy"
+    __SCOPE_ATTR_KEY: str = "_scope"
+    __TEARDOWN_ATTR_KEY: str = "_teardown"
 
     # Public Access
     DEFAULT_LOCK_TYPE: Type = __DEFAULT_LOCK_TYPE
     LOCK_ATTR_KEY: str = __LOCK_ATTR_KEY
+    LOCK_TYPE_ATTR_KEY: str = __LOCK_TYPE_ATTR_KEY
     INSTANCE_ATTR_KEY: str = __INSTANCE_ATTR_KEY
+    FORK_POLICY_ATTR_KEY: str = __FORK_POLICY_ATTR_KEY
+    SCOPE_ATTR_KEY: str = __SCOPE_ATTR_KEY
+    TEARDOWN_ATTR_KEY: str = __TEARDOWN_ATTR_KEY
 
     ##
     # "Private" Class Vars
@@ -41,10 +126,55 @@ class Singleton(type):
     __lock_type: Type = __DEFAULT_LOCK_TYPE
     __shared_instances = {}
     __singleton_lock = __lock_type()
+    __fork_safe: bool = False
+    __constructor_args = {}
+    __pending_rebuilds = set()
+    __thread_scope = threading.local()
+    __context_scope: contextvars.ContextVar = contextvars.ContextVar(
+        "singleton_scope", default=None
+    )
 
     def __call__(cls, *args, **kwargs):
         """Initializes or returns available singleton objects."""
 
+        # Fast path: the instance exists and is registered. Reading both is atomic, so established
+        # instances are returned without taking any lock.
+        instance = getattr(cls, cls.__INSTANCE_ATTR_KEY, None)
+        if instance is not None and cls.__shared_instances.get(cls) is instance:
+            return instance
+
+        scope = getattr(cls, cls.__SCOPE_ATTR_KEY, SingletonScope.PROCESS)
+        if scope != SingletonScope.PROCESS:
+            return cls.__scoped_instance(scope, args, kwargs)
+
+        cls.__register()
+
+        # Follow same double-checked locking pattern here, except, let the class use its
+        # own mutex for locking. This should prevent deadlocks where a Singleton requires another
+        # Singleton during its instantiation.
+
+        # Also, using the class's fully-qualified name as the key in `__shared_instances` is
+        # pretty safe since it should be different for every class. If not, it's probs not written correctly.
+        with getattr(cls, cls.__LOCK_ATTR_KEY):
+
+            # Re-read under the lock; another thread may have created the instance while we waited.
+            instance = getattr(cls, cls.__INSTANCE_ATTR_KEY)
+            if instance is None:
+                args, kwargs = cls.__creation_args(args, kwargs)
+                instance = super().__call__(*args, **kwargs)  # create object.
+                setattr(cls, cls.__INSTANCE_ATTR_KEY, instance)
+                _logger.debug(
+                    f"Created instance of {cls.__name__}.",
+                )
+
+            # Register last so the fast path never sees an instance before it's stored.
+            cls.__shared_instances[cls] = instance
+
+        return instance
+
+    def __register(cls):
+        """Adds the attributes necessary for a class to handle its own singleton instantiation."""
+
         # Check for object instance before locking.
         if cls not in cls.__shared_instances:
 
@@ -55,15 +185,14 @@ class Singleton(type):
                     _logger.debug(
                         f"Known instance of {cls.__name__} not available.",
                     )
+                    lock_type = _class_lock_type(cls)
                     if not (
                         hasattr(cls, cls.__LOCK_ATTR_KEY)
-                        and isinstance(
-                            hasattr(cls, cls.__LOCK_ATTR_KEY), cls.__lock_type
-                        )
+                        and isinstance(hasattr(cls, cls.__LOCK_ATTR_KEY), lock_type)
                     ):
-                        setattr(cls, cls.__LOCK_ATTR_KEY, cls.__lock_type())
+                        setattr(cls, cls.__LOCK_ATTR_KEY, lock_type())
                         _logger.debug(
-                            f"Created lock of type {cls.__lock_type.__name__} for {cls.__name__}.",
+                            f"Created lock of type {lock_type.__name__} for {cls.__name__}.",
                         )
                     if not hasattr(cls, cls.__INSTANCE_ATTR_KEY):
                         setattr(cls, cls.__INSTANCE_ATTR_KEY, None)
@@ -71,28 +200,190 @@ class Singleton(type):
                     # Prevent race conditions in between releasing this lock and actual instantiation.
                     cls.__shared_instances[cls] = None
 
-        # Follow same double-checked locking pattern here, except, let the class use its
-        # own mutex for locking. This should prevent deadlocks where a Singleton requires another
-        # Singleton during its instantiation.
+    def __scoped_instance(cls, scope: str, args: tuple, kwargs: dict) -> Any:
+        """Returns the instance for the current thread or context, creating it if necessary.
 
-        # Also, using the class's fully-qualified name as the key in `__shared_instances` is
-        # pretty safe since it should be different for every class. If not, it's probs not written correctly.
-        instance = getattr(cls, cls.__INSTANCE_ATTR_KEY)
-        lock = getattr(cls, cls.__LOCK_ATTR_KEY)
-        if not instance:
-            with lock:
-                if not instance:
-                    instance = super().__call__(*args, **kwargs)  # create object.
-                    setattr(cls, cls.__INSTANCE_ATTR_KEY, instance)
-                    cls.__shared_instances[cls] = instance
-                    _logger.debug(
-                        f"Created instance of {cls.__name__}.",
-                    )
-        else:  # Handle case: class already has instance.
-            with lock:
-                cls.__shared_instances[cls] = instance
+        Raises:
+            SingletonError: if the class is context-scoped and no `singleton_scope()` block is active.
+
+        Note:
+            No locks are taken once the class is registered. Should threads sharing a context scope
+            (i.e. through `asyncio.to_thread`) race to create an instance, one is kept and returned to both.
+        """
+        if cls not in cls.__shared_instances:
+            cls.__register()
+
+        if scope == SingletonScope.THREAD:
+            thread_scope = cls.__thread_scope
+            scoped = getattr(thread_scope, "scoped", None)
+            if scoped is None:
+
+                # Tear down once the thread exits (or clear_all replaces the thread scope).
+                scoped = thread_scope.scoped = _ScopedInstances()
+                weakref.finalize(scoped, _teardown, scoped.instances)
+        else:
+            scoped = cls.__context_scope.get()
+            if scoped is None:
+                raise SingletonError(
+                    f"{cls.__name__} is context-scoped. Instantiate it within a singleton_scope() block."
+                )
+
+        instance = scoped.instances.get(cls)
+        if instance is None:
+            instance = scoped.instances.setdefault(
+                cls, super().__call__(*args, **kwargs)
+            )
+            _logger.debug(f"Created {scope}-scoped instance of {cls.__name__}.")
+
+        return instance
+
+    def __creation_args(cls, args: tuple, kwargs: dict) -> tuple:
+        """Returns the arguments to create an instance with, keeping them if the class is rebuilt after fork.
+
+        Note:
+            Must be called while holding the class's lock.
+        """
+
+        # Rebuilding after fork; use the arguments the parent's instance was created with.
+        if cls in cls.__pending_rebuilds:
+            cls.__pending_rebuilds.discard(cls)
+            args, kwargs = cls.__constructor_args.get(cls, (args, kwargs))
+
+        if (
+            getattr(cls, cls.__FORK_POLICY_ATTR_KEY, ForkPolicy.KEEP)
+            == ForkPolicy.REBUILD
+        ):
+            cls.__constructor_args[cls] = (args, kwargs)
+
+        return args, kwargs
+
+
+class AsyncSingleton(Singleton):
+    """A Singleton whose instance is created asynchronously, for classes that need async setup.
+
+    i.e.  class ConnectionPool(metaclass=AsyncSingleton):
+            def __init__(self, dsn: str):
+                self.dsn = dsn
+
+            async def _async_init(self):
+                self.connections = await open_connections(self.dsn)
+
+          pool = await ConnectionPool.create("postgres://...")
+
+    `create` constructs the instance, then awaits its `_async_init` method (if defined). Tasks that
+    call `create` while the instance is being set up await the same, single initialization, even
+    from other threads' event loops. Once created, calling the class returns the instance like any
+    other Singleton.
+
+    Note:
+        - Should initialization fail, every waiting task receives the exception and the next call to
+          `create` tries again.
+        - Cancelling a task waiting on `create` doesn't cancel the initialization others are waiting on.
+        - `clear_all` discards created instances; the next call to `create` creates a new one.
+    """
+
+    ##
+    # Constants
+    ##
+    __ASYNC_INIT_ATTR_KEY: str = "_async_init"
+
+    # Public Access
+    ASYNC_INIT_ATTR_KEY: str = __ASYNC_INIT_ATTR_KEY
+
+    ##
+    # "Private" Class Vars
+    ##
+    __in_flight = {}
 
-        return getattr(cls, cls.__INSTANCE_ATTR_KEY)
+    def __call__(cls, *args, **kwargs):
+        """Returns the instance created by `create`.
+
+        Raises:
+            SingletonError: if the instance hasn't been created.
+        """
+        instance = getattr(cls, Singleton.INSTANCE_ATTR_KEY, None)
+        if instance is None:
+            raise SingletonError(
+                f"{cls.__name__} is created asynchronously. Await {cls.__name__}.create() first."
+            )
+        return instance
+
+    async def create(cls, *args, **kwargs) -> Any:
+        """Creates the instance, or waits for it to be created, and returns it.
+
+        Args:
+            args: the positional arguments to construct the instance with, should it be created.
+            kwargs: the keyword arguments to construct the instance with, should it be created.
+
+        Raises:
+            Exception: whatever constructing or initializing the instance raised.
+
+        Returns:
+            The instance.
+        """
+        instance = getattr(cls, Singleton.INSTANCE_ATTR_KEY, None)
+        if instance is not None:
+            return instance
+
+        cls._Singleton__register()
+        with getattr(cls, Singleton.LOCK_ATTR_KEY):
+            instance = getattr(cls, Singleton.INSTANCE_ATTR_KEY)
+            if instance is not None:
+                return instance
+
+            # Start the initialization in its own task, so cancelling this caller doesn't cancel it.
+            in_flight = cls.__in_flight.get(cls)
+            if in_flight is None:
+                args, kwargs = cls._Singleton__creation_args(args, kwargs)
+                future = concurrent.futures.Future()
+                task = asyncio.get_running_loop().create_task(
+                    cls.__initialize(future, args, kwargs)
+                )
+                in_flight = cls.__in_flight[cls] = (future, task)
+
+        return await asyncio.shield(asyncio.wrap_future(in_flight[0]))
+
+    async def __initialize(
+        cls, future: concurrent.futures.Future, args: tuple, kwargs: dict
+    ):
+        """Constructs and initializes the instance, then shares the result with every waiting task.
+
+        Args:
+            future: the future waiting tasks await.
+            args: the positional arguments to construct the instance with.
+            kwargs: the keyword arguments to construct the instance with.
+        """
+        try:
+            # Skip Singleton.__call__; the instance is stored once it's initialized.
+            instance = super(Singleton, cls).__call__(*args, **kwargs)
+            async_init = getattr(instance, cls.__ASYNC_INIT_ATTR_KEY, None)
+            if async_init is not None:
+                await async_init()
+        except Exception as e:
+            with getattr(cls, Singleton.LOCK_ATTR_KEY):
+                cls.__in_flight.pop(cls, None)
+            _logger.debug(f"Failed to create instance of {cls.__name__}: {e!r}")
+            future.set_exception(e)
+            return
+        except BaseException:
+
+            # i.e. the event loop is shutting down. Waiting tasks are cancelled too.
+            with getattr(cls, Singleton.LOCK_ATTR_KEY):
+                cls.__in_flight.pop(cls, None)
+            future.cancel()
+            raise
+
+        with getattr(cls, Singleton.LOCK_ATTR_KEY):
+            setattr(cls, Singleton.INSTANCE_ATTR_KEY, instance)
+            Singleton._Singleton__shared_instances[cls] = instance
+            cls.__in_flight.pop(cls, None)
+        _logger.debug(f"Created instance of {cls.__name__}.")
+        future.set_result(instance)
+
+
+def _class_lock_type(cls: Type) -> Type:
+    """Returns the lock type of a Singleton class: its own, if set, or the one for all Singleton objects."""
+    return getattr(cls, Singleton.LOCK_TYPE_ATTR_KEY, None) or get_lock_type()
 
 
 def get_lock_type() -> Type:
@@ -105,15 +396,18 @@ def get_lock_type() -> Type:
     return Singleton._Singleton__lock_type
 
 
-def set_lock_type(lock_type: Type) -> bool:
-    """Sets the lock type for all Singleton objects.
+def set_lock_type(lock_type: Type, cls: Optional[Type] = None) -> bool:
+    """Sets the lock type for all Singleton objects, or for a single Singleton class.
 
     Args:
         lock_type: a type that, when instantiated, can enable atomic operations for shared data.
             Must support use as a context manager (i.e. `with lock_type():`).
+        cls: the Singleton class to set the lock type of. Defaults to None (all Singleton objects).
+            Classes with their own lock type keep it when the lock type for all objects changes.
+            Must be set before the class is first instantiated.
 
     Returns:
-        True if the pass lock_type was set; False otherwise.
+        True if the pass lock_type was set; False otherwise (i.e. the class was already instantiated).
 
     Note:
         This should be called before any Singleton instantiation due to ensure safe operations.
@@ -135,6 +429,25 @@ def set_lock_type(lock_type: Type) -> bool:
         )
         return False
 
+    # Change lock type of a single class. Its lock is created when it's registered, on first instantiation.
+    if cls is not None:
+        if not isinstance(cls, Singleton):
+            _logger.warning(
+                f"{str(cls)} is not a Singleton class. Keeping current lock type."
+            )
+            return False
+
+        # Threads may already hold or wait on a registered class's lock; a new one wouldn't exclude them.
+        with Singleton._Singleton__singleton_lock:
+            if cls in Singleton._Singleton__shared_instances:
+                _logger.warning(
+                    f"{cls.__name__} has already been instantiated. Keeping current lock type: {_class_lock_type(cls).__name__}"
+                )
+                return False
+
+            setattr(cls, Singleton.LOCK_TYPE_ATTR_KEY, lock_type)
+        return True
+
     # Change lock type.
     current_singleton_lock = (
         Singleton._Singleton__singleton_lock
@@ -154,7 +467,168 @@ def clear_all():
         shared_instances = Singleton._Singleton__shared_instances
 
         for cls in shared_instances.keys():
-            if getattr(cls, Singleton.INSTANCE_ATTR_KEY):
+            if getattr(cls, Singleton.INSTANCE_ATTR_KEY) is not None:
                 with getattr(cls, Singleton.LOCK_ATTR_KEY):
                     setattr(cls, Singleton.INSTANCE_ATTR_KEY, None)
                     shared_instances[cls] = None
+
+        Singleton._Singleton__pending_rebuilds.clear()
+
+        # Every thread's thread-scoped instances are torn down once the old scope is collected.
+        Singleton._Singleton__thread_scope = threading.local()
+
+
+@contextlib.contextmanager
+def singleton_scope() -> Iterator[None]:
+    """Starts a new scope for context-scoped Singleton classes, i.e. for a single request.
+
+    Instances created within the block are shared by everything in it, including tasks started
+    within it, and torn down when it exits. Blocks may be nested; the innermost one is used.
+
+    i.e.  with singleton_scope():
+              handle_request()
+
+    Yields:
+        Nothing; the scope is active until the block exits.
+    """
+    scoped = _ScopedInstances()
+    token = Singleton._Singleton__context_scope.set(scoped)
+    try:
+        yield
+    finally:
+        Singleton._Singleton__context_scope.reset(token)
+        _teardown(scoped.instances)
+
+
+def set_scope(cls: Type, scope: str) -> bool:
+    """Sets how widely a Singleton class's instance is shared.
+
+    Args:
+        cls: the Singleton class.
+        scope: the SingletonScope to use.
+
+    Returns:
+        True if the scope was set; False otherwise.
+
+    Note:
+        Set the scope before the class is first instantiated. Instances already created in the
+        previous scope are kept by it.
+    """
+    if not isinstance(cls, Singleton) or isinstance(cls, AsyncSingleton):
+        _logger.warning(f"{str(cls)} does not support scopes. Keeping scope.")
+        return False
+
+    if scope not in (
+        SingletonScope.PROCESS,
+        SingletonScope.THREAD,
+        SingletonScope.CONTEXT,
+    ):
+        _logger.warning(
+            f"Unknown scope: {str(scope)}. Keeping scope of {cls.__name__}."
+        )
+        return False
+
+    setattr(cls, Singleton.SCOPE_ATTR_KEY, scope)
+    return True
+
+
+def get_fork_safety() -> bool:
+    """Returns whether Singleton locks and instances are made safe for use after `fork()`.
+
+    Returns:
+        True if fork safety is enabled; False otherwise.
+    """
+    return Singleton._Singleton__fork_safe
+
+
+def set_fork_safety(enabled: bool = True) -> bool:
+    """Enables or disables making Singleton locks and instances safe for use after `fork()`.
+
+    When enabled, every Singleton lock is replaced with a new, unheld one in the child, and each
+    instance is kept, reset, or rebuilt according to its class's ForkPolicy (ForkPolicy.KEEP unless set).
+
+    Args:
+        enabled: whether to enable fork safety. Defaults to True.
+
+    Returns:
+        True if fork safety was changed; False if fork isn't supported on this platform.
+
+    Note:
+        Kept instances keep any locks, file handles, or connections of their own; they're shared with
+        (or unusable in) the child. Classes holding such resources should use ForkPolicy.RESET or
+        ForkPolicy.REBUILD.
+    """
+    if not hasattr(os, "register_at_fork"):
+        _logger.warning("Fork is not supported on this platform.")
+        return False
+
+    # Handlers can't be unregistered, so they're registered once and check whether they're enabled.
+    global _fork_handlers_registered
+    if enabled and not _fork_handlers_registered:
+        os.register_at_fork(after_in_child=_after_fork_in_child)
+        _fork_handlers_registered = True
+
+    Singleton._Singleton__fork_safe = enabled
+    return True
+
+
+def set_fork_policy(cls: Type, policy: str) -> bool:
+    """Sets what happens to a Singleton class's instance after `fork()`.
+
+    Args:
+        cls: the Singleton class.
+        policy: the ForkPolicy to use.
+
+    Returns:
+        True if the policy was set; False otherwise.
+
+    Note:
+        Set ForkPolicy.REBUILD before the class is first instantiated; the arguments used are only
+        kept for classes already using it. Instances created without them are reset instead.
+    """
+    if not isinstance(cls, Singleton):
+        _logger.warning(f"{str(cls)} is not a Singleton class. Keeping fork policy.")
+        return False
+
+    if policy not in (ForkPolicy.KEEP, ForkPolicy.RESET, ForkPolicy.REBUILD):
+        _logger.warning(
+            f"Unknown fork policy: {str(policy)}. Keeping fork policy of {cls.__name__}."
+        )
+        return False
+
+    setattr(cls, Singleton.FORK_POLICY_ATTR_KEY, policy)
+    return True
+
+
+def _after_fork_in_child():
+    """Replaces every Singleton lock and keeps, resets, or rebuilds each instance per its ForkPolicy.
+
+    Note:
+        The child is single-threaded at this point, so locks are replaced rather than released;
+        threads that held them in the parent don't exist here. Locks aren't acquired before forking:
+        `clear_all` holds the Singleton lock while waiting on class locks, so doing so could deadlock
+        the parent. Registration steps are idempotent, so a child forked mid-registration completes
+        it on the next instantiation.
+    """
+    if not Singleton._Singleton__fork_safe:
+        return
+
+    Singleton._Singleton__singleton_lock = Singleton._Singleton__lock_type()
+
+    # Initializations in flight belong to the parent's event loops.
+    AsyncSingleton._AsyncSingleton__in_flight.clear()
+
+    constructor_args = Singleton._Singleton__constructor_args
+    pending_rebuilds = Singleton._Singleton__pending_rebuilds
+    shared_instances = Singleton._Singleton__shared_instances
+    for cls, instance in shared_instances.items():
+        setattr(cls, Singleton.LOCK_ATTR_KEY, _class_lock_type(cls)())
+
+        policy = getattr(cls, Singleton.FORK_POLICY_ATTR_KEY, ForkPolicy.KEEP)
+        if instance is None or policy == ForkPolicy.KEEP:
+            continue
+
+        setattr(cls, Singleton.INSTANCE_ATTR_KEY, None)
+        shared_instances[cls] = None
+        if policy == ForkPolicy.REBUILD and cls in constructor_args:
+            pending_rebuilds.add(cls)
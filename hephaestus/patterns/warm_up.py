@@ -0,0 +1,203 @@
+import threading
+import time
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Optional, Type
+
+from hephaestus.io.logging import get_logger
+from hephaestus.patterns.singleton import AsyncSingleton, Singleton, SingletonScope
+
+_logger = get_logger(__name__)
+
+"""
+    Creates Singleton instances ahead of time, so the first caller doesn't pay for their construction.
+
+    Register the classes to warm up (with the arguments to construct them with) as they're defined,
+    then warm them up at startup:
+
+        register(ConnectionPool, dsn="postgres://...")
+        register(LookupTable)
+
+        results = warm_up(timeout_secs=30)
+        if not all(result.ready for result in results):
+            ...
+"""
+
+##
+# Private
+##
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def _create(cls: Type, args: tuple, kwargs: dict) -> "WarmUpResult":
+    """Creates a Singleton instance, timing how long it took.
+
+    Args:
+        cls: the Singleton class.
+        args: the positional arguments to construct the instance with.
+        kwargs: the keyword arguments to construct the instance with.
+
+    Returns:
+        Whether the instance is ready, whether it was created here, and how long that took.
+    """
+    if getattr(cls, Singleton.INSTANCE_ATTR_KEY, None) is not None:
+        return WarmUpResult(cls=cls, ready=True, created=False, init_secs=0.0)
+
+    start = time.perf_counter()
+    try:
+        cls(*args, **kwargs)
+    except Exception as e:
+        _logger.warning(f"Failed to warm up {cls.__name__}: {e!r}")
+        return WarmUpResult(
+            cls=cls,
+            ready=False,
+            created=False,
+            init_secs=time.perf_counter() - start,
+            exception=e,
+        )
+
+    init_secs = time.perf_counter() - start
+    _logger.debug(f"Warmed up {cls.__name__} in {init_secs:.3f}s.")
+    return WarmUpResult(cls=cls, ready=True, created=True, init_secs=init_secs)
+
+
+##
+# Public
+##
+WarmUpResult = namedtuple(
+    "WarmUpResult",
+    ["cls", "ready", "created", "init_secs", "exception"],
+    defaults=[None],
+)
+
+
+def register(cls: Type, *args, **kwargs) -> bool:
+    """Registers a Singleton class to be warmed up.
+
+    Args:
+        cls: the Singleton class.
+        args: the positional arguments to construct the instance with.
+        kwargs: the keyword arguments to construct the instance with.
+
+    Returns:
+        True if the class was registered; False otherwise.
+
+    Note:
+        Only process-scoped Singleton classes can be warmed up. AsyncSingleton classes should be
+        created on the event loop that will use them.
+    """
+    if not isinstance(cls, Singleton) or isinstance(cls, AsyncSingleton):
+        _logger.warning(f"{str(cls)} can't be warmed up. Not registering.")
+        return False
+
+    if (
+        getattr(cls, Singleton.SCOPE_ATTR_KEY, SingletonScope.PROCESS)
+        != SingletonScope.PROCESS
+    ):
+        _logger.warning(f"{cls.__name__} is not process-scoped. Not registering.")
+        return False
+
+    with _registry_lock:
+        _registry[cls] = (args, kwargs)
+    return True
+
+
+def unregister(cls: Type) -> bool:
+    """Stops warming up a Singleton class.
+
+    Args:
+        cls: the Singleton class.
+
+    Returns:
+        True if the class was registered; False otherwise.
+    """
+    with _registry_lock:
+        return _registry.pop(cls, None) is not None
+
+
+def warm_up(
+    classes: Optional[Iterable[Type]] = None,
+    max_workers: Optional[int] = None,
+    timeout_secs: Optional[float] = None,
+    on_ready: Optional[Callable[[WarmUpResult], None]] = None,
+) -> list[WarmUpResult]:
+    """Creates the instances of Singleton classes in parallel on a thread pool.
+
+    Args:
+        classes: the classes to warm up. Registered classes are constructed with the arguments they
+            were registered with. Defaults to None (every registered class).
+        max_workers: the maximum number of classes to create at once. Defaults to None (the
+            ThreadPoolExecutor default).
+        timeout_secs: the number of seconds to wait for every instance to be created. Defaults to
+            None (wait indefinitely).
+        on_ready: the method to call with each class's result as soon as it's available, i.e. to
+            report readiness while other classes are still being created. Defaults to None.
+
+    Returns:
+        A result for each class, in the order they were passed (or registered): whether its instance
+        is ready, whether it was created by this call, the seconds that took, and the exception raised
+        (if any).
+
+    Note:
+        Classes that need another Singleton simply instantiate it; Singleton's per-class locks
+        ensure it's created once, and the dependent's time includes waiting for it.
+
+        Classes not created within the timeout are reported as not ready with a TimeoutError, and the
+        seconds spent creating them so far (None if they never started). Their creation carries on in
+        the background.
+    """
+    with _registry_lock:
+        registered = dict(_registry)
+    classes = list(registered) if classes is None else list(classes)
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="singleton-warm-up"
+    )
+
+    # Report from the worker, so every result is reported before the call returns.
+    started = {}
+
+    def create(cls: Type) -> WarmUpResult:
+        started[cls] = time.perf_counter()
+        result = _create(cls, *registered.get(cls, ((), {})))
+        if on_ready:
+            try:
+                on_ready(result)
+            except Exception as e:
+                _logger.warning(f"Failed to report {cls.__name__} ready: {e!r}")
+        return result
+
+    try:
+        futures = [executor.submit(create, cls) for cls in classes]
+        wait(futures, timeout=timeout_secs)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for cls, future in zip(classes, futures):
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+            continue
+
+        # Classes still queued when time ran out never started.
+        _logger.warning(f"Timed out warming up {cls.__name__}.")
+        results.append(
+            WarmUpResult(
+                cls=cls,
+                ready=False,
+                created=False,
+                init_secs=(
+                    time.perf_counter() - started[cls] if cls in started else None
+                ),
+                exception=TimeoutError(f"{cls.__name__} was not created in time."),
+            )
+        )
+
+    _logger.info(
+        f"Warmed up {sum(result.ready for result in results)}/{len(results)} Singleton classes "
+        f"in {time.perf_counter() - start:.3f}s."
+    )
+    return results
@@ -0,0 +1,351 @@
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from hephaestus.common.types import PathLike
+from hephaestus.io.logging import configure_root_logger, get_logger
+
+_logger = get_logger(__name__)
+
+"""
+    A tiny, dependency-free harness for timing Hephaestus code.
+
+    Benchmarks live in the top-level `benchmarks` folder. Each one is a standalone script
+    that builds a list of BenchmarkResults via `measure` and hands them to `run_benchmark`.
+    `scripts/run_benchmarks` runs all of them.
+"""
+
+##
+# Types
+##
+BenchmarkResult = namedtuple(
+    "BenchmarkResult",
+    [
+        "name",
+        "params",
+        "iterations",
+        "mean_ns",
+        "median_ns",
+        "min_ns",
+        "max_ns",
+        "stdev_ns",
+        "peak_alloc_bytes",
+        "retained_blocks",
+    ],
+    defaults=[None, None],
+)
+Comparison = namedtuple(
+    "Comparison", ["name", "params", "baseline_ns", "current_ns", "change", "regressed"]
+)
+
+
+##
+# Measurement
+##
+def measure(
+    name: str,
+    method: Callable,
+    iterations: int = 100,
+    warmup: int = 5,
+    number: int = 1,
+    params: Optional[dict[str, Any]] = None,
+    track_memory: bool = False,
+) -> BenchmarkResult:
+    """Times repeated calls to a method.
+
+    Args:
+        name: the name to record the result under.
+        method: the method to time. Takes no arguments.
+        iterations: the number of timed samples to take. Defaults to 100.
+        warmup: the number of untimed calls made before sampling. Defaults to 5.
+        number: the number of calls per sample. Defaults to 1.
+        params: any parameters describing the scenario. Defaults to None.
+        track_memory: whether to record the peak memory allocated by Python during a single call and
+            the number of memory blocks each call leaves allocated. Defaults to False.
+
+    Returns:
+        The timing statistics, in nanoseconds per call.
+
+    Note:
+        Increase `number` for very cheap operations; the cost of reading the clock
+        is otherwise larger than the operation itself.
+
+        The garbage collector is disabled while sampling to reduce noise. Memory is tracked
+        during separate, untimed calls since tracing allocations slows everything down. Retained
+        blocks are averaged over `number` calls; anything a method keeps around (i.e. a growing
+        queue) shows up there.
+    """
+    for _ in range(warmup):
+        method()
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                method()
+            samples.append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    peak_alloc_bytes = None
+    retained_blocks = None
+    if track_memory:
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        for _ in range(number):
+            method()
+        retained_blocks = (sys.getallocatedblocks() - blocks) / number
+
+        tracemalloc.start()
+        try:
+            method()
+            _, peak_alloc_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return summarize_samples(
+        name=name,
+        samples=samples,
+        params=params,
+        peak_alloc_bytes=peak_alloc_bytes,
+        retained_blocks=retained_blocks,
+    )
+
+
+def summarize_samples(
+    name: str,
+    samples: list[float],
+    params: Optional[dict[str, Any]] = None,
+    peak_alloc_bytes: Optional[int] = None,
+    retained_blocks: Optional[float] = None,
+) -> BenchmarkResult:
+    """Computes the timing statistics of samples taken outside of `measure`.
+
+    Args:
+        name: the name to record the result under.
+        samples: the time each sample took, in nanoseconds. Must not be empty.
+        params: any parameters describing the scenario. Defaults to None.
+        peak_alloc_bytes: the peak memory allocated during a single call, if known. Defaults to None.
+        retained_blocks: the number of memory blocks each call left allocated, if known. Defaults to None.
+
+    Returns:
+        The timing statistics, in nanoseconds per sample.
+    """
+    return BenchmarkResult(
+        name=name,
+        params=params if params else {},
+        iterations=len(samples),
+        mean_ns=statistics.fmean(samples),
+        median_ns=statistics.median(samples),
+        min_ns=min(samples),
+        max_ns=max(samples),
+        stdev_ns=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        peak_alloc_bytes=peak_alloc_bytes,
+        retained_blocks=retained_blocks,
+    )
+
+
+def compare_results(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = 0.10,
+) -> list[Comparison]:
+    """Compares results against a baseline using each scenario's median.
+
+    Args:
+        results: the results of the current run.
+        baseline: the results to compare against.
+        threshold: the relative slowdown considered a regression. Defaults to 0.10 (10%).
+
+    Returns:
+        A comparison for every scenario present in both runs. Scenarios are matched by name and params.
+    """
+
+    def key(result: BenchmarkResult) -> str:
+        return json.dumps([result.name, result.params], sort_keys=True)
+
+    baseline_by_key = {key(result): result for result in baseline}
+
+    comparisons = []
+    for result in results:
+        previous = baseline_by_key.get(key(result), None)
+        if not previous:
+            continue
+
+        change = (result.median_ns - previous.median_ns) / previous.median_ns
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                params=result.params,
+                baseline_ns=previous.median_ns,
+                current_ns=result.median_ns,
+                change=change,
+                regressed=change > threshold,
+            )
+        )
+
+    return comparisons
+
+
+##
+# Reporting
+##
+def _format_params(params: dict[str, Any]) -> str:
+    return ", ".join(f"{key}={value}" for key, value in params.items())
+
+
+def log_results(results: list[BenchmarkResult]):
+    """Logs a short, human-readable summary of each result.
+
+    Args:
+        results: the results to log.
+    """
+    for result in results:
+        memory = (
+            f", {result.peak_alloc_bytes:,} B peak"
+            if result.peak_alloc_bytes is not None
+            else ""
+        )
+        if result.retained_blocks is not None:
+            memory += f", {result.retained_blocks:,.2f} blocks retained"
+        _logger.info(
+            f"{result.name}[{_format_params(result.params)}]: {result.median_ns:,.0f} ns median, "
+            f"{result.mean_ns:,.0f} ns mean (± {result.stdev_ns:,.0f}){memory}"
+        )
+
+
+def log_comparisons(comparisons: list[Comparison]):
+    """Logs how each scenario changed relative to the baseline. Regressions are logged as warnings.
+
+    Args:
+        comparisons: the comparisons to log.
+    """
+    for comparison in comparisons:
+        _logger.log(
+            level=logging.WARNING if comparison.regressed else logging.INFO,
+            msg=f"{comparison.name}[{_format_params(comparison.params)}]: {comparison.baseline_ns:,.0f} ns -> "
+            f"{comparison.current_ns:,.0f} ns ({comparison.change:+.1%})",
+        )
+
+
+def save_results(results: list[BenchmarkResult], path: PathLike):
+    """Writes results to a JSON file.
+
+    Args:
+        results: the results to save.
+        path: the file to write to. Parent folders are created as necessary.
+    """
+    path = Path(path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, mode="w") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": [result._asdict() for result in results],
+            },
+            file,
+            indent=2,
+        )
+
+    _logger.info(f"Saved benchmark results to {str(path)}")
+
+
+def load_results(path: PathLike) -> list[BenchmarkResult]:
+    """Reads results from a JSON file created by `save_results`.
+
+    Args:
+        path: the file to read.
+
+    Returns:
+        The results stored in the file.
+    """
+    with open(path, mode="r") as file:
+        return [BenchmarkResult(**result) for result in json.load(file)["results"]]
+
+
+##
+# Command Line
+##
+def run_benchmark(
+    description: str,
+    collect: Callable[[argparse.Namespace], list[BenchmarkResult]],
+    add_arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None,
+):
+    """Parses common command line options, runs a benchmark, and reports its results.
+
+    Args:
+        description: what the benchmark measures.
+        collect: the method that runs the benchmark. It's passed the parsed command line options.
+        add_arguments: a method that adds benchmark-specific options to the parser. Defaults to None.
+
+    Note:
+        Exits with a non-zero status if any scenario regressed relative to the baseline.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--iterations",
+        help="the number of timed samples per scenario",
+        required=False,
+        dest="iterations",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "--output",
+        help="a JSON file to save results to",
+        required=False,
+        dest="output",
+        default=None,
+    )
+    parser.add_argument(
+        "--baseline",
+        help="a JSON file of previous results to compare against",
+        required=False,
+        dest="baseline",
+        default=None,
+    )
+    parser.add_argument(
+        "--threshold",
+        help="the relative slowdown considered a regression",
+        required=False,
+        dest="threshold",
+        type=float,
+        default=0.10,
+    )
+    if add_arguments:
+        add_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_root_logger(enable_color=False)
+
+    results = collect(args)
+    log_results(results)
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        comparisons = compare_results(
+            results, load_results(args.baseline), threshold=args.threshold
+        )
+        log_comparisons(comparisons)
+
+        if any(comparison.regressed for comparison in comparisons):
+            sys.exit(1)
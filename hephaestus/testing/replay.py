@@ -0,0 +1,377 @@
+import asyncio
+import copy
+import inspect
+import pickle
+import time
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from hephaestus.common.exceptions import LoggedException
+from hephaestus.common.types import PathLike
+from hephaestus.decorators.track import CapturePolicy, MethodTrace
+from hephaestus.io.logging import get_logger
+from hephaestus.testing.benchmark import BenchmarkResult, summarize_samples
+
+_logger = get_logger(__name__)
+
+"""
+    Replays workloads recorded by @track against new builds of the tracked methods.
+
+    Record a workload by tracking the methods of interest (with the default capture policy, so the
+    real arguments are kept), then save the traces:
+
+        save_calls(TraceQueue().drain(), "logs/workload.bin")
+
+    Later, replay the same calls in-process, timing each one and diffing the return values:
+
+        report = replay_calls(load_calls("logs/workload.bin"), {"parse": parse})
+        log_report(report)
+
+    Workload files are pickles. Only load files you trust.
+"""
+
+##
+# Private
+##
+_MAGIC = b"HRPL"
+_VERSION = 1
+
+
+def _replayable(trace: MethodTrace) -> bool:
+    """Checks whether a trace kept the real arguments it was called with, and finished.
+
+    Args:
+        trace: the trace to check.
+
+    Returns:
+        True if the call can be replayed; False otherwise.
+
+    Note:
+        Calls that never finished (i.e. cancelled coroutines or generators closed early) can't be
+        compared against a replay that runs them to completion.
+    """
+    return (trace.capture == CapturePolicy.FULL) and (
+        (trace.exception is None) or isinstance(trace.exception, Exception)
+    )
+
+
+def _invoke(
+    method: Callable, args: tuple, kwargs: dict, loop_getter: Callable
+) -> tuple:
+    """Calls a method the way it was originally called, consuming generators and awaiting coroutines.
+
+    Args:
+        method: the method to call.
+        args: the positional arguments to pass.
+        kwargs: the keyword arguments to pass.
+        loop_getter: the method that returns the event loop used to run async methods.
+
+    Returns:
+        The return value, the exception raised (if any), the values yielded (if a generator), and
+        the time the call took in nanoseconds.
+    """
+    retval = exception = yielded = None
+
+    start_ns = time.perf_counter_ns()
+    try:
+        if inspect.iscoroutinefunction(method):
+            retval = loop_getter().run_until_complete(method(*args, **kwargs))
+        elif inspect.isasyncgenfunction(method):
+
+            async def consume():
+                return tuple([value async for value in method(*args, **kwargs)])
+
+            yielded = loop_getter().run_until_complete(consume())
+        elif inspect.isgeneratorfunction(method):
+            generator = method(*args, **kwargs)
+            values = []
+            try:
+                while True:
+                    values.append(next(generator))
+            except StopIteration as stop:
+                retval = stop.value
+            yielded = tuple(values)
+        else:
+            retval = method(*args, **kwargs)
+    except Exception as e:
+        exception = e
+    duration_ns = time.perf_counter_ns() - start_ns
+
+    return retval, exception, yielded, duration_ns
+
+
+def _same_outcome(expected: Any, actual: Any) -> bool:
+    """The default comparison of recorded and replayed outcomes.
+
+    Args:
+        expected: the recorded return value, yielded values, or exception.
+        actual: the replayed return value, yielded values, or exception.
+
+    Returns:
+        True if the outcomes are equal; exceptions are equal if they share a type and arguments.
+    """
+    if isinstance(expected, BaseException) or isinstance(actual, BaseException):
+        return type(expected) is type(actual) and expected.args == actual.args
+    return expected == actual
+
+
+##
+# Public
+##
+class ReplayError(LoggedException):
+    """Indicates a workload could not be saved or loaded."""
+
+    pass
+
+
+RecordedCall = namedtuple(
+    "RecordedCall",
+    ["name", "args", "kwargs", "retval", "exception", "yielded", "duration_ns"],
+)
+CallMismatch = namedtuple(
+    "CallMismatch", ["index", "name", "args", "kwargs", "expected", "actual"]
+)
+ReplayReport = namedtuple(
+    "ReplayReport", ["replayed", "skipped", "recorded_ns", "replayed_ns", "mismatches"]
+)
+
+
+def save_calls(traces: Iterable[MethodTrace], path: PathLike) -> int:
+    """Saves the calls recorded by @track so they can be replayed later.
+
+    Args:
+        traces: the traces to save, i.e. `TraceQueue().drain()`.
+        path: the file to write to. Parent folders are created as necessary; an existing file is replaced.
+
+    Returns:
+        The number of calls saved.
+
+    Note:
+        Calls not traced under CapturePolicy.FULL, calls that never finished, and calls whose arguments,
+        return value, or exception can't be pickled are skipped with a warning.
+
+        @track keeps arguments by reference, so calls that mutate their arguments are saved (and
+        replayed) with the mutated values.
+    """
+    path = Path(path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    saved = skipped = 0
+    with open(path, mode="wb") as file:
+        pickle.dump((_MAGIC, _VERSION), file)
+        for trace in traces:
+            if not _replayable(trace):
+                skipped += 1
+                continue
+
+            call = RecordedCall(
+                name=trace.name,
+                args=trace.args,
+                kwargs=trace.kwargs,
+                retval=trace.retval,
+                exception=trace.exception,
+                yielded=trace.yielded,
+                duration_ns=trace.duration_ns,
+            )
+            try:
+                record = pickle.dumps(call)
+            except Exception:
+                skipped += 1
+                continue
+
+            file.write(record)
+            saved += 1
+
+    if skipped:
+        _logger.warning(f"Skipped {skipped} calls that can't be replayed.")
+    _logger.debug(f"Saved {saved} calls to {str(path)}.")
+    return saved
+
+
+def load_calls(path: PathLike) -> Iterator[RecordedCall]:
+    """Lazily reads the calls stored in a file created by `save_calls`.
+
+    Args:
+        path: the file to read.
+
+    Raises:
+        ReplayError: if the file is not a workload file or uses an unsupported version.
+
+    Yields:
+        Each call, in the order it was saved.
+
+    Note:
+        Files are unpickled; only load files you trust.
+    """
+    with open(path, mode="rb") as file:
+        try:
+            magic, version = pickle.load(file)
+        except Exception:
+            raise ReplayError(f"{str(path)} is not a workload file.")
+
+        if magic != _MAGIC:
+            raise ReplayError(f"{str(path)} is not a workload file.")
+        if version != _VERSION:
+            raise ReplayError(f"Unsupported workload file version: {version}.")
+
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def replay_calls(
+    calls: Iterable[RecordedCall],
+    methods: dict[str, Callable],
+    iterations: int = 1,
+    warmup: int = 1,
+    compare: Optional[Callable[[Any, Any], bool]] = None,
+    copy_args: bool = True,
+) -> ReplayReport:
+    """Replays recorded calls against new builds of the methods that made them.
+
+    Args:
+        calls: the calls to replay, i.e. `load_calls(path)`.
+        methods: the method to call for each recorded name (the tracked method's `__name__`).
+            Calls to methods not listed are skipped.
+        iterations: the number of timed passes over the workload. Defaults to 1.
+        warmup: the number of untimed passes over the workload before timing. Defaults to 1.
+        compare: the method used to decide whether a recorded outcome (return value, yielded values,
+            or exception) matches the replayed one. Defaults to equality; exceptions match if they
+            share a type and arguments.
+        copy_args: whether to pass each call a deep copy of its arguments, so methods that mutate
+            them see the same input on every pass. Copies are made outside the timed region.
+            Defaults to True.
+
+    Returns:
+        The number of calls replayed per pass and skipped, the recorded and replayed durations of
+        each call grouped by name (in nanoseconds), and every call whose outcome didn't match.
+        Recorded durations are only available for methods tracked with `timed=True`.
+
+    Note:
+        Generators are consumed and coroutines awaited within the timed region, as they were when
+        recorded. Mismatches are only collected on the first timed pass.
+    """
+    compare = compare if compare else _same_outcome
+    calls = [call for call in calls]
+    replayable = [call for call in calls if call.name in methods]
+    skipped = len(calls) - len(replayable)
+    if skipped:
+        _logger.warning(f"Skipped {skipped} calls to methods that weren't provided.")
+
+    loop = None
+
+    def get_loop() -> asyncio.AbstractEventLoop:
+        nonlocal loop
+        if loop is None:
+            loop = asyncio.new_event_loop()
+        return loop
+
+    recorded_ns = {}
+    replayed_ns = {}
+    mismatches = []
+    try:
+        for pass_ in range(warmup + iterations):
+            timed = pass_ >= warmup
+            for index, call in enumerate(replayable):
+                args, kwargs = (
+                    copy.deepcopy((call.args, call.kwargs))
+                    if copy_args
+                    else (call.args, call.kwargs)
+                )
+                retval, exception, yielded, duration_ns = _invoke(
+                    methods[call.name], args, kwargs, get_loop
+                )
+                if not timed:
+                    continue
+
+                replayed_ns.setdefault(call.name, []).append(duration_ns)
+                if pass_ > warmup:
+                    continue
+
+                if call.duration_ns is not None:
+                    recorded_ns.setdefault(call.name, []).append(call.duration_ns)
+
+                if call.exception is not None or exception is not None:
+                    expected, actual = call.exception, exception
+                elif call.yielded is not None or yielded is not None:
+                    expected, actual = (call.yielded, call.retval), (yielded, retval)
+                else:
+                    expected, actual = call.retval, retval
+
+                try:
+                    same = compare(expected, actual)
+                except Exception:
+                    same = False
+
+                if not same:
+                    mismatches.append(
+                        CallMismatch(
+                            index=index,
+                            name=call.name,
+                            args=call.args,
+                            kwargs=call.kwargs,
+                            expected=expected,
+                            actual=actual,
+                        )
+                    )
+    finally:
+        if loop is not None:
+            loop.close()
+
+    return ReplayReport(
+        replayed=len(replayable),
+        skipped=skipped,
+        recorded_ns=recorded_ns,
+        replayed_ns=replayed_ns,
+        mismatches=mismatches,
+    )
+
+
+def report_to_results(report: ReplayReport) -> list[BenchmarkResult]:
+    """Converts a replay report to benchmark results, so replays can be saved and compared like any benchmark.
+
+    Args:
+        report: the report to convert.
+
+    Returns:
+        A "recorded" result (when durations were recorded) and a "replayed" result for each method,
+        with the method's name as the "method" param.
+    """
+    results = []
+    for name, samples in report.replayed_ns.items():
+        if name in report.recorded_ns:
+            results.append(
+                summarize_samples(
+                    "recorded", report.recorded_ns[name], params={"method": name}
+                )
+            )
+        results.append(summarize_samples("replayed", samples, params={"method": name}))
+
+    return results
+
+
+def log_report(report: ReplayReport):
+    """Logs how each method's replayed calls compare to the recorded ones. Mismatches are logged as warnings.
+
+    Args:
+        report: the report to log.
+    """
+    for name, samples in report.replayed_ns.items():
+        replayed = summarize_samples("replayed", samples)
+        message = f"{name}: {replayed.median_ns:,.0f} ns median replayed"
+
+        if name in report.recorded_ns:
+            recorded = summarize_samples("recorded", report.recorded_ns[name])
+            change = (replayed.median_ns - recorded.median_ns) / recorded.median_ns
+            message += f" vs. {recorded.median_ns:,.0f} ns recorded ({change:+.1%})"
+        _logger.info(message)
+
+    for mismatch in report.mismatches:
+        _logger.warning(
+            f"Call {mismatch.index} to {mismatch.name} returned {mismatch.actual!r}, "
+            f"expected {mismatch.expected!r}."
+        )
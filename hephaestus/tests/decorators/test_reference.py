@@ -1,10 +1,16 @@
+import asyncio
+import gc
+import inspect
 import pytest
+import weakref
+
 from hephaestus.decorators.reference import (
     reference,
     reference_getter,
     reference_ignore,
     ReferenceError,
 )
+from hephaestus.testing.swte import StrConsts
 
 
 # Define's a simple, valid reference.
@@ -23,6 +29,22 @@ class ValidReferenceClass(str):
         self._value = value
 
 
+# Same as above, but with cached methods.
+@reference(cache_methods=True)
+class CachedReferenceClass:
+
+    def __init__(self, value: str):
+        self.update(value)
+
+    @reference_getter
+    def get(self) -> str:
+        return self._value
+
+    @reference_ignore
+    def update(self, value: str):
+        self._value = value
+
+
 class TestReference:
 
     def test_verify_getter_defined(self, logger):
@@ -31,13 +53,11 @@ class TestReference:
         logger.debug("Testing something")
         with pytest.raises(ReferenceError) as execution:
 
+            # This error is thrown when the class is decorated.
             @reference
             class FakeClass:
                 pass
 
-            # This error is thrown when __new__ is called so, we need to instantiate an object.
-            FakeClass()
-
         assert "Could not find getter" in str(execution.value)
 
     def test_verify_class(self):
@@ -67,3 +87,226 @@ class TestReference:
         any method call.
         """
         assert ValidReferenceClass(None).upper() is None
+
+    def test_proxies_generated_once(self):
+        """Verifies proxy methods are generated when the class is decorated, not on each instantiation."""
+        proxy = ValidReferenceClass.upper
+
+        first = ValidReferenceClass("testing")
+        second = ValidReferenceClass("other")
+
+        assert ValidReferenceClass.upper is proxy
+        assert (first.upper(), second.upper()) == ("TESTING", "OTHER")
+
+    def test_ignored_static_and_class_methods(self):
+        """Verifies @reference_ignore is honored above or below @staticmethod and @classmethod."""
+
+        @reference
+        class Proxy:
+            @reference_getter
+            def get(self) -> str:
+                return StrConsts.DEADBEEF
+
+            @reference_ignore
+            @staticmethod
+            def static_outer() -> str:
+                return StrConsts.BADDCAFE
+
+            @staticmethod
+            @reference_ignore
+            def static_inner() -> str:
+                return StrConsts.BADDCAFE
+
+            @reference_ignore
+            @classmethod
+            def class_outer(cls) -> type:
+                return cls
+
+            @classmethod
+            @reference_ignore
+            def class_inner(cls) -> type:
+                return cls
+
+        assert Proxy.static_outer() == Proxy.static_inner() == StrConsts.BADDCAFE
+        assert Proxy.class_outer() is Proxy.class_inner() is Proxy
+
+    def test_getattr_forwards_attributes(self):
+        """Verifies attributes not defined for the reference class are looked up on the stored object."""
+        assert ValidReferenceClass("testing").isupper() is False
+        assert ValidReferenceClass(None).method_that_does_not_exist is None
+
+    def test_cached_methods(self):
+        """Verifies bound methods are reused until the stored object changes."""
+        ref = CachedReferenceClass("testing")
+
+        method = ref.upper
+        assert ref.upper is method
+        assert method() == "TESTING"
+
+        ref.update("other")
+        assert ref.upper is not method
+        assert ref.upper() == "OTHER"
+
+        with pytest.raises(AttributeError):
+            ref.method_that_does_not_exist
+
+    def test_same_qualname_classes_independent(self):
+        """Verifies classes sharing a qualified name don't share getters or ignored methods."""
+
+        def make_class(getter_name: str, ignored_name: str):
+            class SameName:
+                def __init__(self, value: str):
+                    self._value = value
+
+                @reference_ignore
+                def ignored(self) -> str:
+                    return ignored_name
+
+            def getter(self):
+                return self._value
+
+            setattr(SameName, getter_name, reference_getter(getter))
+            return reference(SameName)
+
+        first = make_class("get_first", "first")
+        second = make_class("get_second", "second")
+
+        assert first.__qualname__ == second.__qualname__
+        assert first("testing").upper() == "TESTING"
+        assert second("other").upper() == "OTHER"
+        assert (first("").ignored(), second("").ignored()) == ("first", "second")
+
+    def test_dynamic_classes_collected(self):
+        """Verifies dynamically created reference classes can be garbage collected."""
+
+        def make_class():
+            class Dynamic:
+                @reference_getter
+                def get(self):
+                    return None
+
+                @reference_ignore
+                def ignored(self):
+                    pass
+
+            return reference(Dynamic)
+
+        refs = [weakref.ref(make_class()) for _ in range(100)]
+        gc.collect()
+
+        assert all(ref() is None for ref in refs)
+
+    def test_proxy_signatures_exact(self):
+        """Verifies proxy methods keep the signature and metadata of the methods they replace."""
+
+        class Target:
+            def combine(self, first, /, second, *rest, sep=",", **extra):
+                return sep.join([first, second, *rest, *extra.values()])
+
+            @staticmethod
+            def static(value: int) -> int:
+                return value * 2
+
+        @reference
+        class Proxy(Target):
+            def __init__(self, target: Target):
+                self._target = target
+
+            @reference_getter
+            def get(self) -> Target:
+                return self._target
+
+            def combine(self, first, /, second, *rest, sep=",", **extra):
+                """Combines strings."""
+
+        proxy = Proxy(Target())
+
+        assert inspect.signature(Proxy.combine) == inspect.signature(Target.combine)
+        assert Proxy.combine.__name__ == "combine"
+        assert Proxy.combine.__doc__ == "Combines strings."
+        assert Proxy.combine.__wrapped__ is not None
+        assert proxy.combine("a", "b", "c", sep="-", d="d") == "a-b-c-d"
+        assert proxy.static(2) == 4
+
+        with pytest.raises(TypeError):
+            proxy.combine(first="a", second="b")
+
+    def test_stored_object_defaults(self):
+        """Verifies omitted arguments fall back to the stored object's defaults, not the proxy's."""
+
+        class Target:
+            def scale(self, value, factor=1, /, *extra, offset=0, **options):
+                return value, factor, extra, offset, options
+
+        class Derived(Target):
+            def scale(self, value, factor=2, /, *extra, offset=10, **options):
+                return value, factor, extra, offset, options
+
+        @reference
+        class Proxy(Target):
+            def __init__(self, target: Target):
+                self._target = target
+
+            @reference_getter
+            def get(self) -> Target:
+                return self._target
+
+        proxy = Proxy(Derived())
+
+        assert proxy.scale(1) == Derived().scale(1)
+        assert proxy.scale(1, offset=3) == Derived().scale(1, offset=3)
+        assert proxy.scale(1, 4, 5, key=6) == Derived().scale(1, 4, 5, key=6)
+
+    def test_async_methods(self):
+        """Verifies coroutine functions and async generators get async proxies, even when the stored object is null."""
+
+        class Client:
+            async def fetch(self, key: str) -> str:
+                return key.upper()
+
+            async def stream(self, count: int):
+                for index in range(count):
+                    yield index
+
+        @reference
+        class Proxy(Client):
+            def __init__(self, client: Client):
+                self._client = client
+
+            @reference_getter
+            def get(self) -> Client:
+                return self._client
+
+        async def use(proxy: Proxy):
+            return await proxy.fetch("key"), [item async for item in proxy.stream(3)]
+
+        assert inspect.iscoroutinefunction(Proxy.fetch)
+        assert inspect.isasyncgenfunction(Proxy.stream)
+        assert asyncio.run(use(Proxy(Client()))) == ("KEY", [0, 1, 2])
+        assert asyncio.run(use(Proxy(None))) == (None, [])
+
+    def test_async_getter(self):
+        """Verifies every proxy is async when the "getter" is, and attribute lookups explain why they fail."""
+
+        class Client:
+            def __init__(self):
+                self.value = StrConsts.DEADBEEF
+
+            def fetch(self) -> str:
+                return self.value
+
+        @reference
+        class Proxy(Client):
+            def __init__(self, client: Client):
+                self._client = client
+
+            @reference_getter
+            async def get(self) -> Client:
+                await asyncio.sleep(0)
+                return self._client
+
+        assert asyncio.run(Proxy(Client()).fetch()) == StrConsts.DEADBEEF
+        assert asyncio.run(Proxy(None).fetch()) is None
+
+        with pytest.raises(AttributeError, match='getter" is async'):
+            Proxy(Client()).missing
@@ -1,5 +1,21 @@
+import asyncio
+import gc
+import pytest
+import sys
+import threading
+import time
+
+from collections import deque
+
 import hephaestus.testing.swte as swte
-from hephaestus.decorators.track import TraceQueue, track
+from hephaestus.decorators.track import (
+    CapturePolicy,
+    DropPolicy,
+    TraceQueue,
+    TraceStats,
+    TrackError,
+    track,
+)
 
 
 class TestTrack:
@@ -47,3 +63,348 @@ class TestTrack:
         wrapped_fake_function()
 
         assert tq.get().retval == self.FAKE_FUNCTION_RETURN_VALUE
+
+    def test_bounded_drop_oldest(self):
+        """Verifies a full queue drops its oldest traces by default."""
+
+        tq = TraceQueue()
+        assert tq.set_capacity(2)
+
+        wrapped_fake_function = track(self._fake_function)
+        for index in range(5):
+            wrapped_fake_function(index)
+
+        assert [trace.args for trace in tq.snapshot()] == [(3,), (4,)]
+        assert tq.get_dropped_count() == 3
+
+    def test_bounded_drop_newest(self):
+        """Verifies a full queue can keep its oldest traces instead, including when shrunk."""
+
+        tq = TraceQueue()
+        wrapped_fake_function = track(self._fake_function)
+        for index in range(3):
+            wrapped_fake_function(index)
+
+        assert tq.set_capacity(2, drop_policy=DropPolicy.DROP_NEWEST)
+        wrapped_fake_function(3)
+
+        assert [trace.args for trace in tq.snapshot()] == [(0,), (1,)]
+        assert tq.get_dropped_count() == 2
+
+    def test_invalid_capacity(self):
+        """Verifies invalid capacities and drop policies are rejected."""
+
+        tq = TraceQueue()
+
+        assert not tq.set_capacity(0)
+        assert not tq.set_capacity(swte.StrConsts.DEADBEEF)
+        assert not tq.set_capacity(1, drop_policy=swte.StrConsts.BADDCAFE)
+        assert tq.get_capacity() is None
+        assert tq.get_drop_policy() == DropPolicy.DROP_OLDEST
+
+    def test_drain_and_snapshot(self):
+        """Verifies every trace can be read at once, with or without removing them."""
+
+        tq = TraceQueue()
+
+        wrapped_fake_function = track(self._fake_function)
+        for index in range(3):
+            wrapped_fake_function(index)
+
+        assert len(tq.snapshot()) == 3
+        assert [trace.args for trace in tq.drain()] == [(0,), (1,), (2,)]
+        assert tq.empty()
+        assert tq.get() is None
+
+    def test_timed_traces(self):
+        """Verifies timed traces record when the call started, how long it took, and the calling thread."""
+
+        tq = TraceQueue()
+
+        wrapped_sleep = track(time.sleep, timed=True)
+        before_ns = time.perf_counter_ns()
+        wrapped_sleep(0.01)
+
+        traced = tq.get()
+        assert traced.start_ns >= before_ns
+        assert traced.duration_ns >= 10_000_000
+        assert traced.thread_id == threading.get_ident()
+
+    def test_trace_exception(self):
+        """Verifies calls that raise are still recorded, with the exception, before it's re-raised."""
+
+        tq = TraceQueue()
+
+        @track
+        def fail():
+            raise ValueError(swte.StrConsts.DEADBEEF)
+
+        with pytest.raises(ValueError):
+            fail()
+
+        traced = tq.get()
+        assert traced.name == "fail"
+        assert isinstance(traced.exception, ValueError)
+        assert traced.duration_ns is None
+
+    def test_aggregated_stats(self):
+        """Verifies aggregated methods are counted without storing traces."""
+
+        @track(aggregate=True, keep_traces=False)
+        def maybe_fail(should_fail: bool):
+            if should_fail:
+                raise ValueError(swte.StrConsts.DEADBEEF)
+
+        for index in range(100):
+            try:
+                maybe_fail(index % 10 == 0)
+            except ValueError:
+                pass
+
+        stats = TraceStats().get(maybe_fail.__qualname__)
+        assert TraceQueue().empty()
+        assert (stats.count, stats.errors) == (100, 10)
+        assert (
+            stats.min_ns <= stats.p50_ns <= stats.p95_ns <= stats.p99_ns <= stats.max_ns
+        )
+        assert list(TraceStats().summary()) == [maybe_fail.__qualname__]
+
+    def test_traces_merged_across_threads(self):
+        """Verifies traces recorded by many threads are all collected, in the order they were recorded."""
+
+        tq = TraceQueue()
+        wrapped_fake_function = track(self._fake_function)
+        barrier = threading.Barrier(4)
+
+        def call(thread_index: int):
+            barrier.wait()
+            for index in range(50):
+                wrapped_fake_function(thread_index, index)
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        traces = tq.drain()
+        assert len(traces) == 200
+        for thread_index in range(4):
+            assert [
+                trace.args[1] for trace in traces if trace.args[0] == thread_index
+            ] == list(range(50))
+
+    def test_bounded_reads_while_recording(self):
+        """Verifies the queue can be read while full threads drop their oldest traces."""
+
+        class DroppingDeque(deque):
+            """Drops its oldest trace right after being measured, as a full owning thread would."""
+
+            def __len__(self):
+                length = super().__len__()
+                if length:
+                    self.popleft()
+                return length
+
+        tq = TraceQueue()
+        assert tq.set_capacity(2)
+        wrapped_fake_function = track(self._fake_function)
+        wrapped_fake_function(0)
+        wrapped_fake_function(1)
+
+        buffer = tq._local.buffer
+        buffer.traces = DroppingDeque(buffer.traces)
+        assert [trace.args for trace in tq.drain()] == [(1,)]
+
+        # The same, with real threads.
+        done = threading.Event()
+
+        def call():
+            while not done.is_set():
+                wrapped_fake_function()
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+
+            deadline = time.perf_counter() + 0.5
+            while time.perf_counter() < deadline:
+                assert len(tq.snapshot()) <= 2
+                assert len(tq.drain()) <= 2
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+            sys.setswitchinterval(interval)
+
+    def test_capture_policies(self):
+        """Verifies each capture policy stores only what it should of the arguments and return value."""
+
+        class Payload:
+            pass
+
+        tq = TraceQueue()
+        payload = Payload()
+
+        for capture in (
+            CapturePolicy.NONE,
+            CapturePolicy.TYPES,
+            CapturePolicy.REPR,
+            CapturePolicy.WEAKREF,
+            lambda value: swte.StrConsts.DEADBEEF,
+        ):
+            track(self._fake_function, capture=capture, max_repr_len=10)(
+                payload, "x" * 100, key=payload
+            )
+
+        none, types, repr_, weak, custom = tq.drain()
+
+        assert (none.args, none.kwargs, none.retval) == ((), {}, None)
+        assert [value.type for value in types.args] == [Payload, str]
+        assert types.retval.get() is None
+        assert len(repr_.args[1]) <= 10 and repr_.retval == "5"
+        assert weak.kwargs["key"].get() is payload
+        assert weak.args[1].get() is None  # Strings don't support weak references.
+        assert custom.args == (swte.StrConsts.DEADBEEF, swte.StrConsts.DEADBEEF)
+
+    def test_weakref_capture_releases_values(self):
+        """Verifies values captured by weak reference aren't kept alive by their traces."""
+
+        class Payload:
+            pass
+
+        tq = TraceQueue()
+        track(self._fake_function, capture=CapturePolicy.WEAKREF)(Payload())
+        gc.collect()
+
+        traced = tq.get()
+        assert traced.args[0].get() is None
+        assert "collected" in repr(traced.args[0])
+
+    def test_unknown_capture_policy(self):
+        """Verifies unknown capture policies are rejected when the method is decorated."""
+
+        with pytest.raises(TrackError):
+            track(self._fake_function, capture=swte.StrConsts.DEADBEEF)
+
+    def test_track_coroutine(self):
+        """Verifies coroutines are traced until they finish, with their result."""
+
+        tq = TraceQueue()
+
+        @track(timed=True)
+        async def wait(secs: float) -> str:
+            await asyncio.sleep(secs)
+            return swte.StrConsts.DEADBEEF
+
+        assert asyncio.run(wait(0.01)) == swte.StrConsts.DEADBEEF
+
+        traced = tq.get()
+        assert traced.retval == swte.StrConsts.DEADBEEF
+        assert traced.duration_ns >= 10_000_000
+
+    def test_track_generator(self):
+        """Verifies generators are traced until exhausted, with each item yielded and the return value."""
+
+        tq = TraceQueue()
+
+        @track
+        def echo(count: int):
+            total = 0
+            for index in range(count):
+                total += (yield index) or 0
+            return total
+
+        generator = echo(3)
+        assert tq.empty()
+
+        assert next(generator) == 0
+        assert generator.send(10) == 1
+        assert generator.send(20) == 2
+        with pytest.raises(StopIteration):
+            generator.send(30)
+
+        traced = tq.get()
+        assert traced.yielded == (0, 1, 2)
+        assert traced.retval == 60
+
+    def test_track_generator_exception(self):
+        """Verifies exceptions raised by or thrown into a generator are traced."""
+
+        tq = TraceQueue()
+
+        @track
+        def fail():
+            yield 1
+            raise ValueError(swte.StrConsts.DEADBEEF)
+
+        with pytest.raises(ValueError):
+            list(fail())
+
+        traced = tq.get()
+        assert traced.yielded == (1,)
+        assert isinstance(traced.exception, ValueError)
+
+    def test_unfinished_calls(self):
+        """Verifies cancelled coroutines and generators closed early are traced as failures."""
+
+        tq = TraceQueue()
+
+        @track(aggregate=True)
+        async def wait():
+            await asyncio.sleep(10)
+
+        @track(aggregate=True)
+        def count():
+            yield from range(3)
+
+        async def cancel():
+            task = asyncio.create_task(wait())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+
+        generator = count()
+        assert next(generator) == 0
+        generator.close()
+
+        cancelled, closed = tq.drain()
+        assert isinstance(cancelled.exception, asyncio.CancelledError)
+        assert isinstance(closed.exception, GeneratorExit)
+        assert closed.yielded == (0,) and closed.retval is None
+        assert TraceStats().get(wait.__qualname__).errors == 1
+        assert TraceStats().get(count.__qualname__).errors == 1
+
+    def test_track_async_generator(self):
+        """Verifies async generators are traced until exhausted or closed."""
+
+        tq = TraceQueue()
+
+        @track(capture=CapturePolicy.TYPES)
+        async def count(limit: int):
+            for index in range(limit):
+                await asyncio.sleep(0)
+                yield index
+
+        async def consume():
+            items = [item async for item in count(3)]
+
+            # Stop early. The trace should still be recorded once the generator is closed.
+            generator = count(3)
+            await generator.__anext__()
+            await generator.aclose()
+            return items
+
+        assert asyncio.run(consume()) == [0, 1, 2]
+
+        exhausted, closed = tq.drain()
+        assert [value.type for value in exhausted.yielded] == [int, int, int]
+        assert exhausted.exception is None
+        assert len(closed.yielded) == 1
+        assert isinstance(closed.exception, GeneratorExit)
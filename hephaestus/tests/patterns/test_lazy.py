@@ -0,0 +1,89 @@
+import pytest
+import threading
+import time
+
+from hephaestus.decorators.reference import ReferenceError
+from hephaestus.patterns.lazy import is_initialized, lazy_reference, release
+from hephaestus.testing.swte import StrConsts
+
+
+class HeavyClient:
+    """Counts how many times it's been constructed."""
+
+    constructed = 0
+
+    def __init__(self, name: str, delay_secs: float = 0.0):
+        time.sleep(delay_secs)
+        HeavyClient.constructed += 1
+        self.name = name
+
+    def query(self, value: str, *, upper: bool = False) -> str:
+        return f"{self.name}:{value.upper() if upper else value}"
+
+
+@pytest.fixture(autouse=True)
+def reset_count():
+    HeavyClient.constructed = 0
+
+
+class TestLazy:
+
+    def test_constructed_on_first_use(self):
+        """Verifies the instance is only constructed once a method or attribute is used."""
+        LazyClient = lazy_reference(HeavyClient)
+        client = LazyClient(StrConsts.DEADBEEF)
+
+        assert isinstance(client, HeavyClient)
+        assert not is_initialized(client)
+        assert HeavyClient.constructed == 0
+
+        assert client.query("a", upper=True) == f"{StrConsts.DEADBEEF}:A"
+        assert client.name == StrConsts.DEADBEEF
+        assert is_initialized(client)
+        assert HeavyClient.constructed == 1
+
+    def test_constructed_once_across_threads(self):
+        """Verifies concurrent first uses construct the instance exactly once."""
+        client = lazy_reference(HeavyClient)(StrConsts.DEADBEEF, delay_secs=0.1)
+
+        threads = [threading.Thread(target=client.query, args=("a",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert HeavyClient.constructed == 1
+
+    def test_released_when_idle(self):
+        """Verifies an unused instance is released after the idle timeout and rebuilt on next use."""
+        released = []
+        client = lazy_reference(
+            HeavyClient, idle_timeout_secs=0.1, on_release=released.append
+        )(StrConsts.DEADBEEF)
+
+        client.query("a")
+        for _ in range(5):
+            time.sleep(0.05)
+            client.query("a")
+
+        # Kept alive while in use.
+        assert is_initialized(client)
+
+        time.sleep(0.3)
+        assert not is_initialized(client)
+        assert [client_.name for client_ in released] == [StrConsts.DEADBEEF]
+
+        client.query("a")
+        assert HeavyClient.constructed == 2
+
+    def test_explicit_release(self):
+        """Verifies instances can be released on demand and only lazy proxies are accepted."""
+        client = lazy_reference(HeavyClient)(StrConsts.DEADBEEF)
+
+        assert not release(client)
+        client.query("a")
+        assert release(client)
+        assert not is_initialized(client)
+
+        with pytest.raises(ReferenceError):
+            release(HeavyClient(StrConsts.BADDCAFE))
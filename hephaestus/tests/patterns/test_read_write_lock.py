@@ -0,0 +1,132 @@
+import pytest
+import threading
+import time
+
+from hephaestus.patterns.read_write_lock import ReadWriteLock, ReadWriteLockError
+from hephaestus.patterns.singleton import (
+    get_lock_type,
+    set_lock_type,
+    Singleton,
+)
+
+
+def _in_thread(method, *args) -> threading.Thread:
+    thread = threading.Thread(target=method, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def _acquired_elsewhere(lock: ReadWriteLock, read: bool) -> bool:
+    """Tries to acquire a side of a lock from another thread, releasing it if acquired."""
+    acquire, release = (
+        (lock.acquire_read, lock.release_read)
+        if read
+        else (lock.acquire_write, lock.release_write)
+    )
+    result = []
+
+    def try_acquire():
+        result.append(acquire(timeout=0.05))
+        if result[0]:
+            release()
+
+    _in_thread(try_acquire).join()
+    return result[0]
+
+
+class TestReadWriteLock:
+
+    def test_shared_reads(self):
+        """Verifies readers share the lock and writers wait for them."""
+        lock = ReadWriteLock()
+        both_reading = threading.Barrier(2, timeout=1)
+
+        def read():
+            with lock.read():
+                both_reading.wait()
+
+        thread = _in_thread(read)
+        read()
+        thread.join()
+
+        with lock.read():
+            assert not _acquired_elsewhere(lock, read=False)
+        assert _acquired_elsewhere(lock, read=False)
+
+    def test_writer_preference(self):
+        """Verifies new readers wait behind a waiting writer, while existing readers may re-enter."""
+        lock = ReadWriteLock()
+        written = threading.Event()
+
+        def write():
+            with lock.write():
+                written.set()
+
+        lock.acquire_read()
+        writer = _in_thread(write)
+        while not lock._writers_waiting:
+            time.sleep(0.001)
+
+        assert not _acquired_elsewhere(lock, read=True)
+        assert lock.acquire_read(timeout=0.05)
+        lock.release_read()
+
+        lock.release_read()
+        writer.join(timeout=1)
+        assert written.is_set()
+
+    def test_reentrancy(self):
+        """Verifies writers may re-enter and downgrade, and readers may not upgrade."""
+        lock = ReadWriteLock()
+
+        with lock:
+            with lock.write():
+                assert not _acquired_elsewhere(lock, read=True)
+            lock.acquire_read()
+        assert not _acquired_elsewhere(lock, read=False)
+        assert _acquired_elsewhere(lock, read=True)
+
+        with pytest.raises(ReadWriteLockError):
+            lock.acquire_write()
+        lock.release_read()
+
+        with pytest.raises(ReadWriteLockError):
+            lock.release_read()
+        with pytest.raises(ReadWriteLockError):
+            lock.release()
+
+    def test_singleton_lock_type(self):
+        """Verifies Singleton classes accept the lock for all objects or as a per-class override set before first use."""
+
+        class Config(metaclass=Singleton):
+            _lock_type = ReadWriteLock
+
+        class Table(metaclass=Singleton):
+            pass
+
+        class Other(metaclass=Singleton):
+            pass
+
+        class InUse(metaclass=Singleton):
+            pass
+
+        lock = InUse()._lock
+        assert set_lock_type(ReadWriteLock, cls=Table)
+        assert not set_lock_type(ReadWriteLock, cls=InUse)
+        assert not set_lock_type(ReadWriteLock, cls=str)
+        assert isinstance(Config()._lock, ReadWriteLock)
+        assert isinstance(Table()._lock, ReadWriteLock)
+        assert not isinstance(Other()._lock, ReadWriteLock)
+        assert InUse()._lock is lock
+
+        default = get_lock_type()
+        assert set_lock_type(ReadWriteLock)
+        try:
+
+            class Later(metaclass=Singleton):
+                pass
+
+            with Later()._lock.read():
+                pass
+        finally:
+            assert set_lock_type(default)
@@ -1,10 +1,29 @@
+import asyncio
+import os
+import pytest
+import signal
 import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 from typing import Callable
 
 from hephaestus.io.logging import get_logger
-from hephaestus.patterns.singleton import set_lock_type, get_lock_type, Singleton
+from hephaestus.patterns.singleton import (
+    clear_all,
+    set_fork_policy,
+    set_fork_safety,
+    set_scope,
+    singleton_scope,
+    set_lock_type,
+    get_lock_type,
+    AsyncSingleton,
+    ForkPolicy,
+    Singleton,
+    SingletonError,
+    SingletonScope,
+)
 from hephaestus.testing.swte import StrConsts
 from hephaestus.testing.mock.threading import MockLock
 
@@ -22,6 +41,32 @@ class FakeClassTwo(metaclass=Singleton):
     pass
 
 
+def _in_fork(check: Callable[[], bool], timeout_secs: float = 5) -> bool:
+    """Runs a check in a forked child process.
+
+    Returns:
+        True if the check passed in the child; False if it failed, raised, or hung.
+    """
+    pid = os.fork()
+    if pid == 0:
+        passed = False
+        try:
+            passed = check()
+        finally:
+            os._exit(0 if passed else 1)
+
+    deadline = time.monotonic() + timeout_secs
+    while time.monotonic() < deadline:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status) == 0
+        time.sleep(0.01)
+
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    return False
+
+
 class TestSingleton:
 
     def _execute_possible_deadlock_test(
@@ -140,3 +185,266 @@ class TestSingleton:
             _ = ParentSingleton()
 
         self._execute_possible_deadlock_test(test_case=test_case, expect_deadlock=False)
+
+    def test_concurrent_creation(self):
+        """Verifies threads racing to create an instance construct it exactly once."""
+        created = []
+        start = threading.Barrier(8)
+
+        class SlowSingleton(metaclass=Singleton):
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.01)
+
+        def create():
+            start.wait()
+            return SlowSingleton()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: create(), range(8)))
+
+        assert len(created) == 1
+        assert all(instance is created[0] for instance in instances)
+
+    def test_falsy_instance_reused(self):
+        """Verifies instances that evaluate as False are reused rather than recreated."""
+
+        class EmptySingleton(metaclass=Singleton):
+            def __len__(self):
+                return 0
+
+        assert EmptySingleton() is EmptySingleton()
+
+    def test_recreated_after_clear(self):
+        """Verifies a new instance is created after all instances are cleared."""
+        obj1 = FakeClassOne()
+        clear_all()
+
+        assert FakeClassOne() is not obj1
+        assert FakeClassOne() is FakeClassOne()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork.")
+    def test_fork_replaces_locks(self):
+        """Verifies children forked while other threads use and hold Singleton locks can still use them."""
+
+        class HeldSingleton(metaclass=Singleton):
+            pass
+
+        held = HeldSingleton()
+        stop = threading.Event()
+        holding = threading.Event()
+
+        def hold():
+            with held._lock:
+                holding.set()
+                stop.wait()
+
+        def use():
+            while not stop.is_set():
+                FakeClassOne()
+                HeldSingleton()
+                clear_all()
+
+        def check() -> bool:
+            lock = HeldSingleton()._lock
+            acquired = lock.acquire(timeout=1)
+            return acquired and FakeClassOne() is FakeClassOne()
+
+        threads = [threading.Thread(target=hold)] + [
+            threading.Thread(target=use) for _ in range(4)
+        ]
+        assert set_fork_safety(True)
+        try:
+            for thread in threads:
+                thread.start()
+            holding.wait()
+
+            assert all(_in_fork(check) for _ in range(5))
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            set_fork_safety(False)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork.")
+    def test_fork_policies(self):
+        """Verifies instances are kept, reset, or rebuilt in the child according to their fork policy."""
+
+        class KeptSingleton(metaclass=Singleton):
+            pass
+
+        class ResetSingleton(metaclass=Singleton):
+            _fork_policy = ForkPolicy.RESET
+
+            def __init__(self, value: str = ""):
+                self.value = value
+
+        class RebuiltSingleton(metaclass=Singleton):
+            def __init__(self, value: str = ""):
+                self.value = value
+
+        assert set_fork_policy(RebuiltSingleton, ForkPolicy.REBUILD)
+        assert not set_fork_policy(FakeClassOne, "unknown")
+        assert not set_fork_policy(str, ForkPolicy.RESET)
+
+        kept = KeptSingleton()
+        reset = ResetSingleton(StrConsts.DEADBEEF)
+        rebuilt = RebuiltSingleton(StrConsts.DEADBEEF)
+
+        def check() -> bool:
+            new_reset = ResetSingleton(StrConsts.BADDCAFE)
+            new_rebuilt = RebuiltSingleton(StrConsts.BADDCAFE)
+            return (
+                KeptSingleton() is kept
+                and new_reset is not reset
+                and new_reset.value == StrConsts.BADDCAFE
+                and new_rebuilt is not rebuilt
+                and new_rebuilt.value == StrConsts.DEADBEEF
+            )
+
+        assert set_fork_safety(True)
+        try:
+            assert _in_fork(check)
+        finally:
+            set_fork_safety(False)
+
+        assert ResetSingleton() is reset and RebuiltSingleton() is rebuilt
+
+    def test_async_single_initialization(self):
+        """Verifies tasks creating an async singleton at once all await a single initialization."""
+        initialized = []
+
+        class AsyncService(metaclass=AsyncSingleton):
+            def __init__(self, value: str):
+                self.value = value
+
+            async def _async_init(self):
+                initialized.append(self)
+                await asyncio.sleep(0.01)
+
+        async def create_many():
+            return await asyncio.gather(
+                *(AsyncService.create(StrConsts.DEADBEEF) for _ in range(10))
+            )
+
+        with pytest.raises(SingletonError):
+            AsyncService()
+
+        instances = asyncio.run(create_many())
+        assert len(initialized) == 1
+        assert all(instance is initialized[0] for instance in instances)
+        assert AsyncService() is initialized[0]
+        assert AsyncService().value == StrConsts.DEADBEEF
+
+    def test_async_retry_and_clear(self):
+        """Verifies failed async initializations are raised to every waiter and retried, and cleared instances recreated."""
+        attempts = []
+
+        class FlakyService(metaclass=AsyncSingleton):
+            async def _async_init(self):
+                attempts.append(self)
+                await asyncio.sleep(0.01)
+                if len(attempts) == 1:
+                    raise ConnectionError(StrConsts.DEADBEEF)
+
+        async def create_many():
+            return await asyncio.gather(
+                *(FlakyService.create() for _ in range(5)), return_exceptions=True
+            )
+
+        results = asyncio.run(create_many())
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+        first = asyncio.run(FlakyService.create())
+        assert len(attempts) == 2 and first is attempts[1]
+
+        clear_all()
+        assert asyncio.run(FlakyService.create()) is not first
+        assert len(attempts) == 3
+
+    def test_async_cancelled_waiter(self):
+        """Verifies cancelling one task waiting on an async singleton doesn't cancel its initialization."""
+
+        class SlowService(metaclass=AsyncSingleton):
+            async def _async_init(self):
+                await asyncio.sleep(0.05)
+
+        async def cancel_one():
+            cancelled = asyncio.create_task(SlowService.create())
+            waiting = asyncio.create_task(SlowService.create())
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            return await waiting
+
+        assert asyncio.run(cancel_one()) is SlowService()
+
+    def test_thread_scope(self):
+        """Verifies thread-scoped classes have one instance per thread, torn down when the thread exits."""
+        torn_down = []
+
+        class PerThread(metaclass=Singleton):
+            _scope = SingletonScope.THREAD
+
+            def _teardown(self):
+                torn_down.append(self)
+
+        def create(instances: list):
+            instances.extend([PerThread(), PerThread()])
+
+        other = []
+        thread = threading.Thread(target=create, args=(other,))
+        thread.start()
+        thread.join()
+        ours = PerThread()
+
+        assert other[0] is other[1] and other[0] is not ours
+        assert ours is PerThread() and hasattr(ours, Singleton.LOCK_ATTR_KEY)
+
+        assert torn_down == [other[0]]
+
+        clear_all()
+        assert torn_down[1] is ours and PerThread() is not ours
+
+    def test_context_scope(self):
+        """Verifies context-scoped classes have one instance per scope, shared with its tasks and torn down when it exits."""
+        torn_down = []
+
+        class PerRequest(metaclass=Singleton):
+            def _teardown(self):
+                torn_down.append(self)
+
+        class Dependent(metaclass=Singleton):
+            _scope = SingletonScope.CONTEXT
+
+            def __init__(self):
+                self.request = PerRequest()
+
+            def _teardown(self):
+                torn_down.append(self)
+
+        assert set_scope(PerRequest, SingletonScope.CONTEXT)
+        assert not set_scope(PerRequest, "unknown")
+
+        async def handle():
+            with singleton_scope():
+                request = PerRequest()
+                shared = await asyncio.gather(
+                    *(asyncio.to_thread(PerRequest) for _ in range(3))
+                )
+                assert all(instance is request for instance in shared)
+
+                dependent = Dependent()
+                with singleton_scope():
+                    assert PerRequest() is not request
+                assert dependent.request is request
+
+            return request, dependent
+
+        first, dependent = asyncio.run(handle())
+        second, _ = asyncio.run(handle())
+
+        assert first is not second
+        assert torn_down[0] is not first
+        assert torn_down[1:3] == [dependent, first]
+        with pytest.raises(SingletonError):
+            PerRequest()
@@ -0,0 +1,83 @@
+import pytest
+import time
+
+from hephaestus.patterns.singleton import Singleton, SingletonScope
+from hephaestus.patterns.warm_up import register, unregister, warm_up
+from hephaestus.testing.swte import StrConsts
+
+
+def _slow_class(delay_secs: float = 0.1) -> type:
+    class Slow(metaclass=Singleton):
+        def __init__(self, value: str = ""):
+            time.sleep(delay_secs)
+            self.value = value
+
+    return Slow
+
+
+class TestWarmUp:
+
+    def test_parallel(self):
+        """Verifies independent classes are created in parallel and each reports its init time."""
+        classes = [_slow_class() for _ in range(4)]
+        reported = []
+
+        start = time.perf_counter()
+        results = warm_up(classes, on_ready=reported.append)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.3
+        assert [result.cls for result in results] == classes
+        assert all(result.ready and result.created for result in results)
+        assert all(result.init_secs >= 0.1 for result in results)
+        assert sorted(reported, key=lambda result: classes.index(result.cls)) == results
+
+        # Already warm.
+        assert not any(result.created for result in warm_up(classes))
+
+    def test_registered(self):
+        """Verifies registered classes are created with their registered arguments."""
+        Slow = _slow_class(0)
+
+        class Scoped(metaclass=Singleton):
+            _scope = SingletonScope.THREAD
+
+        assert register(Slow, StrConsts.DEADBEEF)
+        assert not register(Scoped)
+        assert not register(str)
+        try:
+            result = next(result for result in warm_up() if result.cls is Slow)
+        finally:
+            assert unregister(Slow)
+
+        assert result.ready and Slow().value == StrConsts.DEADBEEF
+        assert not unregister(Slow)
+
+    def test_failures_and_timeouts(self):
+        """Verifies failed and slow classes are reported as not ready without holding up the rest."""
+        Quick, Slow = _slow_class(0), _slow_class(1)
+
+        class Broken(metaclass=Singleton):
+            def __init__(self):
+                raise ConnectionError(StrConsts.DEADBEEF)
+
+        class Dependent(metaclass=Singleton):
+            def __init__(self):
+                self.quick = Quick()
+
+        results = warm_up([Broken, Slow, Dependent, Quick], timeout_secs=0.5)
+
+        assert [result.ready for result in results] == [False, False, True, True]
+        assert isinstance(results[0].exception, ConnectionError)
+        assert isinstance(results[1].exception, TimeoutError)
+        assert Dependent().quick is Quick()
+
+    def test_timeout_init_secs(self):
+        """Verifies classes that time out report the time since they started, or None if they never did."""
+        First, Slow, Queued = _slow_class(0.2), _slow_class(1), _slow_class(0)
+
+        results = warm_up([First, Slow, Queued], max_workers=1, timeout_secs=0.5)
+
+        assert [result.ready for result in results] == [True, False, False]
+        assert 0.25 <= results[1].init_secs < 0.45
+        assert results[2].init_secs is None
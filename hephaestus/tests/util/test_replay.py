@@ -0,0 +1,110 @@
+import pytest
+
+from hephaestus.decorators.track import CapturePolicy, TraceQueue, track
+from hephaestus.testing.replay import (
+    ReplayError,
+    load_calls,
+    replay_calls,
+    report_to_results,
+    save_calls,
+)
+from hephaestus.testing.swte import StrConsts
+
+
+def _scale(values: list, factor: int = 2) -> list:
+    if factor < 0:
+        raise ValueError(StrConsts.DEADBEEF)
+    return [value * factor for value in values]
+
+
+def _count(limit: int):
+    for index in range(limit):
+        yield index
+    return limit
+
+
+def _record(path) -> int:
+    scale, count = track(_scale, timed=True), track(_count, timed=True)
+    scale([1, 2], factor=3)
+    with pytest.raises(ValueError):
+        scale([], factor=-1)
+    list(count(3))
+    return save_calls(TraceQueue().drain(), path)
+
+
+class TestReplay:
+
+    def test_round_trip(self, tmp_path):
+        """Verifies recorded calls are saved and loaded with their arguments, outcomes, and timing."""
+        path = tmp_path / "workload.bin"
+        assert _record(path) == 3
+
+        calls = list(load_calls(path))
+        assert [call.name for call in calls] == ["_scale", "_scale", "_count"]
+        assert (calls[0].args, calls[0].kwargs, calls[0].retval) == (
+            ([1, 2],),
+            {"factor": 3},
+            [3, 6],
+        )
+        assert isinstance(calls[1].exception, ValueError)
+        assert (calls[2].yielded, calls[2].retval) == ((0, 1, 2), 3)
+        assert all(call.duration_ns is not None for call in calls)
+
+    def test_replay_matches(self, tmp_path):
+        """Verifies replaying against the same methods times every call without mismatches."""
+        path = tmp_path / "workload.bin"
+        _record(path)
+
+        report = replay_calls(
+            load_calls(path), {"_scale": _scale, "_count": _count}, iterations=3
+        )
+
+        assert (report.replayed, report.skipped, report.mismatches) == (3, 0, [])
+        assert len(report.replayed_ns["_scale"]) == 6
+        assert len(report.recorded_ns["_scale"]) == 2
+        assert {
+            (result.name, result.params["method"])
+            for result in report_to_results(report)
+        } == {
+            ("recorded", "_scale"),
+            ("replayed", "_scale"),
+            ("recorded", "_count"),
+            ("replayed", "_count"),
+        }
+
+    def test_replay_mismatches(self, tmp_path):
+        """Verifies changed return values and exceptions are reported, and unknown methods skipped."""
+        path = tmp_path / "workload.bin"
+        _record(path)
+
+        def new_scale(values: list, factor: int = 2) -> list:
+            return [value * factor + 1 for value in values]
+
+        report = replay_calls(load_calls(path), {"_scale": new_scale})
+
+        assert (report.replayed, report.skipped) == (2, 1)
+        assert [mismatch.index for mismatch in report.mismatches] == [0, 1]
+        assert report.mismatches[0].actual == [4, 7]
+        assert isinstance(report.mismatches[1].expected, ValueError)
+
+    def test_unreplayable(self, tmp_path):
+        """Verifies unfinished calls and calls without their real arguments aren't saved, and other files are rejected."""
+        for capture in (
+            CapturePolicy.NONE,
+            CapturePolicy.TYPES,
+            CapturePolicy.REPR,
+            CapturePolicy.WEAKREF,
+            lambda value: value,
+        ):
+            track(_scale, capture=capture)([1], factor=4)
+
+        generator = track(_count)(3)
+        next(generator)
+        generator.close()
+
+        assert save_calls(TraceQueue().drain(), tmp_path / "workload.bin") == 0
+
+        path = tmp_path / "other.bin"
+        path.write_bytes(StrConsts.DEADBEEF.encode())
+        with pytest.raises(ReplayError):
+            list(load_calls(path))
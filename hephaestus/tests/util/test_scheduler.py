@@ -0,0 +1,92 @@
+import pytest
+import sys
+
+from hephaestus.io.scheduler import CommandGraph, NodeStatus, SchedulerError
+from hephaestus.testing.swte import StrConsts
+
+
+def _sleep_cmd(secs: float) -> list[str]:
+    return [sys.executable, "-c", f"import time; time.sleep({secs})"]
+
+
+class TestScheduler:
+
+    def test_independent_nodes_run_in_parallel(self):
+        """Verifies nodes without dependencies on one another run at the same time."""
+        graph = CommandGraph()
+        for index in range(3):
+            graph.add(str(index), _sleep_cmd(0.5))
+
+        report = graph.run(max_workers=3)
+
+        assert report.successful
+        assert report.duration_secs < 1.25
+
+    def test_dependencies_respected(self):
+        """Verifies a node only starts after its dependencies finish."""
+        graph = CommandGraph()
+        graph.add("first", _sleep_cmd(0.2))
+        graph.add("second", _sleep_cmd(0.1), depends_on=["first"])
+        graph.add("other", _sleep_cmd(0.0))
+
+        report = graph.run(max_workers=3)
+        first, second = report.results["first"], report.results["second"]
+
+        assert report.successful
+        assert second.start_secs >= first.start_secs + first.duration_secs
+        assert report.critical_path == ["first", "second"]
+
+    def test_repeated_dependency(self):
+        """Verifies a dependency listed more than once is only waited on once."""
+        graph = CommandGraph()
+        graph.add("first", _sleep_cmd(0.0))
+        graph.add("second", _sleep_cmd(0.0), depends_on=["first", "first"])
+
+        report = graph.run(max_workers=2)
+
+        assert report.successful
+        assert report.critical_path == ["first", "second"]
+
+    def test_empty_node_name(self):
+        """Verifies a node named with an empty string stays on the critical path."""
+        graph = CommandGraph()
+        graph.add("", _sleep_cmd(0.2))
+        graph.add("last", _sleep_cmd(0.0), depends_on=[""])
+
+        report = graph.run(max_workers=2)
+
+        assert report.successful
+        assert report.critical_path == ["", "last"]
+
+    def test_failure_cancels_dependents(self):
+        """Verifies every node downstream of a failure is cancelled while unrelated nodes still run."""
+        graph = CommandGraph()
+        graph.add("broken", [sys.executable, "-c", "exit(1)"])
+        graph.add("child", _sleep_cmd(0.0), depends_on=["broken"])
+        graph.add("grandchild", _sleep_cmd(0.0), depends_on=["child"])
+        graph.add("unrelated", _sleep_cmd(0.0))
+
+        report = graph.run()
+        statuses = {name: result.status for name, result in report.results.items()}
+
+        assert not report.successful
+        assert statuses == {
+            "broken": NodeStatus.FAILED,
+            "child": NodeStatus.CANCELLED,
+            "grandchild": NodeStatus.CANCELLED,
+            "unrelated": NodeStatus.SUCCEEDED,
+        }
+
+    def test_invalid_graphs(self):
+        """Verifies unknown dependencies, duplicate names, and cycles are rejected."""
+        graph = CommandGraph()
+        graph.add(StrConsts.DEADBEEF, _sleep_cmd(0.0), depends_on=[StrConsts.BADDCAFE])
+        with pytest.raises(SchedulerError, match="unknown node"):
+            graph.run()
+
+        with pytest.raises(SchedulerError, match="already been added"):
+            graph.add(StrConsts.DEADBEEF, _sleep_cmd(0.0))
+
+        graph.add(StrConsts.BADDCAFE, _sleep_cmd(0.0), depends_on=[StrConsts.DEADBEEF])
+        with pytest.raises(SchedulerError, match="cycle"):
+            graph.run()
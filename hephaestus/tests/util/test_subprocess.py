@@ -0,0 +1,264 @@
+import logging
+import os
+import pytest
+import signal
+import subprocess
+import sys
+import time
+
+import hephaestus.io.subprocess as subprocess_
+from hephaestus.common.exceptions import _InternalError
+from hephaestus.io.subprocess import (
+    LaunchBackend,
+    OutputBatchOptions,
+    PipelineError,
+    SubprocessError,
+    command_successful,
+    get_command_output,
+    get_launch_backend,
+    get_pipeline_output,
+    run_command,
+    run_pipeline,
+    set_launch_backend,
+)
+from hephaestus.testing.swte import StrConsts
+
+
+@pytest.fixture(params=[LaunchBackend.POPEN, LaunchBackend.POSIX_SPAWN])
+def backend(request):
+    """Runs a test case once per launch backend."""
+    original_backend = get_launch_backend()
+    if not set_launch_backend(request.param):
+        pytest.skip(f"{request.param} is not available on this platform.")
+
+    yield request.param
+
+    set_launch_backend(original_backend)
+
+
+class TestSubprocess:
+
+    def test_capture_output(self, backend):
+        """Verifies command output is captured line-by-line."""
+        output = get_command_output(
+            [
+                sys.executable,
+                "-c",
+                f"print('{StrConsts.DEADBEEF}\\n{StrConsts.BADDCAFE}')",
+            ],
+            err="Failed to print.",
+            close_fds=False,
+        )
+
+        assert output == [StrConsts.DEADBEEF, StrConsts.BADDCAFE]
+
+    def test_capture_stderr(self, backend):
+        """Verifies output to stderr is captured alongside stdout."""
+        output = get_command_output(
+            [
+                sys.executable,
+                "-c",
+                f"import sys; sys.stderr.write('{StrConsts.DEADBEEF}\\n')",
+            ],
+            err="Failed to print.",
+            close_fds=False,
+        )
+
+        assert output == [StrConsts.DEADBEEF]
+
+    def test_command_failure(self, backend):
+        """Verifies a failing command is reported as such."""
+        assert command_successful([sys.executable, "-c", "exit(0)"], close_fds=False)
+        assert not command_successful(
+            [sys.executable, "-c", "exit(1)"], close_fds=False
+        )
+
+        with pytest.raises(SubprocessError):
+            get_command_output(
+                [sys.executable, "-c", "exit(3)"], err="Expected.", close_fds=False
+            )
+
+    def test_env_passed(self, backend):
+        """Verifies the passed environment is used by the command."""
+        env = dict(os.environ, HEPHAESTUS_TEST=StrConsts.DEADBEEF)
+        output = get_command_output(
+            [sys.executable, "-c", "import os; print(os.environ['HEPHAESTUS_TEST'])"],
+            err="Failed to print.",
+            env=env,
+            close_fds=False,
+        )
+
+        assert output == [StrConsts.DEADBEEF]
+
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/self/status"), reason="Requires procfs."
+    )
+    def test_signal_dispositions(self):
+        """Verifies children of both backends start with the same signals ignored."""
+        original_backend = get_launch_backend()
+        ignored = {}
+        try:
+            for backend in (LaunchBackend.POPEN, LaunchBackend.POSIX_SPAWN):
+                if not set_launch_backend(backend):
+                    pytest.skip(f"{backend} is not available on this platform.")
+                output = get_command_output(
+                    ["grep", "^SigIgn:", "/proc/self/status"],
+                    err="Failed to read signal dispositions.",
+                    close_fds=False,
+                )
+
+                # Only compare signals available to Python; libc reserves a few for itself.
+                mask = int(output[0].split()[1], 16)
+                ignored[backend] = {
+                    sig for sig in signal.valid_signals() if mask & (1 << (sig - 1))
+                }
+        finally:
+            set_launch_backend(original_backend)
+
+        assert ignored[LaunchBackend.POPEN] == ignored[LaunchBackend.POSIX_SPAWN]
+
+        # A writer whose reader exits early ends quietly, rather than reporting a broken pipe.
+        output = get_command_output(["sh", "-c", "yes | head -1"], err="Failed to run.")
+        assert output == ["y"]
+
+    def test_popen_fallback(self, tmp_path):
+        """Verifies arguments posix_spawn can't honor fall back to Popen."""
+        assert not subprocess_._can_spawn((), {"cwd": tmp_path})
+        assert not subprocess_._can_spawn((), {"close_fds": True})
+        assert not subprocess_._can_spawn((), {})
+        assert not subprocess_._can_spawn((), {"cwd": tmp_path, "close_fds": False})
+        assert not subprocess_._can_spawn((1,), {})
+
+        # The command still runs where it was asked to.
+        output = get_command_output(
+            [sys.executable, "-c", "import os; print(os.getcwd())"],
+            err="Failed to print.",
+            cwd=tmp_path,
+        )
+        assert output == [str(tmp_path)]
+
+    def test_invalid_backend(self):
+        """Verifies unknown backends are rejected."""
+        original_backend = get_launch_backend()
+
+        assert not set_launch_backend(StrConsts.DEADBEEF)
+        assert get_launch_backend() == original_backend
+
+    def test_executable_cache_invalidation(self, tmp_path):
+        """Verifies cached executable locations are dropped when PATH changes."""
+        cache = subprocess_._ExecutableCache()
+        first, second = tmp_path / "first", tmp_path / "second"
+
+        for folder in (first, second):
+            folder.mkdir()
+            executable = folder / "hephaestus-test"
+            executable.write_text("#!/bin/sh\n")
+            executable.chmod(0o755)
+
+        assert cache.resolve("hephaestus-test", {"PATH": str(first)}) == str(
+            first / "hephaestus-test"
+        )
+        assert cache.resolve("hephaestus-test", {"PATH": str(second)}) == str(
+            second / "hephaestus-test"
+        )
+        assert cache.resolve("hephaestus-test-missing", {"PATH": str(second)}) is None
+
+    def test_batched_output_by_lines(self, caplog):
+        """Verifies batched output is logged as one record per full block."""
+        with caplog.at_level(logging.DEBUG, logger=subprocess_.__name__):
+            run_command(
+                [sys.executable, "-c", "for i in range(5): print(i)"],
+                err="Failed to print.",
+                batch_output=OutputBatchOptions(max_lines=2, max_delay_ms=10_000),
+            )
+
+        blocks = [
+            record.getMessage().splitlines()[1:]
+            for record in caplog.records
+            if hasattr(record, "cmd")
+        ]
+        assert blocks == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_batched_output_by_time(self, caplog):
+        """Verifies held output is logged once the max delay passes, even if the block isn't full."""
+        batcher = subprocess_._OutputBatcher(
+            cmd=StrConsts.DEADBEEF,
+            log_level=logging.INFO,
+            options=OutputBatchOptions(max_lines=100, max_delay_ms=10),
+        )
+
+        with caplog.at_level(logging.DEBUG, logger=subprocess_.__name__):
+            with batcher:
+                batcher.add(StrConsts.BADDCAFE)
+                time.sleep(0.5)
+                batcher.add(StrConsts.DEADBEEF)
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages == [
+            f"Cmd Output (`{StrConsts.DEADBEEF}`):\n{StrConsts.BADDCAFE}",
+            f"Cmd Output (`{StrConsts.DEADBEEF}`):\n{StrConsts.DEADBEEF}",
+        ]
+
+    def test_pipeline_output(self):
+        """Verifies each stage's output is fed to the next and only the final output is returned."""
+        output = get_pipeline_output(
+            [
+                [sys.executable, "-c", "for i in range(10): print(i)"],
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys; [print(line, end='') for line in sys.stdin if int(line) % 2]",
+                ],
+                [sys.executable, "-c", "import sys; print(len(sys.stdin.readlines()))"],
+            ],
+            err="Failed to count.",
+        )
+
+        assert output == ["5"]
+
+    def test_pipeline_stage_failure(self):
+        """Verifies failed stages are reported individually."""
+        with pytest.raises(PipelineError) as execution:
+            run_pipeline(
+                [
+                    [sys.executable, "-c", "print(1)"],
+                    [sys.executable, "-c", "import sys; sys.stdin.read(); exit(2)"],
+                    [sys.executable, "-c", "import sys; sys.stdin.read()"],
+                ],
+                err=StrConsts.DEADBEEF,
+            )
+
+        assert [(index, retcode) for index, _, retcode in execution.value.failures] == [
+            (1, 2)
+        ]
+        assert StrConsts.DEADBEEF in str(execution.value)
+
+    def test_empty_pipeline(self):
+        """Verifies a pipeline without any stages is reported as a failure."""
+        with pytest.raises(PipelineError, match="no stages"):
+            get_pipeline_output([], err=StrConsts.DEADBEEF)
+
+    def test_pipeline_launch_failure(self, monkeypatch):
+        """Verifies stages already started are stopped, with their pipes closed, when a later one can't launch."""
+        started = []
+
+        class RecordingPopen(subprocess.Popen):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                started.append(self)
+
+        monkeypatch.setattr(subprocess_.subprocess, "Popen", RecordingPopen)
+        with pytest.raises(_InternalError):
+            run_pipeline(
+                [
+                    [sys.executable, "-c", "import time; time.sleep(60)"],
+                    [sys.executable, "-c", "import sys; sys.stdin.read()"],
+                    [StrConsts.DEADBEEF],
+                ],
+                err=StrConsts.BADDCAFE,
+            )
+
+        assert len(started) == 2
+        for process in started:
+            assert process.returncode is not None
+            assert process.stdout.closed
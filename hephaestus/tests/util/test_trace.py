@@ -0,0 +1,135 @@
+import csv
+import json
+import pytest
+
+from hephaestus.decorators.track import TrackError, track
+from hephaestus.io.trace import (
+    SummaryPolicy,
+    TraceExportError,
+    TraceExporter,
+    TraceFileError,
+    read_traces,
+    traces_to_csv,
+    traces_to_json,
+)
+from hephaestus.testing.swte import StrConsts
+
+
+@track(timed=True)
+def _traced(value, *, suffix: str = "") -> str:
+    if value is None:
+        raise ValueError(StrConsts.DEADBEEF)
+    return f"{value}{suffix}"
+
+
+def _export(path, summary=SummaryPolicy.TYPES):
+    with TraceExporter(path, summary=summary, flush_interval_secs=0.01) as exporter:
+        _traced(1, suffix=StrConsts.BADDCAFE)
+        with pytest.raises(ValueError):
+            _traced(None)
+
+    return exporter
+
+
+class TestTrace:
+
+    def test_round_trip(self, tmp_path):
+        """Verifies exported traces are read back with their timing, summaries, and exceptions."""
+        path = tmp_path / "traces.bin"
+        exporter = _export(path)
+
+        traces = list(read_traces(path))
+        assert exporter.written == 2
+        assert [trace.name for trace in traces] == ["_traced", "_traced"]
+        assert (traces[0].args, traces[0].kwargs, traces[0].retval) == (
+            "int",
+            "suffix=str",
+            "str",
+        )
+        assert traces[0].duration_ns is not None and traces[0].exception is None
+        assert traces[1].exception == f"ValueError: {StrConsts.DEADBEEF}"
+
+    def test_summary_policies(self, tmp_path):
+        """Verifies arguments are summarized according to the chosen policy."""
+        _export(tmp_path / "repr.bin", summary=SummaryPolicy.REPR)
+        _export(tmp_path / "none.bin", summary=SummaryPolicy.NONE)
+        _export(tmp_path / "custom.bin", summary=lambda value: "x")
+
+        assert (
+            next(read_traces(tmp_path / "repr.bin")).kwargs
+            == f"suffix='{StrConsts.BADDCAFE}'"
+        )
+        assert next(read_traces(tmp_path / "none.bin")).args == ""
+        assert next(read_traces(tmp_path / "custom.bin")).retval == "x"
+
+    def test_unknown_summary_policy(self, tmp_path):
+        """Verifies unknown summary policies are rejected when the exporter is created."""
+        with pytest.raises(TrackError):
+            TraceExporter(tmp_path / "traces.bin", summary=StrConsts.DEADBEEF)
+
+    def test_conversion(self, tmp_path):
+        """Verifies trace files convert to CSV and JSON Lines."""
+        path = tmp_path / "traces.bin"
+        _export(path)
+
+        assert traces_to_csv(path, tmp_path / "traces.csv") == 2
+        assert traces_to_json(path, tmp_path / "traces.jsonl") == 2
+
+        with open(tmp_path / "traces.csv", newline="") as file:
+            rows = list(csv.DictReader(file))
+        with open(tmp_path / "traces.jsonl") as file:
+            objects = [json.loads(line) for line in file]
+
+        assert [row["name"] for row in rows] == ["_traced", "_traced"]
+        assert objects[1]["exception"] == f"ValueError: {StrConsts.DEADBEEF}"
+
+    def test_invalid_and_truncated_files(self, tmp_path):
+        """Verifies non-trace files are rejected and a partially written trace is skipped."""
+        invalid = tmp_path / "invalid.bin"
+        invalid.write_bytes(StrConsts.DEADBEEF.encode())
+        with pytest.raises(TraceFileError):
+            list(read_traces(invalid))
+
+        path = tmp_path / "traces.bin"
+        _export(path)
+        path.write_bytes(path.read_bytes()[:-3])
+
+        assert len(list(read_traces(path))) == 1
+
+    def test_unencodable_traces_skipped(self, tmp_path):
+        """Verifies traces that can't be encoded are skipped while the rest are still written."""
+
+        def summarize(value) -> str:
+            if value is None:
+                raise ValueError(StrConsts.DEADBEEF)
+            return str(value)
+
+        path = tmp_path / "traces.bin"
+        exporter = _export(path, summary=summarize)
+
+        assert (exporter.written, exporter.skipped) == (1, 1)
+        assert [trace.args for trace in read_traces(path)] == ["1"]
+
+    def test_write_failure_raised(self, tmp_path):
+        """Verifies a failure to write stops the exporter and is raised when it's stopped."""
+
+        class FailingFile:
+            def __init__(self, file):
+                self._file = file
+
+            def write(self, data: bytes):
+                raise OSError(StrConsts.DEADBEEF)
+
+            def close(self):
+                self._file.close()
+
+        exporter = TraceExporter(tmp_path / "traces.bin", flush_interval_secs=0.01)
+        exporter.start()
+        exporter._file = FailingFile(exporter._file)
+        _traced(1)
+        exporter._thread.join(timeout=1)
+
+        assert not exporter._thread.is_alive()
+        with pytest.raises(TraceExportError):
+            exporter.stop()
+        assert exporter.written == 0